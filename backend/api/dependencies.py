@@ -2,41 +2,291 @@
 Shared dependencies and state management for the API.
 """
 
-import sys
-import os
+import asyncio
+import threading
+import uuid
+from collections import Counter
+from functools import lru_cache, wraps
 
-# Get the project root directory
-PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-if PROJECT_ROOT not in sys.path:
-    sys.path.insert(0, PROJECT_ROOT)
+from fastapi import HTTPException, Request, Response
 
+from config import REDIS_URL
 from src.qa_chain import NewsQAChain
+from src.similarity import build_similarity_matrix
+
+
+# Memoized payload builders registered via @cached_by_version
+_VERSIONED_CACHES = []
+
+# Distinguishes this process's in-memory versions from a previous run's
+_BOOT_ID = uuid.uuid4().hex[:8]
+
+
+def _tokens(*texts: str) -> set[str]:
+    """Lowercased whitespace tokens of the given texts."""
+    tokens = set()
+    for text in texts:
+        tokens.update(text.lower().split())
+    return tokens
+
+
+# Fields sent for each article in list responses. The full article
+# (raw description, entities, sentiment reasoning) comes from /articles/{id}.
+ARTICLE_LIST_ITEM_FIELDS = (
+    "id", "title", "summary", "url", "source", "published",
+    "category", "sentiment", "keywords",
+)
+
+
+def to_list_item(article: dict) -> dict:
+    """Lightweight projection of an article for list endpoints."""
+    return {k: article[k] for k in ARTICLE_LIST_ITEM_FIELDS if k in article}
+
+
+def to_public(article: dict) -> dict:
+    """Copy of an article without the internal "_"-prefixed fields."""
+    return {k: v for k, v in article.items() if not k.startswith("_")}
+
+
+def lookup_substring(index: dict[str, set[int]], query: str) -> set[int]:
+    """
+    Return ids whose indexed key contains `query` as a substring.
+
+    Scans the index vocabulary (distinct keys) rather than the articles,
+    so `"tech" in "technology"` style matching still works.
+    """
+    ids = set()
+    for key, postings in index.items():
+        if query in key:
+            ids |= postings
+    return ids
 
 
 class AppState:
     """
     Application state to store articles and Q&A chain.
     This allows sharing state across API endpoints.
+
+    With a SharedStore (REDIS_URL set), the fetched articles live in
+    Redis and each worker rebuilds its local indexes and Q&A context
+    whenever the shared version moves ahead of its own.
+
+    Reloads and local loads/clears hold `_lock`, so two threads never
+    rebuild the indexes at the same time.
     """
 
-    def __init__(self):
+    def __init__(self, store=None):
+        self.store = store
         self.articles: list[dict] = []
         self.qa_chain: NewsQAChain = NewsQAChain()
         self.trends: dict = {}
         self.relationships: dict = {}
+        self._comparisons_cache: tuple[int, list] | None = None
+        self.version: int = 0
+        self.similarity_matrix = build_similarity_matrix([])
+        self._reset_indexes()
+        self._lock = threading.Lock()
+
+    def bump_version(self, version: int | None = None):
+        """Mark the article set as changed and drop memoized payloads."""
+        self.version = self.version + 1 if version is None else version
+        for cache in _VERSIONED_CACHES:
+            cache.cache_clear()
+
+    @property
+    def etag(self) -> str:
+        """ETag for responses derived only from the current article set."""
+        if self.store is None:
+            return f'"{_BOOT_ID}-{self.version}"'
+        return f'"{self.version}"'
+
+    def _reset_indexes(self):
+        """Empty all inverted indexes (lowercased value -> article ids) and groupings."""
+        self.idx_category: dict[str, set[int]] = {}
+        self.idx_sentiment: dict[str, set[int]] = {}
+        self.idx_source: dict[str, set[int]] = {}
+        self.idx_keyword: dict[str, set[int]] = {}
+        self.idx_title: dict[str, set[int]] = {}
+        self.idx_summary: dict[str, set[int]] = {}
+        self.idx_text: dict[str, set[int]] = {}
+
+        # Sentiment counts grouped by category and by source
+        self.sent_by_cat: dict[str, Counter] = {}
+        self.sent_by_src: dict[str, Counter] = {}
+
+    def _index_articles(self, articles: list[dict]):
+        """
+        Store articles locally and build the inverted indexes.
+
+        Articles get their positional "id" here, and every filterable
+        field is lowercased once so read endpoints can resolve filters
+        with set operations instead of scanning all articles.
+        """
+        for i, article in enumerate(articles):
+            article["id"] = i
+
+        self.articles = articles
+        self.similarity_matrix = build_similarity_matrix(articles)
+        self._reset_indexes()
+
+        for i, article in enumerate(articles):
+            # Lowercase every filterable field once, at ingest
+            article["_title_lc"] = article.get("title", "").lower()
+            article["_summary_lc"] = article.get("summary", "").lower()
+            article["_source_lc"] = article.get("source", "").lower()
+            article["_category_lc"] = article.get("category", "").lower()
+            article["_sentiment_lc"] = article.get("sentiment", "").lower()
+            article["_keywords_lc"] = [kw.lower() for kw in article.get("keywords", [])]
+            article["_searchblob_lc"] = "\x00".join((
+                article["_title_lc"],
+                article["_summary_lc"],
+                " ".join(article["_keywords_lc"]),
+            ))
+
+            title_tokens = set(article["_title_lc"].split())
+            summary_tokens = set(article["_summary_lc"].split())
+            keyword_tokens = _tokens(*article["_keywords_lc"])
+
+            fields = (
+                (self.idx_category, [article["_category_lc"]]),
+                (self.idx_sentiment, [article["_sentiment_lc"]]),
+                (self.idx_source, [article["_source_lc"]]),
+                (self.idx_keyword, article["_keywords_lc"]),
+                (self.idx_title, title_tokens),
+                (self.idx_summary, summary_tokens),
+                (self.idx_text, title_tokens | summary_tokens | keyword_tokens),
+            )
+            for index, values in fields:
+                for value in values:
+                    index.setdefault(value, set()).add(i)
+
+            sentiment = article.get("sentiment", "neutral")
+            self.sent_by_cat.setdefault(article.get("category", "Other"), Counter())[sentiment] += 1
+            self.sent_by_src.setdefault(article.get("source", "Unknown"), Counter())[sentiment] += 1
+
+    def _publish(self, articles: list[dict]):
+        """Bump the version, sharing the articles with other workers if configured."""
+        if self.store is None:
+            self.bump_version()
+        else:
+            self.bump_version(self.store.publish([to_public(a) for a in articles]))
+
+    def chat_history(self):
+        """Conversation memory for the current version (None: keep it in-process)."""
+        if self.store is None:
+            return None
+        return self.store.chat_history(self.version)
+
+    def load_articles(self, articles: list[dict]):
+        """Store freshly fetched articles, index them and bump the version."""
+        with self._lock:
+            self._index_articles(articles)
+            self._publish(articles)
+
+    def sync(self):
+        """
+        Pick up articles fetched (or cleared) by another worker.
+
+        Only does anything with a shared store; costs one Redis GET
+        when nothing changed. Blocking - call it from a worker thread
+        (SharedStateSyncMiddleware does, once per request).
+        """
+        if self.store is None or self.store.version() == self.version:
+            return
+
+        with self._lock:
+            # Another thread may have reloaded while we waited for the lock
+            if self.store.version() == self.version:
+                return
+
+            version, articles = self.store.load()
+            self.trends = {}
+            self.relationships = {}
+            self._comparisons_cache = None
+            self._index_articles(articles)
+            self.bump_version(version)
+            self.qa_chain.load_articles(articles, self.chat_history())
 
     def clear(self):
         """Clear all stored data."""
-        self.articles = []
-        self.qa_chain = NewsQAChain()
-        self.trends = {}
-        self.relationships = {}
+        with self._lock:
+            self.trends = {}
+            self.relationships = {}
+            self._comparisons_cache = None
+            self._index_articles([])
+            self._publish([])
+            self.qa_chain = NewsQAChain(history=self.chat_history())
 
 
-# Global app state instance
-app_state = AppState()
+# Global app state instance (one per worker process)
+if REDIS_URL:
+    from backend.api.store import SharedStore
+    app_state = AppState(store=SharedStore(REDIS_URL))
+else:
+    app_state = AppState()
 
 
 def get_app_state() -> AppState:
-    """Get the global app state."""
+    """
+    Get the global app state.
+
+    With a shared store, SharedStateSyncMiddleware has already synced it
+    (in a worker thread) at the start of the request, so this never
+    touches Redis and is safe to call from async routes.
+    """
     return app_state
+
+
+class SharedStateSyncMiddleware:
+    """
+    Sync the app state with the shared store once per request.
+
+    AppState.sync() is a blocking Redis GET (plus a full reload when
+    another worker fetched), so it runs in a worker thread instead of
+    on the event loop.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and app_state.store is not None:
+            await asyncio.to_thread(app_state.sync)
+        await self.app(scope, receive, send)
+
+
+def cached_by_version(func):
+    """
+    Memoize a read-only payload builder per article-set version.
+
+    The wrapped function is computed once per (version, arguments) and
+    reused until the next fetch or clear bumps `AppState.version`.
+    Callers must treat the returned payload as read-only.
+    """
+    @lru_cache(maxsize=32)
+    def _compute(version, *args):
+        return func(*args)
+
+    _VERSIONED_CACHES.append(_compute)
+
+    @wraps(func)
+    def wrapper(*args):
+        return _compute(app_state.version, *args)
+
+    return wrapper
+
+
+def etag_or_304(request: Request, response: Response):
+    """
+    Conditional GET support for read-only endpoints.
+
+    Use as `dependencies=[Depends(etag_or_304)]`. Answers 304 Not
+    Modified when the client already has the current version, otherwise
+    tags the response with the version's ETag.
+    """
+    etag = get_app_state().etag
+
+    if request.headers.get("if-none-match") == etag:
+        raise HTTPException(status_code=304, headers={"ETag": etag})
+
+    response.headers["ETag"] = etag
@@ -4,44 +4,81 @@ Articles API Routes
 Endpoints for fetching, processing, and managing news articles.
 """
 
-import sys
-import os
+import asyncio
+import heapq
 
-# Get the project root directory
-PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-if PROJECT_ROOT not in sys.path:
-    sys.path.insert(0, PROJECT_ROOT)
+import orjson
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
 from typing import Optional
+from collections import Counter
 
-from src.news_fetcher import fetch_news
-from src.summarizer import summarize_articles
+from src.summarizer import summarize_many
 from src.categorizer import categorize_articles
 from src.tagger import tag_articles
 from src.sentiment import analyze_sentiments
 
-from api.dependencies import get_app_state
+from backend.services.feed_fetcher import clear_feed_cache, fetch_news
+from backend.services.semantic_cache import SemanticCache
 
-router = APIRouter()
+from backend.api.dependencies import (
+    cached_by_version,
+    etag_or_304,
+    get_app_state,
+    lookup_substring,
+    to_list_item,
+    to_public
+)
+
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
 class FetchRequest(BaseModel):
     """Request model for fetching articles."""
+    model_config = {"frozen": True}
+
     source: str = "rss"  # "rss", "newsapi", or "both"
     max_per_source: int = 5
     process: bool = True  # Whether to summarize/categorize/tag
 
 
-class ArticleResponse(BaseModel):
-    """Response model for article data."""
-    articles: list[dict]
-    total: int
+# Summaries of articles seen in earlier fetches. The strict threshold
+# means only (near-)identical articles share a summary.
+_summary_cache = SemanticCache(threshold=0.97, ttl=24 * 3600)
+
+
+def _summary_key(article: dict) -> str:
+    return f"{article.get('title', '')}\n{article.get('description', '')}"
+
+
+async def _summarize_all(articles: list[dict]) -> list[dict]:
+    """Summarize articles concurrently, skipping ones summarized before."""
+    cached = await asyncio.to_thread(
+        lambda: [_summary_cache.get(_summary_key(a)) for a in articles]
+    )
+
+    missing = []
+    for article, summary in zip(articles, cached):
+        if summary is None:
+            missing.append(article)
+        else:
+            article["summary"] = summary
+
+    await summarize_many(missing)
+
+    def remember():
+        for article in missing:
+            if not article["summary"].startswith("Error:"):
+                _summary_cache.put(_summary_key(article), article["summary"])
+
+    await asyncio.to_thread(remember)
+    return articles
 
 
 @router.post("/fetch")
-async def fetch_articles(request: FetchRequest):
+async def fetch_articles(request: FetchRequest, http_request: Request):
     """
     Fetch and optionally process news articles.
 
@@ -51,9 +88,10 @@ async def fetch_articles(request: FetchRequest):
     """
     try:
         # Fetch raw articles
-        articles = fetch_news(
+        articles = await fetch_news(
             source=request.source,
-            max_per_source=request.max_per_source
+            max_per_source=request.max_per_source,
+            client=http_request.app.state.http
         )
 
         if not articles:
@@ -61,24 +99,25 @@ async def fetch_articles(request: FetchRequest):
 
         # Process articles if requested
         if request.process:
-            articles = summarize_articles(articles)
-            articles = categorize_articles(articles)
-            articles = tag_articles(articles)
-            articles = analyze_sentiments(articles)
+            articles = await _summarize_all(articles)
 
-        # Add unique IDs to articles
-        for i, article in enumerate(articles):
-            article["id"] = i
+            # Categorizing, tagging and sentiment only depend on the summary
+            # and each writes its own keys, so they can run side by side.
+            await asyncio.gather(
+                asyncio.to_thread(categorize_articles, articles),
+                asyncio.to_thread(tag_articles, articles),
+                asyncio.to_thread(analyze_sentiments, articles),
+            )
 
-        # Store in app state
+        # Store in app state (assigns IDs and builds the search indexes)
         state = get_app_state()
-        state.articles = articles
+        await asyncio.to_thread(state.load_articles, articles)
 
         # Load into Q&A chain
-        state.qa_chain.load_articles(articles)
+        await asyncio.to_thread(state.qa_chain.load_articles, articles, state.chat_history())
 
         return {
-            "articles": articles,
+            "articles": [to_public(a) for a in articles],
             "total": len(articles),
             "message": f"Successfully fetched and processed {len(articles)} articles"
         }
@@ -87,6 +126,53 @@ async def fetch_articles(request: FetchRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _filter_article_ids(
+    state,
+    category: Optional[str],
+    sentiment: Optional[str],
+    source: Optional[str],
+    keyword: Optional[str]
+):
+    """
+    Ids of the articles matching every given filter, in fetch order.
+
+    Each filter is resolved to a set of article ids using the indexes
+    built at fetch time, then the sets are intersected. Article dicts
+    are only touched for unindexed multi-word keyword filters.
+    """
+    id_sets = []
+
+    if category:
+        id_sets.append(state.idx_category.get(category.lower(), set()))
+
+    if sentiment:
+        id_sets.append(state.idx_sentiment.get(sentiment.lower(), set()))
+
+    if source:
+        id_sets.append(lookup_substring(state.idx_source, source.lower()))
+
+    keyword_lower = keyword.lower() if keyword else None
+    if keyword_lower and keyword_lower.split() == [keyword_lower]:
+        # A single token is a substring of the text exactly when it is
+        # a substring of one of its whitespace tokens.
+        id_sets.append(lookup_substring(state.idx_text, keyword_lower))
+        keyword_lower = None
+
+    if id_sets:
+        matching_ids = sorted(set.intersection(*id_sets))
+    else:
+        matching_ids = range(len(state.articles))
+
+    if keyword_lower:
+        # Multi-word phrases aren't indexed; check the remaining candidates
+        matching_ids = [
+            i for i in matching_ids
+            if keyword_lower in state.articles[i]["_searchblob_lc"]
+        ]
+
+    return matching_ids
+
+
 @router.get("/articles")
 async def get_articles(
     category: Optional[str] = Query(None, description="Filter by category"),
@@ -100,48 +186,46 @@ async def get_articles(
     Get all stored articles with optional filters.
     """
     state = get_app_state()
-    articles = state.articles.copy()
-
-    # Apply filters
-    if category:
-        articles = [a for a in articles if a.get("category", "").lower() == category.lower()]
+    matching_ids = _filter_article_ids(state, category, sentiment, source, keyword)
 
-    if sentiment:
-        articles = [a for a in articles if a.get("sentiment", "").lower() == sentiment.lower()]
-
-    if source:
-        articles = [a for a in articles if source.lower() in a.get("source", "").lower()]
-
-    if keyword:
-        keyword_lower = keyword.lower()
-        articles = [
-            a for a in articles
-            if keyword_lower in a.get("title", "").lower()
-            or keyword_lower in a.get("summary", "").lower()
-            or keyword_lower in str(a.get("keywords", [])).lower()
-        ]
-
-    # Apply pagination
-    total = len(articles)
-    articles = articles[offset:offset + limit]
+    # Apply pagination (only the returned page becomes article dicts)
+    total = len(matching_ids)
+    articles = [state.articles[i] for i in matching_ids[offset:offset + limit]]
 
     return {
-        "articles": articles,
+        "articles": [to_list_item(a) for a in articles],
         "total": total,
         "limit": limit,
         "offset": offset
     }
 
 
-@router.get("/articles/{article_id}")
-async def get_article(article_id: int):
-    """Get a single article by ID."""
+@router.get("/articles.ndjson")
+async def stream_articles(
+    category: Optional[str] = Query(None, description="Filter by category"),
+    sentiment: Optional[str] = Query(None, description="Filter by sentiment"),
+    source: Optional[str] = Query(None, description="Filter by source"),
+    keyword: Optional[str] = Query(None, description="Filter by keyword"),
+    limit: Optional[int] = Query(None, description="Maximum articles to return (default: all)"),
+    offset: int = Query(0, description="Offset for pagination")
+):
+    """
+    Stream matching articles as newline-delimited JSON (one article per line).
+
+    Same filters as /articles, but rows are serialized one at a time,
+    so large result sets start arriving immediately and never have to
+    be held in memory as one big response.
+    """
     state = get_app_state()
+    articles = state.articles
+    matching_ids = _filter_article_ids(state, category, sentiment, source, keyword)
+    end = None if limit is None else offset + limit
 
-    if article_id < 0 or article_id >= len(state.articles):
-        raise HTTPException(status_code=404, detail="Article not found")
+    def rows():
+        for i in matching_ids[offset:end]:
+            yield orjson.dumps(to_list_item(articles[i])) + b"\n"
 
-    return state.articles[article_id]
+    return StreamingResponse(rows(), media_type="application/x-ndjson")
 
 
 @router.get("/articles/search")
@@ -155,40 +239,50 @@ async def search_articles(
     state = get_app_state()
     query_lower = q.lower()
 
-    results = []
-    for article in state.articles:
-        score = 0
-
-        # Check title
-        if query_lower in article.get("title", "").lower():
-            score += 3
-
-        # Check summary
-        if query_lower in article.get("summary", "").lower():
-            score += 2
-
-        # Check keywords
-        for kw in article.get("keywords", []):
-            if query_lower in kw.lower():
-                score += 1
-                break
+    # Per-field score weights: title +3, summary +2, keywords +1
+    if query_lower.split() == [query_lower]:
+        field_hits = (
+            (lookup_substring(state.idx_title, query_lower), 3),
+            (lookup_substring(state.idx_summary, query_lower), 2),
+            (lookup_substring(state.idx_keyword, query_lower), 1),
+        )
+    else:
+        # Multi-word phrases aren't indexed; fall back to scanning
+        field_hits = (
+            ({a["id"] for a in state.articles if query_lower in a["_title_lc"]}, 3),
+            ({a["id"] for a in state.articles if query_lower in a["_summary_lc"]}, 2),
+            (lookup_substring(state.idx_keyword, query_lower), 1),
+        )
 
-        if score > 0:
-            results.append({"article": article, "score": score})
+    scores = {}
+    for ids, weight in field_hits:
+        for article_id in ids:
+            scores[article_id] = scores.get(article_id, 0) + weight
 
-    # Sort by score
-    results.sort(key=lambda x: x["score"], reverse=True)
+    # Top results by score (ties keep fetch order)
+    top = heapq.nlargest(limit, scores, key=lambda i: (scores[i], -i))
 
     return {
-        "results": [r["article"] for r in results[:limit]],
-        "total": len(results),
+        "results": [to_list_item(state.articles[i]) for i in top],
+        "total": len(scores),
         "query": q
     }
 
 
-@router.get("/stats")
-async def get_stats():
-    """Get statistics about the stored articles."""
+@router.get("/articles/{article_id}")
+async def get_article(article_id: int):
+    """Get a single article by ID."""
+    state = get_app_state()
+
+    if article_id < 0 or article_id >= len(state.articles):
+        raise HTTPException(status_code=404, detail="Article not found")
+
+    return to_public(state.articles[article_id])
+
+
+@cached_by_version
+def _stats_payload():
+    """Build the /stats payload (memoized per article-set version)."""
     state = get_app_state()
     articles = state.articles
 
@@ -200,24 +294,11 @@ async def get_stats():
             "by_source": {}
         }
 
-    # Count by category
-    by_category = {}
-    for article in articles:
-        cat = article.get("category", "Other")
-        by_category[cat] = by_category.get(cat, 0) + 1
-
-    # Count by sentiment
-    by_sentiment = {"positive": 0, "negative": 0, "neutral": 0}
-    for article in articles:
-        sent = article.get("sentiment", "neutral")
-        if sent in by_sentiment:
-            by_sentiment[sent] += 1
-
-    # Count by source
-    by_source = {}
-    for article in articles:
-        src = article.get("source", "Unknown")
-        by_source[src] = by_source.get(src, 0) + 1
+    # Count by category, sentiment and source
+    by_category = Counter(a.get("category", "Other") for a in articles)
+    sentiment_counts = Counter(a.get("sentiment", "neutral") for a in articles)
+    by_sentiment = {s: sentiment_counts[s] for s in ("positive", "negative", "neutral")}
+    by_source = Counter(a.get("source", "Unknown") for a in articles)
 
     return {
         "total": len(articles),
@@ -227,9 +308,22 @@ async def get_stats():
     }
 
 
+@router.get("/stats", dependencies=[Depends(etag_or_304)])
+async def get_stats():
+    """Get statistics about the stored articles."""
+    return _stats_payload()
+
+
+@router.post("/refresh")
+async def refresh_feeds():
+    """Drop cached RSS feeds so the next /fetch downloads them again."""
+    clear_feed_cache()
+    return {"message": "Feed cache cleared"}
+
+
 @router.delete("/articles")
 async def clear_articles():
     """Clear all stored articles."""
     state = get_app_state()
-    state.clear()
+    await asyncio.to_thread(state.clear)
     return {"message": "All articles cleared"}
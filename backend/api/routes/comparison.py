@@ -4,17 +4,10 @@ Comparison API Routes
 Endpoints for comparing how different sources cover the same story.
 """
 
-import sys
-import os
-
-# Get the project root directory
-PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-if PROJECT_ROOT not in sys.path:
-    sys.path.insert(0, PROJECT_ROOT)
-
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
 from typing import List
+from collections import Counter, defaultdict
 
 from src.comparator import (
     find_same_story_articles,
@@ -23,13 +16,32 @@ from src.comparator import (
     summarize_bias_findings
 )
 
-from api.dependencies import get_app_state
+from backend.api.dependencies import cached_by_version, etag_or_304, get_app_state
 
 router = APIRouter()
 
 
+def _get_comparisons(state) -> list[dict]:
+    """
+    Run compare_all_stories once per article-set version.
+
+    /comparison and /comparison/bias both need the same (LLM-heavy)
+    comparisons, so the result is kept on the app state until the
+    articles change.
+    """
+    cached = state._comparisons_cache
+    if cached is not None and cached[0] == state.version:
+        return cached[1]
+
+    comparisons = compare_all_stories(state.articles)
+    state._comparisons_cache = (state.version, comparisons)
+    return comparisons
+
+
 class CompareRequest(BaseModel):
     """Request model for comparing specific articles."""
+    model_config = {"frozen": True}
+
     article_ids: List[int]
 
 
@@ -55,7 +67,7 @@ async def get_same_story_groups():
             "sources": story["sources"],
             "source_count": story["source_count"],
             "article_ids": [
-                state.articles.index(art) if art in state.articles else -1
+                art.get("id", -1)
                 for art in story["articles"]
             ]
         })
@@ -63,8 +75,10 @@ async def get_same_story_groups():
     return {"stories": result, "total": len(result)}
 
 
+# Plain def: compare_all_stories() calls the LLM synchronously, so FastAPI runs this
+# handler in its threadpool instead of blocking the event loop.
 @router.get("/comparison")
-async def compare_all():
+def compare_all():
     """
     Compare all stories that have multiple source coverage.
 
@@ -79,7 +93,7 @@ async def compare_all():
     if len(state.articles) < 2:
         return {"comparisons": [], "total": 0}
 
-    comparisons = compare_all_stories(state.articles)
+    comparisons = _get_comparisons(state)
 
     return {
         "comparisons": comparisons,
@@ -87,8 +101,10 @@ async def compare_all():
     }
 
 
+# Plain def: compare_sources() calls the LLM synchronously, so FastAPI runs this
+# handler in its threadpool instead of blocking the event loop.
 @router.post("/comparison/specific")
-async def compare_specific_articles(request: CompareRequest):
+def compare_specific_articles(request: CompareRequest):
     """
     Compare specific articles by their IDs.
 
@@ -114,8 +130,10 @@ async def compare_specific_articles(request: CompareRequest):
     return comparison
 
 
+# Plain def: compare_all_stories() calls the LLM synchronously, so FastAPI runs this
+# handler in its threadpool instead of blocking the event loop.
 @router.get("/comparison/bias")
-async def get_bias_analysis():
+def get_bias_analysis():
     """
     Get bias analysis summary across all comparisons.
 
@@ -131,8 +149,8 @@ async def get_bias_analysis():
             "tone_distribution": {}
         }
 
-    # First get all comparisons
-    comparisons = compare_all_stories(state.articles)
+    # First get all comparisons (shared with /comparison)
+    comparisons = _get_comparisons(state)
 
     if not comparisons:
         return {
@@ -148,31 +166,36 @@ async def get_bias_analysis():
     return bias_summary
 
 
-@router.get("/sources")
-async def get_sources():
-    """
-    Get list of all news sources in the current articles.
-    """
+@cached_by_version
+def _sources_payload():
+    """Build the /sources payload (memoized per article-set version)."""
     state = get_app_state()
 
-    sources = {}
+    counts = Counter()
+    categories = defaultdict(set)
     for article in state.articles:
         source = article.get("source", "Unknown")
-        if source not in sources:
-            sources[source] = {"count": 0, "categories": set()}
-        sources[source]["count"] += 1
-        sources[source]["categories"].add(article.get("category", "Other"))
+        counts[source] += 1
+        categories[source].add(article.get("category", "Other"))
 
     result = [
         {
             "name": name,
-            "article_count": data["count"],
-            "categories": list(data["categories"])
+            "article_count": count,
+            "categories": list(categories[name])
         }
-        for name, data in sources.items()
+        for name, count in counts.items()
     ]
 
     # Sort by article count
     result.sort(key=lambda x: x["article_count"], reverse=True)
 
     return {"sources": result, "total": len(result)}
+
+
+@router.get("/sources", dependencies=[Depends(etag_or_304)])
+async def get_sources():
+    """
+    Get list of all news sources in the current articles.
+    """
+    return _sources_payload()
@@ -4,32 +4,59 @@ Q&A API Routes
 Endpoints for asking questions about articles with conversation memory.
 """
 
-import sys
-import os
-
-# Get the project root directory
-PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-if PROJECT_ROOT not in sys.path:
-    sys.path.insert(0, PROJECT_ROOT)
+import asyncio
 
+import orjson
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
-from api.dependencies import get_app_state
+from backend.services.semantic_cache import SemanticCache
+
+from backend.api.dependencies import get_app_state
 
 router = APIRouter()
 
+# Answers to semantically equivalent questions, reused only for the same
+# article set and the same conversation so far
+_answer_cache = SemanticCache(threshold=0.92, ttl=3600)
+
 
 class QuestionRequest(BaseModel):
     """Request model for asking a question."""
+    model_config = {"frozen": True}
+
     question: str
 
 
-class QuestionResponse(BaseModel):
-    """Response model for Q&A."""
-    question: str
-    answer: str
-    article_count: int
+def _cache_namespace(state) -> tuple:
+    """Cached answers are only valid for the same articles and conversation."""
+    return (state.version, tuple(m.content for m in state.qa_chain.get_history()))
+
+
+def _sse(data: dict, event: str = None) -> bytes:
+    """Encode one server-sent event."""
+    prefix = f"event: {event}\n".encode() if event else b""
+    return prefix + b"data: " + orjson.dumps(data) + b"\n\n"
+
+
+def _lookup_cached(state, question: str) -> tuple[tuple, str | None]:
+    """Cache namespace and cached answer (or None). Blocking: reads the chat history."""
+    namespace = _cache_namespace(state)
+    return namespace, _answer_cache.get(question, namespace)
+
+
+def _ask_cached(state, question: str) -> tuple[str, bool]:
+    """Answer from the semantic cache if possible, else ask Claude. Returns (answer, cached)."""
+    qa_chain = state.qa_chain
+    namespace, answer = _lookup_cached(state, question)
+    if answer is not None:
+        qa_chain.remember(question, answer)
+        return answer, True
+
+    answer = qa_chain.ask(question)
+    _answer_cache.put(question, answer, namespace)
+    return answer, False
 
 
 @router.post("/qa/ask")
@@ -54,11 +81,13 @@ async def ask_question(request: QuestionRequest):
         )
 
     try:
-        answer = state.qa_chain.ask(request.question)
+        # Embedding and the LLM call both block; keep them off the event loop
+        answer, cached = await asyncio.to_thread(_ask_cached, state, request.question)
 
         return {
             "question": request.question,
             "answer": answer,
+            "cached": cached,
             "article_count": len(state.articles)
         }
 
@@ -66,8 +95,53 @@ async def ask_question(request: QuestionRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/qa/ask/stream")
+async def ask_question_stream(request: QuestionRequest):
+    """
+    Ask a question and stream the answer as server-sent events.
+
+    Each `data:` event carries {"text": ...} with the next piece of the
+    answer; a final `done` event (or `error` with {"detail": ...})
+    ends the stream.
+    """
+    state = get_app_state()
+
+    if not state.articles:
+        raise HTTPException(
+            status_code=400,
+            detail="No articles loaded. Please fetch articles first."
+        )
+
+    qa_chain = state.qa_chain
+    question = request.question
+
+    async def events():
+        try:
+            # The namespace reads the chat history (Redis LRANGE when shared),
+            # so it is worked out in the same worker thread as the lookup
+            namespace, answer = await asyncio.to_thread(_lookup_cached, state, question)
+
+            if answer is not None:
+                # remember() may be a blocking Redis write - keep it off the event loop
+                await asyncio.to_thread(qa_chain.remember, question, answer)
+                yield _sse({"text": answer})
+            else:
+                parts = []
+                async for text in qa_chain.ask_stream(question):
+                    parts.append(text)
+                    yield _sse({"text": text})
+                await asyncio.to_thread(_answer_cache.put, question, "".join(parts), namespace)
+
+            yield _sse({"cached": answer is not None}, event="done")
+
+        except Exception as e:
+            yield _sse({"detail": str(e)}, event="error")
+
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
 @router.get("/qa/history")
-async def get_conversation_history():
+def get_conversation_history():
     """
     Get the current conversation history.
     """
@@ -89,7 +163,7 @@ async def get_conversation_history():
 
 
 @router.delete("/qa/history")
-async def clear_conversation_history():
+def clear_conversation_history():
     """
     Clear the conversation history.
 
@@ -102,14 +176,15 @@ async def clear_conversation_history():
 
 
 @router.get("/qa/status")
-async def get_qa_status():
+def get_qa_status():
     """
     Get the current status of the Q&A system.
     """
     state = get_app_state()
+    article_count = len(state.articles)
 
     return {
-        "articles_loaded": len(state.articles),
-        "history_length": len(state.qa_chain.get_history()),
-        "ready": len(state.articles) > 0
+        "articles_loaded": article_count,
+        "history_length": state.qa_chain.history_len(),
+        "ready": article_count > 0
     }
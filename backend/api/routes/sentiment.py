@@ -4,31 +4,20 @@ Sentiment API Routes
 Endpoints for sentiment analysis of articles.
 """
 
-import sys
-import os
-
-# Get the project root directory
-PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-if PROJECT_ROOT not in sys.path:
-    sys.path.insert(0, PROJECT_ROOT)
-
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import ORJSONResponse
 from typing import Optional
 
 from src.sentiment import get_sentiment_summary, filter_by_sentiment
 
-from api.dependencies import get_app_state
+from backend.api.dependencies import cached_by_version, etag_or_304, get_app_state, to_list_item
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
-@router.get("/sentiment")
-async def get_sentiment_overview():
-    """
-    Get sentiment analysis summary for all articles.
-
-    Returns counts and percentages for positive, negative, and neutral articles.
-    """
+@cached_by_version
+def _sentiment_overview_payload():
+    """Build the /sentiment payload (memoized per article-set version)."""
     state = get_app_state()
     articles = state.articles
 
@@ -45,6 +34,16 @@ async def get_sentiment_overview():
     return summary
 
 
+@router.get("/sentiment", dependencies=[Depends(etag_or_304)])
+async def get_sentiment_overview():
+    """
+    Get sentiment analysis summary for all articles.
+
+    Returns counts and percentages for positive, negative, and neutral articles.
+    """
+    return _sentiment_overview_payload()
+
+
 @router.get("/sentiment/{sentiment_type}")
 async def get_articles_by_sentiment(
     sentiment_type: str,
@@ -67,58 +66,32 @@ async def get_articles_by_sentiment(
 
     return {
         "sentiment": sentiment_type,
-        "articles": filtered[:limit],
+        "articles": [to_list_item(a) for a in filtered[:limit]],
         "total": len(filtered)
     }
 
 
-@router.get("/sentiment/distribution/by-category")
+def _distribution(groups: dict) -> dict:
+    """Turn {group: Counter(sentiment)} into the fixed three-key rows."""
+    return {
+        group: {s: counts[s] for s in ("positive", "negative", "neutral")}
+        for group, counts in groups.items()
+    }
+
+
+@router.get("/sentiment/distribution/by-category", dependencies=[Depends(etag_or_304)])
 async def get_sentiment_by_category():
     """
     Get sentiment distribution broken down by category.
     """
     state = get_app_state()
-    articles = state.articles
-
-    if not articles:
-        return {"distribution": {}}
-
-    distribution = {}
-
-    for article in articles:
-        category = article.get("category", "Other")
-        sentiment = article.get("sentiment", "neutral")
-
-        if category not in distribution:
-            distribution[category] = {"positive": 0, "negative": 0, "neutral": 0}
-
-        if sentiment in distribution[category]:
-            distribution[category][sentiment] += 1
+    return {"distribution": _distribution(state.sent_by_cat)}
 
-    return {"distribution": distribution}
 
-
-@router.get("/sentiment/distribution/by-source")
+@router.get("/sentiment/distribution/by-source", dependencies=[Depends(etag_or_304)])
 async def get_sentiment_by_source():
     """
     Get sentiment distribution broken down by source.
     """
     state = get_app_state()
-    articles = state.articles
-
-    if not articles:
-        return {"distribution": {}}
-
-    distribution = {}
-
-    for article in articles:
-        source = article.get("source", "Unknown")
-        sentiment = article.get("sentiment", "neutral")
-
-        if source not in distribution:
-            distribution[source] = {"positive": 0, "negative": 0, "neutral": 0}
-
-        if sentiment in distribution[source]:
-            distribution[source][sentiment] += 1
-
-    return {"distribution": distribution}
+    return {"distribution": _distribution(state.sent_by_src)}
@@ -4,23 +4,18 @@ Similarity API Routes
 Endpoints for finding similar and related articles.
 """
 
-import sys
-import os
-
-# Get the project root directory
-PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-if PROJECT_ROOT not in sys.path:
-    sys.path.insert(0, PROJECT_ROOT)
+import heapq
 
 from fastapi import APIRouter, HTTPException, Query
 
 from src.similarity import (
     find_similar_articles,
+    iter_related_pairs,
     analyze_article_relationships,
     calculate_combined_similarity
 )
 
-from api.dependencies import get_app_state
+from backend.api.dependencies import get_app_state
 
 router = APIRouter()
 
@@ -50,7 +45,9 @@ async def get_similar_articles(
         target,
         state.articles,
         threshold=threshold,
-        max_results=max_results
+        max_results=max_results,
+        matrix=state.similarity_matrix,
+        target_index=article_id
     )
 
     return {
@@ -61,7 +58,7 @@ async def get_similar_articles(
         },
         "similar_articles": [
             {
-                "id": state.articles.index(art) if art in state.articles else -1,
+                "id": art.get("id", -1),
                 "title": art.get("title"),
                 "category": art.get("category"),
                 "source": art.get("source"),
@@ -73,8 +70,10 @@ async def get_similar_articles(
     }
 
 
+# Plain def: analyze_article_relationships() calls the LLM synchronously, so FastAPI runs this
+# handler in its threadpool instead of blocking the event loop.
 @router.get("/relationships")
-async def get_all_relationships(
+def get_all_relationships(
     use_llm: bool = Query(True, description="Use AI for relationship analysis")
 ):
     """
@@ -117,32 +116,34 @@ async def get_related_pairs(
     if len(articles) < 2:
         return {"pairs": [], "total": 0}
 
-    pairs = []
-
-    # Compare all pairs
-    for i in range(len(articles)):
-        for j in range(i + 1, len(articles)):
-            similarity = calculate_combined_similarity(articles[i], articles[j])
-
-            if similarity["overall"] >= threshold:
-                pairs.append({
-                    "article_a": {
-                        "id": i,
-                        "title": articles[i].get("title")
-                    },
-                    "article_b": {
-                        "id": j,
-                        "title": articles[j].get("title")
-                    },
-                    "similarity": similarity
-                })
-
-    # Sort by similarity
-    pairs.sort(key=lambda x: x["similarity"]["overall"], reverse=True)
+    # Scores for every pair come from the matrix built at fetch time
+    related = list(iter_related_pairs(
+        articles,
+        threshold=threshold,
+        matrix=state.similarity_matrix
+    ))
+
+    # Only the top `limit` pairs are returned, so skip the full sort
+    top = heapq.nlargest(limit, related, key=lambda x: x["similarity"]["overall"])
+
+    pairs = [
+        {
+            "article_a": {
+                "id": pair["article_a_index"],
+                "title": articles[pair["article_a_index"]].get("title")
+            },
+            "article_b": {
+                "id": pair["article_b_index"],
+                "title": articles[pair["article_b_index"]].get("title")
+            },
+            "similarity": pair["similarity"]
+        }
+        for pair in top
+    ]
 
     return {
-        "pairs": pairs[:limit],
-        "total": len(pairs)
+        "pairs": pairs,
+        "total": len(related)
     }
 
 
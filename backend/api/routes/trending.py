@@ -4,25 +4,19 @@ Trending API Routes
 Endpoints for trending topics and keyword analysis.
 """
 
-import sys
-import os
-
-# Get the project root directory
-PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-if PROJECT_ROOT not in sys.path:
-    sys.path.insert(0, PROJECT_ROOT)
-
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Depends, Query
 
 from src.trending import detect_trends, get_trending_keywords, get_trending_entities
 
-from api.dependencies import get_app_state
+from backend.api.dependencies import cached_by_version, etag_or_304, get_app_state, to_public
 
 router = APIRouter()
 
 
-@router.get("/trending")
-async def get_trending_topics(
+# Plain def: detect_trends() calls the LLM synchronously, so FastAPI runs this
+# handler in its threadpool instead of blocking the event loop.
+@router.get("/trending", dependencies=[Depends(etag_or_304)])
+def get_trending_topics(
     use_llm: bool = Query(True, description="Use AI for smart trend detection"),
     top_n: int = Query(10, description="Number of top keywords to return")
 ):
@@ -57,16 +51,9 @@ async def get_trending_topics(
     }
 
 
-@router.get("/trending/fast")
-async def get_trending_fast(
-    top_n: int = Query(10, description="Number of top keywords to return")
-):
-    """
-    Get trending keywords quickly (no AI analysis).
-
-    This is faster and doesn't use API calls, but only provides
-    keyword frequency analysis without intelligent theme detection.
-    """
+@cached_by_version
+def _trending_fast_payload(top_n: int):
+    """Build the /trending/fast payload (memoized per article-set version)."""
     state = get_app_state()
     articles = state.articles
 
@@ -87,13 +74,22 @@ async def get_trending_fast(
     }
 
 
-@router.get("/trending/keywords")
-async def get_keywords(
-    top_n: int = Query(20, description="Number of keywords to return")
+@router.get("/trending/fast", dependencies=[Depends(etag_or_304)])
+async def get_trending_fast(
+    top_n: int = Query(10, description="Number of top keywords to return")
 ):
     """
-    Get trending keywords with article counts.
+    Get trending keywords quickly (no AI analysis).
+
+    This is faster and doesn't use API calls, but only provides
+    keyword frequency analysis without intelligent theme detection.
     """
+    return _trending_fast_payload(top_n)
+
+
+@cached_by_version
+def _keywords_payload(top_n: int):
+    """Build the /trending/keywords payload (memoized per article-set version)."""
     state = get_app_state()
     articles = state.articles
 
@@ -108,13 +104,19 @@ async def get_keywords(
     }
 
 
-@router.get("/trending/entities")
-async def get_entities(
-    top_n: int = Query(10, description="Number of entities per type")
+@router.get("/trending/keywords", dependencies=[Depends(etag_or_304)])
+async def get_keywords(
+    top_n: int = Query(20, description="Number of keywords to return")
 ):
     """
-    Get trending people, organizations, and locations.
+    Get trending keywords with article counts.
     """
+    return _keywords_payload(top_n)
+
+
+@cached_by_version
+def _entities_payload(top_n: int):
+    """Build the /trending/entities payload (memoized per article-set version)."""
     state = get_app_state()
     articles = state.articles
 
@@ -134,6 +136,16 @@ async def get_entities(
     }
 
 
+@router.get("/trending/entities", dependencies=[Depends(etag_or_304)])
+async def get_entities(
+    top_n: int = Query(10, description="Number of entities per type")
+):
+    """
+    Get trending people, organizations, and locations.
+    """
+    return _entities_payload(top_n)
+
+
 @router.get("/trending/keyword/{keyword}")
 async def get_articles_by_keyword(keyword: str):
     """
@@ -142,12 +154,11 @@ async def get_articles_by_keyword(keyword: str):
     state = get_app_state()
     keyword_lower = keyword.lower()
 
-    matching = []
-    for article in state.articles:
-        for kw in article.get("keywords", []):
-            if keyword_lower == kw.lower():
-                matching.append(article)
-                break
+    # Exact keyword match straight from the keyword index
+    matching = [
+        to_public(state.articles[i])
+        for i in sorted(state.idx_keyword.get(keyword_lower, ()))
+    ]
 
     return {
         "keyword": keyword,
@@ -0,0 +1,94 @@
+"""
+Shared article store for multi-worker deployments.
+
+Each uvicorn worker is a separate process with its own AppState. When
+REDIS_URL is configured, the fetched articles and a version counter are
+kept in Redis so a /fetch handled by one worker is visible to all.
+The Q&A conversation is kept there too.
+"""
+
+import json
+
+import redis
+from langchain_core.messages import AIMessage, HumanMessage
+
+from config import MEMORY_SIZE
+
+ARTICLES_KEY = "news:articles"
+VERSION_KEY = "news:version"
+HISTORY_KEY = "news:qa:{version}"
+HISTORY_TTL = 24 * 3600
+
+
+class RedisChatHistory:
+    """
+    Q&A conversation memory in a capped Redis list (see src.qa_chain.ChatHistory).
+
+    Keyed by article-set version, so a new fetch starts a new
+    conversation without workers having to clear each other's.
+    """
+
+    def __init__(self, client: redis.Redis, key: str, max_exchanges: int = MEMORY_SIZE):
+        self.redis = client
+        self.key = key
+        self.max_messages = max_exchanges * 2
+
+    def messages(self) -> list:
+        """All remembered messages, oldest first."""
+        messages = []
+        for raw in self.redis.lrange(self.key, 0, -1):
+            item = json.loads(raw)
+            message_class = HumanMessage if item["role"] == "user" else AIMessage
+            messages.append(message_class(content=item["content"]))
+        return messages
+
+    def add(self, question: str, answer: str):
+        """Append one exchange and trim to the newest max_messages."""
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.rpush(
+            self.key,
+            json.dumps({"role": "user", "content": question}),
+            json.dumps({"role": "assistant", "content": answer}),
+        )
+        pipe.ltrim(self.key, -self.max_messages, -1)
+        pipe.expire(self.key, HISTORY_TTL)
+        pipe.execute()
+
+    def clear(self):
+        """Forget the whole conversation."""
+        self.redis.delete(self.key)
+
+    def __len__(self) -> int:
+        return self.redis.llen(self.key)
+
+
+class SharedStore:
+    """Articles (JSON) plus a monotonically increasing version, in Redis."""
+
+    def __init__(self, url: str):
+        self.redis = redis.Redis.from_url(url)
+
+    def version(self) -> int:
+        """Current shared version (0 if nothing was published yet)."""
+        value = self.redis.get(VERSION_KEY)
+        return int(value) if value else 0
+
+    def publish(self, articles: list[dict]) -> int:
+        """Replace the shared articles and return the new version."""
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.set(ARTICLES_KEY, json.dumps(articles))
+        pipe.incr(VERSION_KEY)
+        _, version = pipe.execute()
+        return version
+
+    def chat_history(self, version: int) -> RedisChatHistory:
+        """Shared Q&A conversation for the given article-set version."""
+        return RedisChatHistory(self.redis, HISTORY_KEY.format(version=version))
+
+    def load(self) -> tuple[int, list[dict]]:
+        """Read the shared version and articles together."""
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.get(VERSION_KEY)
+        pipe.get(ARTICLES_KEY)
+        version, payload = pipe.execute()
+        return int(version or 0), json.loads(payload) if payload else []
@@ -4,15 +4,18 @@ News Summarizer Agent - FastAPI Backend
 This is the main entry point for the FastAPI application.
 It provides REST API endpoints for the News Summarizer Agent.
 
-Run with:
+Run from the project root (the backend is imported as the
+`backend` package, with config.py and src/ alongside it):
     uvicorn backend.main:app --reload --port 8000
 
-Or from the backend directory:
-    uvicorn main:app --reload --port 8000
+Or:
+    python -m backend.main
+
+For production (several workers, no reload) use backend/serve.py:
+    python -m backend.serve
 """
 
 import sys
-import os
 import io
 
 # Fix Windows console encoding for unicode characters
@@ -20,40 +23,81 @@ if sys.platform == 'win32':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
 
-# Get the project root directory (parent of backend)
-PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
-
-# Add both to path for imports
-if PROJECT_ROOT not in sys.path:
-    sys.path.insert(0, PROJECT_ROOT)
-if BACKEND_DIR not in sys.path:
-    sys.path.insert(0, BACKEND_DIR)
+import asyncio
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+
+from config import CATEGORIZER, CORS_ORIGINS
+from src.categorizer import get_category_embeddings, get_zero_shot_classifier
+from backend.services.feed_fetcher import create_http_client
+from backend.api.dependencies import SharedStateSyncMiddleware
+
+from backend.api.routes import articles, sentiment, trending, similarity, comparison, qa
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Per-worker startup and shutdown.
+
+    Loads models once at startup rather than on the first request, and
+    keeps one pooled HTTP client (app.state.http) for all outbound
+    news requests.
+    """
+    if CATEGORIZER == "zero-shot":
+        await asyncio.to_thread(get_zero_shot_classifier)
+    elif CATEGORIZER == "embedding":
+        await asyncio.to_thread(get_category_embeddings)
+
+    app.state.http = create_http_client()
+    yield
+    await app.state.http.aclose()
 
-from api.routes import articles, sentiment, trending, similarity, comparison, qa
 
 # Create FastAPI app
 app = FastAPI(
     title="News Summarizer Agent API",
     description="API for fetching, summarizing, and analyzing news articles",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    # Serialize every response with orjson (much faster than json.dumps)
+    default_response_class=ORJSONResponse
 )
 
+class StreamAwareGZipMiddleware(GZipMiddleware):
+    """
+    GZip, except for streaming responses - the server-sent event
+    endpoints (.../stream) and the NDJSON article feed (.ndjson).
+    Compression would buffer them and defeat the streaming.
+    """
+
+    STREAMING_PATH_SUFFIXES = ("/stream", ".ndjson")
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"].endswith(self.STREAMING_PATH_SUFFIXES):
+            await self.app(scope, receive, send)
+        else:
+            await super().__call__(scope, receive, send)
+
+
+# With Redis, pick up other workers' fetches before each request
+app.add_middleware(SharedStateSyncMiddleware)
+
+# Compress responses over 1 KB (article lists shrink several times over)
+app.add_middleware(StreamAwareGZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Configure CORS to allow frontend requests
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[
-        "http://localhost:5173",  # Vite dev server
-        "http://localhost:3000",  # Alternative React port
-        "http://127.0.0.1:5173",
-        "http://127.0.0.1:3000",
-    ],
+    allow_origins=CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    # Only what the frontend actually sends
+    allow_methods=["GET", "POST", "DELETE", "OPTIONS"],
+    allow_headers=["Content-Type", "Authorization", "If-None-Match"],
 )
 
 # Include routers
@@ -82,5 +126,15 @@ async def health_check():
 
 
 if __name__ == "__main__":
+    # Single worker for local runs; reload only in development (ENV=dev)
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000, reload=True)
+    from config import BACKEND_HOST, BACKEND_PORT, ENV
+
+    uvicorn.run(
+        "backend.main:app",
+        host=BACKEND_HOST,
+        port=BACKEND_PORT,
+        reload=ENV == "dev",
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools"
+    )
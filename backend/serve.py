@@ -0,0 +1,40 @@
+"""
+Production entry point for the FastAPI backend.
+
+Runs several uvicorn worker processes (WEB_CONCURRENCY, default
+2 x CPU cores + 1) on uvloop + httptools, without auto-reload.
+Set REDIS_URL so the workers share fetched articles.
+
+Run from the project root:
+    python -m backend.serve
+
+Alternatively, with gunicorn managing the workers:
+    gunicorn backend.main:app -k uvicorn.workers.UvicornWorker -w 4 -b 0.0.0.0:8000
+"""
+
+import sys
+
+import uvicorn
+
+from config import BACKEND_HOST, BACKEND_PORT, REDIS_URL, WEB_CONCURRENCY
+
+
+def main():
+    if WEB_CONCURRENCY > 1 and not REDIS_URL:
+        print(
+            "Warning: REDIS_URL is not set, so each worker keeps its own articles. "
+            "Set REDIS_URL (or WEB_CONCURRENCY=1) to share them."
+        )
+
+    uvicorn.run(
+        "backend.main:app",
+        host=BACKEND_HOST,
+        port=BACKEND_PORT,
+        workers=WEB_CONCURRENCY,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,232 @@
+"""
+Concurrent news fetching (RSS feeds and NewsAPI) for the API.
+
+The CLI downloads feeds one after another through feedparser. Here all
+feed GETs are issued at once, so fetching N feeds takes about as long
+as the slowest one instead of the sum of all of them. Requests go
+through the app's shared httpx client (see main.py's lifespan) so
+connections to the news sites are kept alive between fetches.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Optional
+
+import feedparser
+import httpx
+from cachetools import TTLCache
+
+from config import (
+    FEED_FETCH_CONCURRENCY,
+    MAX_ARTICLES_PER_SOURCE,
+    NEWS_API_KEY,
+    NEWSAPI_CATEGORIES,
+    RSS_FEEDS
+)
+from src.news_fetcher import (
+    NEWSAPI_URL,
+    articles_from_feed,
+    articles_from_newsapi,
+    newsapi_params
+)
+
+HTTP_TIMEOUT = 15
+FEED_CACHE_TTL = 300
+
+# Per feed URL: all articles converted from the feed. Within the TTL,
+# repeated fetches skip the network and parsing entirely.
+_article_cache: TTLCache = TTLCache(maxsize=64, ttl=FEED_CACHE_TTL)
+
+def create_http_client() -> httpx.AsyncClient:
+    """Pooled client for outbound news requests (one per worker)."""
+    return httpx.AsyncClient(
+        http2=True,
+        timeout=HTTP_TIMEOUT,
+        follow_redirects=True,
+        limits=httpx.Limits(
+            max_keepalive_connections=FEED_FETCH_CONCURRENCY,
+            max_connections=2 * FEED_FETCH_CONCURRENCY
+        )
+    )
+
+
+@asynccontextmanager
+async def _client_or_new(client: Optional[httpx.AsyncClient]):
+    """Use the given client, or a temporary one if there is none."""
+    if client is not None:
+        yield client
+    else:
+        async with create_http_client() as new_client:
+            yield new_client
+
+
+# Per feed URL: validators from the last 200 response and the parsed feed.
+# A feed that answers 304 Not Modified is neither downloaded nor re-parsed.
+_feed_meta: dict[str, dict] = {}
+
+
+async def _get(client: httpx.AsyncClient, url: str) -> Optional[bytes]:
+    """
+    Download one feed with a conditional GET.
+
+    Returns None if the feed is unchanged since the last fetch (304);
+    failures yield empty content (parsed as no entries, not cached).
+    """
+    headers = {}
+    meta = _feed_meta.get(url)
+    if meta and meta["feed"] is None:
+        meta = None  # downloaded but never parsed; nothing to reuse
+    if meta:
+        if meta["etag"]:
+            headers["If-None-Match"] = meta["etag"]
+        if meta["last_modified"]:
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+    try:
+        response = await client.get(url, headers=headers)
+        if response.status_code == 304:
+            if meta:
+                return None
+            # Nothing stored to reuse (e.g. after clear_feed_cache() or a
+            # restart, with a cache in between answering 304) - ask once
+            # more, telling any cache on the way not to revalidate
+            response = await client.get(url, headers={"Cache-Control": "no-cache"})
+            if response.status_code == 304:
+                raise httpx.HTTPStatusError(
+                    "304 Not Modified with no stored copy of the feed",
+                    request=response.request,
+                    response=response,
+                )
+        response.raise_for_status()
+    except httpx.HTTPError as e:
+        print(f"  Error fetching {url}: {e}")
+        # Forget the validators, so the empty result is never cached and
+        # the next fetch downloads the feed in full instead of getting 304
+        _feed_meta.pop(url, None)
+        return b""
+
+    _feed_meta[url] = {
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+        "feed": None,
+    }
+    return response.content
+
+
+async def fetch_all(feeds: dict, client: httpx.AsyncClient = None) -> list[Optional[bytes]]:
+    """
+    Download every feed in `feeds` ({name: url}) concurrently, in order.
+
+    Feeds unchanged since the previous call come back as None. At most
+    FEED_FETCH_CONCURRENCY downloads are in flight at once.
+    """
+    semaphore = asyncio.Semaphore(FEED_FETCH_CONCURRENCY)
+
+    async def limited_get(http: httpx.AsyncClient, url: str) -> Optional[bytes]:
+        async with semaphore:
+            return await _get(http, url)
+
+    async with _client_or_new(client) as http:
+        return await asyncio.gather(*(limited_get(http, url) for url in feeds.values()))
+
+
+def _parse(url: str, content: Optional[bytes]):
+    """Parse downloaded feed content, or reuse the parsed feed if unchanged."""
+    if content is None:
+        return _feed_meta[url]["feed"]
+
+    feed = feedparser.parse(content)
+    if url in _feed_meta:
+        _feed_meta[url]["feed"] = feed
+    return feed
+
+
+async def fetch_rss_articles(
+    max_per_source: int,
+    feeds: dict = RSS_FEEDS,
+    client: httpx.AsyncClient = None
+) -> list[dict]:
+    """Fetch all RSS feeds at once and convert their entries to articles."""
+    articles_by_url = {}
+    stale = {}
+    for source_name, url in feeds.items():
+        cached = _article_cache.get(url)
+        if cached is None:
+            stale[source_name] = url
+        else:
+            articles_by_url[url] = cached
+
+    contents = await fetch_all(stale, client)
+
+    # feedparser is CPU-only once it has the bytes: parse them one after
+    # another in a single worker thread, off the event loop
+    parsed = await asyncio.to_thread(
+        lambda: [_parse(url, content) for url, content in zip(stale.values(), contents)]
+    )
+
+    for (source_name, url), feed in zip(stale.items(), parsed):
+        converted = articles_from_feed(feed, source_name, len(feed.entries))
+        articles_by_url[url] = converted
+        if converted:  # don't hold on to a failed fetch
+            _article_cache[url] = converted
+
+    # Copies, since the pipeline adds summaries etc. to each article
+    articles = []
+    for url in feeds.values():
+        articles.extend(dict(a) for a in articles_by_url[url][:max_per_source])
+    return articles
+
+
+def clear_feed_cache():
+    """Forget cached feed articles so the next fetch goes to the network."""
+    _article_cache.clear()
+
+
+async def fetch_newsapi_articles(
+    max_per_category: int,
+    categories: list = NEWSAPI_CATEGORIES,
+    client: httpx.AsyncClient = None
+) -> list[dict]:
+    """Fetch NewsAPI top headlines for all categories at once."""
+    if not NEWS_API_KEY:
+        print("  NewsAPI key not found - add NEWS_API_KEY to your .env file")
+        return []
+
+    semaphore = asyncio.Semaphore(FEED_FETCH_CONCURRENCY)
+
+    async def fetch_category(http: httpx.AsyncClient, category: str) -> list[dict]:
+        params = newsapi_params(NEWS_API_KEY, category=category, max_articles=max_per_category)
+        try:
+            async with semaphore:
+                response = await http.get(NEWSAPI_URL, params=params)
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            print(f"  Error fetching from NewsAPI: {e}")
+            return []
+        return articles_from_newsapi(response.json())
+
+    async with _client_or_new(client) as http:
+        results = await asyncio.gather(*(fetch_category(http, c) for c in categories))
+
+    return [article for articles in results for article in articles]
+
+
+async def fetch_news(
+    source: str = "rss",
+    max_per_source: int = None,
+    client: httpx.AsyncClient = None
+) -> list[dict]:
+    """Async counterpart of src.news_fetcher.fetch_news for the API."""
+    if max_per_source is None:
+        max_per_source = MAX_ARTICLES_PER_SOURCE
+
+    source = source.lower()
+    articles = []
+
+    if source in ("rss", "both"):
+        articles += await fetch_rss_articles(max_per_source, client=client)
+
+    if source in ("newsapi", "both"):
+        articles += await fetch_newsapi_articles(max_per_source, client=client)
+
+    return articles
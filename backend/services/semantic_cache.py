@@ -0,0 +1,117 @@
+"""
+Semantic cache for LLM responses.
+
+Responses are keyed by the embedding of the user's input (the question,
+or the article text being summarized) rather than by its exact string,
+so near-duplicates such as "capital of France" and "France's capital"
+reuse one Claude call. Lookup is a cosine-similarity scan over the
+stored unit vectors; with a few hundred entries a numpy matrix product
+is as fast as an ANN index.
+
+If sentence-transformers isn't installed, lookups always miss and
+nothing is stored.
+"""
+
+import time
+from threading import Lock
+from typing import Hashable, Optional
+
+import numpy as np
+
+from src.embeddings import embed_texts
+
+
+class _Bucket:
+    """Embeddings and (response, timestamp) entries sharing one namespace."""
+
+    def __init__(self, dim: int):
+        self.vectors = np.empty((0, dim), dtype=np.float32)
+        self.entries: list[tuple[str, float]] = []
+
+
+class SemanticCache:
+    """
+    Embedding-keyed response cache.
+
+    Entries live in namespaces: a hit requires the same namespace (e.g.
+    the article-set version the answer was based on) and a cosine
+    similarity of at least `threshold` with a stored input.
+    """
+
+    def __init__(self, threshold: float = 0.92, ttl: float = 3600, max_entries: int = 1000):
+        self.threshold = threshold
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._buckets: dict[Hashable, _Bucket] = {}
+        self._lock = Lock()
+
+    def _embed(self, text: str) -> Optional[np.ndarray]:
+        vectors = embed_texts([text])
+        return None if vectors is None else vectors[0]
+
+    def get(self, text: str, namespace: Hashable = None) -> Optional[str]:
+        """Cached response for an input similar to `text`, or None."""
+        with self._lock:
+            if namespace not in self._buckets:
+                return None
+
+        vector = self._embed(text)
+        if vector is None:
+            return None
+
+        now = time.monotonic()
+        with self._lock:
+            # Look the bucket up again: put() may have replaced or evicted it
+            bucket = self._buckets.get(namespace)
+            if bucket is None or not bucket.entries:
+                return None
+            scores = bucket.vectors @ vector
+            # Expired entries can't win, so they never hide a valid match
+            expired = np.fromiter(
+                (now - stored_at > self.ttl for _, stored_at in bucket.entries),
+                dtype=bool, count=len(bucket.entries)
+            )
+            scores[expired] = -np.inf
+            best = int(np.argmax(scores))
+            if scores[best] < self.threshold:
+                return None
+            return bucket.entries[best][0]
+
+    def put(self, text: str, response: str, namespace: Hashable = None):
+        """Store `response` under the embedding of `text`."""
+        vector = self._embed(text)
+        if vector is None:
+            return
+
+        now = time.monotonic()
+        with self._lock:
+            self._evict(now)
+            bucket = self._buckets.setdefault(namespace, _Bucket(vector.shape[0]))
+            bucket.vectors = np.vstack([bucket.vectors, vector])
+            bucket.entries.append((response, now))
+
+    def _evict(self, now: float):
+        """Drop expired entries, then the oldest ones beyond max_entries."""
+        for namespace, bucket in list(self._buckets.items()):
+            keep = [i for i, (_, ts) in enumerate(bucket.entries) if now - ts <= self.ttl]
+            if not keep:
+                del self._buckets[namespace]
+            elif len(keep) < len(bucket.entries):
+                bucket.vectors = bucket.vectors[keep]
+                bucket.entries = [bucket.entries[i] for i in keep]
+
+        total = sum(len(b.entries) for b in self._buckets.values())
+        while total >= self.max_entries:
+            namespace, bucket = min(
+                self._buckets.items(), key=lambda item: item[1].entries[0][1]
+            )
+            bucket.vectors = bucket.vectors[1:]
+            bucket.entries.pop(0)
+            if not bucket.entries:
+                del self._buckets[namespace]
+            total -= 1
+
+    def clear(self):
+        """Forget every cached response."""
+        with self._lock:
+            self._buckets = {}
@@ -42,6 +42,10 @@ TEMPERATURE = 0.3
 # Maximum tokens (words roughly) for each summary
 MAX_TOKENS = 500
 
+# How many summaries to request from Claude at the same time
+# (higher is faster, but may hit your API rate limit)
+SUMMARY_CONCURRENCY = 8
+
 # =====================================================
 # RSS FEED SOURCES (Free - No API Key Needed!)
 # =====================================================
@@ -86,6 +90,9 @@ NEWSAPI_CATEGORIES = [
 # Maximum number of articles to fetch per source
 MAX_ARTICLES_PER_SOURCE = 5
 
+# How many feeds (or NewsAPI requests) are downloaded at the same time
+FEED_FETCH_CONCURRENCY = 8
+
 # =====================================================
 # CATEGORIES FOR CLASSIFICATION
 # =====================================================
@@ -103,6 +110,49 @@ CATEGORIES = [
     "Other"
 ]
 
+# How articles get their category:
+# - "llm" (default): Ask Claude, one call per article
+# - "zero-shot": A local zero-shot classifier, all articles in one batch
+#   (free and fast, slightly less accurate). Requires: pip install transformers torch
+# - "embedding": Nearest category by embedding similarity (fastest, no API calls).
+#   Requires: pip install sentence-transformers (see EMBEDDING SETTINGS below)
+CATEGORIZER = os.getenv("CATEGORIZER", "llm")
+
+# Model used when CATEGORIZER = "zero-shot"
+ZERO_SHOT_MODEL = "valhalla/distilbart-mnli-12-3"
+
+# With CATEGORIZER = "embedding": articles whose best category scores
+# below this similarity (0-1) are sent to Claude instead. Unclear
+# stories then get a proper answer while the rest stay free.
+# 0 (default) turns this off - no API calls at all.
+EMBEDDING_CATEGORY_MIN_SCORE = float(os.getenv("EMBEDDING_CATEGORY_MIN_SCORE", "0"))
+
+# =====================================================
+# EMBEDDING SETTINGS (optional - for semantic caching)
+# =====================================================
+
+# Sentence embedding model used to recognize near-duplicate questions
+# and articles. Requires: pip install sentence-transformers
+# Without it, semantic caching is simply turned off.
+EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+# How the embedding model runs on the CPU:
+# - "torch" (default): Full-precision PyTorch model
+# - "onnx-int8": 8-bit quantized ONNX model, typically 2-4x faster on CPU
+#   with nearly identical results. Requires: pip install "sentence-transformers[onnx]"
+EMBEDDING_BACKEND = os.getenv("EMBEDDING_BACKEND", "torch")
+
+# =====================================================
+# ANALYSIS CACHE (CLI)
+# =====================================================
+
+# Analyzed articles are saved here (one small JSON file per article URL)
+# so the next 'fetch' doesn't pay Claude to analyze them again
+ANALYSIS_CACHE_DIR = os.path.join("output", ".cache")
+
+# How long a cached analysis stays valid (seconds) - 24 hours
+ANALYSIS_CACHE_TTL = 24 * 60 * 60
+
 # =====================================================
 # MEMORY SETTINGS (for Q&A conversation)
 # =====================================================
@@ -126,5 +176,16 @@ CORS_ORIGINS = [
 BACKEND_HOST = "0.0.0.0"
 BACKEND_PORT = 8000
 
+# "dev" enables auto-reload when running backend/main.py directly
+ENV = os.getenv("ENV", "prod")
+
+# Number of worker processes for backend/serve.py (default: 2 x CPU cores + 1)
+WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", 2 * (os.cpu_count() or 1) + 1))
+
 # Frontend server settings
 FRONTEND_PORT = 5173
+
+# Shared state for multi-worker deployments (uvicorn --workers N).
+# Leave unset for a single worker; articles then live in memory.
+# Example: REDIS_URL=redis://localhost:6379/0
+REDIS_URL = os.getenv("REDIS_URL")
@@ -54,12 +54,22 @@ function Chat() {
     setLoading(true);
 
     try {
-      const response = await qaApi.ask(question);
-
-      // Add assistant response
-      setMessages(prev => [...prev, { role: 'assistant', content: response.data.answer }]);
+      let started = false;
+
+      // Show the answer as it streams in
+      await qaApi.askStream(question, (text) => {
+        if (!started) {
+          started = true;
+          setMessages(prev => [...prev, { role: 'assistant', content: text }]);
+        } else {
+          setMessages(prev => [
+            ...prev.slice(0, -1),
+            { role: 'assistant', content: prev[prev.length - 1].content + text },
+          ]);
+        }
+      });
     } catch (err) {
-      const errorMessage = err.response?.data?.detail || 'Sorry, something went wrong.';
+      const errorMessage = err.message || 'Sorry, something went wrong.';
       setMessages(prev => [...prev, { role: 'assistant', content: `Error: ${errorMessage}` }]);
     } finally {
       setLoading(false);
@@ -150,7 +160,7 @@ function Chat() {
                 </div>
               ))}
 
-              {loading && (
+              {loading && messages[messages.length - 1]?.role === 'user' && (
                 <div className="message assistant">
                   <div className="message-avatar">🤖</div>
                   <div className="message-content typing">
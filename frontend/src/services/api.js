@@ -92,6 +92,41 @@ export const qaApi = {
   ask: (question) =>
     api.post('/qa/ask', { question }),
 
+  // Streams the answer: calls onText(chunk) as each piece arrives
+  askStream: async (question, onText) => {
+    const response = await fetch(`${API_BASE_URL}/qa/ask/stream`, {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/json' },
+      body: JSON.stringify({ question }),
+    });
+
+    if (!response.ok) {
+      const body = await response.json().catch(() => ({}));
+      throw new Error(body.detail || 'Sorry, something went wrong.');
+    }
+
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+
+    for (;;) {
+      const { value, done } = await reader.read();
+      if (done) break;
+      buffer += decoder.decode(value, { stream: true });
+
+      // Server-sent events are separated by a blank line
+      const events = buffer.split('\n\n');
+      buffer = events.pop();
+
+      for (const raw of events) {
+        const event = raw.match(/^event: (.*)$/m)?.[1];
+        const data = JSON.parse(raw.match(/^data: (.*)$/m)?.[1] || '{}');
+        if (event === 'error') throw new Error(data.detail);
+        if (!event) onText(data.text);
+      }
+    }
+  },
+
   getHistory: () => api.get('/qa/history'),
 
   clearHistory: () => api.delete('/qa/history'),
@@ -11,6 +11,7 @@
 #   - categorizer.py - Classify by topic
 #   - qa_chain.py - Q&A with memory
 #   - tagger.py - Extract keywords/entities
+#   - analyzer.py - All of the above in one Claude call per article
 #
 # ADVANCED MODULES (Nice-to-Have):
 #   - sentiment.py - Analyze article tone
@@ -22,34 +23,91 @@
 #
 # =====================================================
 
+import contextlib
+import functools
+import io
 import json
 import os
+import re
+import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from itertools import islice
 from dateutil import parser as date_parser
 
+# orjson is a much faster JSON library (optional).
+# Without it, 'save' falls back to the built-in json module.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# readline gives the prompt line editing, arrow-key history and tab
+# completion. It isn't available on Windows - there the prompt is a
+# plain input() like before.
+try:
+    import readline
+except ImportError:
+    readline = None
+
 # -------------------------------------------------
 # CORE MODULE IMPORTS
 # -------------------------------------------------
-from src.news_fetcher import fetch_all_news, fetch_from_rss, fetch_news
-from src.summarizer import summarize_articles
-from src.categorizer import categorize_articles, group_by_category
-from src.qa_chain import NewsQAChain
-from src.tagger import tag_articles, get_all_keywords, get_all_entities
+from src.news_fetcher import iter_news, DATE_FORMAT
+from src import cache as analysis_cache
 
 # -------------------------------------------------
-# ADVANCED MODULE IMPORTS
+# LAZY IMPORTS
 # -------------------------------------------------
-# These are the modules we built for advanced features:
+# The AI modules (analyzer, categorizer, tagger, qa_chain)
+# and the advanced ones (sentiment, trending, similarity,
+# comparator) load LangChain, the Anthropic SDK and SciPy,
+# which takes a second or more. So each method imports what
+# it needs when it first runs: 'help' or 'quit' start
+# instantly, and Python caches a module after its first
+# import, so later calls cost nothing extra.
+#
+# Advanced features:
 # - Sentiment: Analyzes positive/negative/neutral tone
 # - Trending: Finds hot topics across articles
 # - Similarity: Links related articles together
 # - Comparator: Compares same story from different sources
-from src.sentiment import analyze_sentiments, get_sentiment_summary, filter_by_sentiment, display_sentiment_summary
-from src.trending import detect_trends, display_trends
-from src.similarity import find_similar_articles, analyze_article_relationships, display_similar_articles, display_all_relationships
-from src.comparator import compare_all_stories, display_all_comparisons, find_same_story_articles
 
-from config import RSS_FEEDS, CATEGORIES, NEWSAPI_SOURCES, NEWSAPI_CATEGORIES, NEWS_API_KEY
+from config import RSS_FEEDS, CATEGORIES, NEWSAPI_SOURCES, NEWSAPI_CATEGORIES, NEWS_API_KEY, SUMMARY_CONCURRENCY
+
+# Percentage bars for 'stats' (one █ per 5%, so 0-20 blocks),
+# built once instead of every time a bar is drawn
+BAR_CHART = tuple("█" * blocks for blocks in range(21))
+
+# Commands typed in earlier sessions (arrow-up to reuse them)
+HISTORY_FILE = os.path.expanduser("~/.news_summarizer_history")
+HISTORY_LENGTH = 1000
+
+# Characters that don't count towards an article's character count
+SPACE_CHARACTERS = (" ", "\t", "\n", "\r", "\xa0", "\u200b")
+
+
+def buffered_output(method):
+    """
+    Decorator: collect everything a display method prints, then
+    write it to the terminal in ONE go.
+
+    Each print() on a terminal is its own write (and flush).
+    Listing 30 articles is a couple of hundred of them; building
+    the text in memory first and writing it once is much faster,
+    especially when the output is piped to a file.
+    """
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        buffer = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(buffer):
+                return method(*args, **kwargs)
+        finally:
+            sys.stdout.write(buffer.getvalue())
+            sys.stdout.flush()
+    return wrapper
 
 
 class NewsSummarizerAgent:
@@ -85,6 +143,7 @@ class NewsSummarizerAgent:
         self.articles = []          # Fetched and processed articles
         self.qa_chain = None        # Q&A system (created after fetching)
         self.is_running = True      # Controls main loop
+        self._commands = self._build_command_table()  # Command word -> handler
 
         # -------------------------------------------------
         # ADVANCED FEATURE CACHES
@@ -95,6 +154,93 @@ class NewsSummarizerAgent:
         self.trends_cache = None           # Cached trending topics
         self.relationships_cache = None    # Cached article relationships
         self.comparisons_cache = None      # Cached source comparisons
+        self.grouped_cache = None          # Cached articles-by-category
+        self.keywords_cache = None         # Cached top keyword counts
+        self.entities_cache = None         # Cached top entity counts
+        self.similarity_cache = None       # Cached similarity scores of all pairs
+        self.articles_key = None           # Fingerprint of the articles the caches are for
+
+        # Lowercased text of each article for 'search', built once per fetch
+        self.search_index = []             # One searchable string per article
+        self.search_fields = []            # Per-field strings (for "Match in:")
+
+        # Word count / reading time of each article (None until first
+        # needed), and the parsed publication dates for 'filter'.
+        # Both are worked out lazily, at most once per fetch.
+        self.article_stats = []
+        self.article_dates = []
+
+    # -------------------------------------------------
+    # CACHED VIEWS OF THE ARTICLES
+    # -------------------------------------------------
+    # Several commands need the articles grouped by category
+    # or the keyword/entity counts. These only change when
+    # new articles are fetched, so we compute each one the
+    # first time it's needed and reuse it until the next fetch.
+
+    @property
+    def grouped(self) -> dict[str, list[dict]]:
+        """Articles grouped by category (cached until the next fetch)."""
+        if self.grouped_cache is None:
+            from src.categorizer import group_by_category
+            self.grouped_cache = group_by_category(self.articles)
+        return self.grouped_cache
+
+    # Commands show at most the top 10 keywords and top 5 entities
+    # of each type, so that's all we rank
+    TOP_KEYWORDS = 10
+    TOP_ENTITIES = 5
+
+    @property
+    def top_keywords(self) -> dict[str, int]:
+        """Top keyword counts across all articles (cached until the next fetch)."""
+        if self.keywords_cache is None:
+            from src.tagger import get_all_keywords
+            self.keywords_cache = get_all_keywords(self.articles, top_k=self.TOP_KEYWORDS)
+        return self.keywords_cache
+
+    @property
+    def top_entities(self) -> dict:
+        """Top entity counts of each type (cached until the next fetch)."""
+        if self.entities_cache is None:
+            from src.tagger import get_all_entities
+            self.entities_cache = get_all_entities(self.articles, top_k=self.TOP_ENTITIES)
+        return self.entities_cache
+
+    def _articles_key(self) -> int:
+        """
+        A fingerprint of the loaded articles (and their order).
+
+        Two fetches that return the same articles with the same
+        summaries get the same key, so the trends, relationships and
+        comparisons computed for the first one can be reused.
+        """
+        return hash(tuple(
+            (article.get("url", ""), article.get("title", ""), article.get("summary", ""))
+            for article in self.articles
+        ))
+
+    def _has_text(self) -> bool:
+        """
+        True if at least one article has some text.
+
+        Feeds occasionally return only headlines. Sending those to
+        Claude for trends, relationships or comparisons just wastes
+        a slow call, so those commands check this first. any() stops
+        at the first article with text, so this is normally instant.
+        """
+        return any(
+            (article.get("summary") or article.get("description") or "").strip()
+            for article in self.articles
+        )
+
+    @property
+    def similarity_matrix(self):
+        """Similarity score of every pair of articles (cached until the next fetch)."""
+        if self.similarity_cache is None:
+            from src.similarity import build_similarity_matrix
+            self.similarity_cache = build_similarity_matrix(self.articles)
+        return self.similarity_cache
 
     def display_welcome(self):
         """Show welcome message and available commands."""
@@ -137,6 +283,7 @@ Type 'fetch' to get started!
   SEARCH & FILTER
   ─────────────────────────────────────────────────────────
   search <keyword>   Search articles by keyword
+  search ai | chips  Search for any of several keywords
   filter today       Show articles from today
   filter week        Show articles from last 7 days
 
@@ -164,6 +311,7 @@ Type 'fetch' to get started!
   stats <number>     Show stats for a specific article
 
   save               Save articles as JSON (default)
+  save --compact     Save as JSON without indentation (smaller, faster)
   save md            Save articles as Markdown file
 
   ask <question>     Ask a question about the articles
@@ -181,17 +329,20 @@ Type 'fetch' to get started!
 
         This is the main pipeline that:
         1. Fetches articles from the specified source
-        2. Summarizes each article with Claude
-        3. Categorizes articles by topic
-        4. Extracts keywords and entities
-        5. Analyzes sentiment (NEW!)
-        6. Sets up Q&A system
+        2. Summarizes, categorizes, tags and analyzes the sentiment
+           of each article (one Claude call per article), starting
+           on each feed as soon as it has downloaded
+        3. Sets up Q&A system
 
         PARAMETERS:
         -----------
         source : str
             News source to use: "rss", "newsapi", or "both"
         """
+        from src.analyzer import analyze_article_safely, create_analysis_chain
+        from src.qa_chain import NewsQAChain
+        from src.sentiment import get_sentiment_summary
+
         print("\n" + "="*60)
         print("FETCHING NEWS")
         print("="*60)
@@ -199,42 +350,84 @@ Type 'fetch' to get started!
         # -------------------------------------------------
         # Clear caches from previous fetch
         # -------------------------------------------------
-        # When we fetch new articles, old analysis is invalid
-        self.trends_cache = None
-        self.relationships_cache = None
-        self.comparisons_cache = None
-
-        # Step 1: Fetch articles from the specified source
+        # When we fetch new articles, old analysis is invalid.
+        # (The Claude-based trend, relationship and comparison
+        # results are only cleared further down, if the articles
+        # actually changed.)
+        self.grouped_cache = None
+        self.keywords_cache = None
+        self.entities_cache = None
+        self.similarity_cache = None
+
+        # Friendly name of the source for the progress message
         source_name = {
             "rss": "RSS feeds",
             "newsapi": "NewsAPI",
             "both": "RSS feeds and NewsAPI"
         }.get(source, "RSS feeds")
 
-        print(f"\nStep 1/5: Fetching articles from {source_name}...")
-        raw_articles = fetch_news(source=source, max_per_source=3)
-
-        if not raw_articles:
+        # Steps 1 + 2 run as a PIPELINE: each feed's articles go to
+        # Claude (summary, category, tags and sentiment in one call -
+        # see src/analyzer.py) the moment that feed has downloaded,
+        # while the slower feeds are still downloading.
+        print(f"\nFetching articles from {source_name} and analyzing them as they arrive...")
+
+        results = {}        # (feed position, article position) -> analyzed article
+        pending = {}        # same keys -> Claude call still running
+        cached_count = 0
+        chain = None
+
+        with ThreadPoolExecutor(max_workers=SUMMARY_CONCURRENCY) as pool:
+            for feed_position, feed_articles in iter_news(source=source, max_per_source=3):
+                for position, article in enumerate(feed_articles):
+                    key = (feed_position, position)
+
+                    # Articles analyzed in an earlier fetch (last 24h) come
+                    # from the cache; only new ones are sent to Claude
+                    hit = analysis_cache.load(article.get("url", ""))
+                    if hit is not None:
+                        results[key] = hit
+                        cached_count += 1
+                        continue
+
+                    if chain is None:
+                        chain = create_analysis_chain()
+                    pending[key] = pool.submit(analyze_article_safely, article, chain)
+
+            # All feeds are in - wait for the remaining Claude calls
+            for key, future in pending.items():
+                article = future.result()
+                results[key] = article
+
+                # Don't cache failures - they should be retried next time
+                if not article.get("summary", "").startswith("Error:"):
+                    analysis_cache.store(article.get("url", ""), article)
+
+        if not results:
             print("No articles found. Please check your internet connection.")
             return
 
-        # Step 2: Summarize articles
-        print("\nStep 2/5: Summarizing articles with Claude...")
-        summarized = summarize_articles(raw_articles)
+        if cached_count:
+            print(f"  {cached_count} article(s) already analyzed (cached)")
 
-        # Step 3: Categorize articles
-        print("\nStep 3/5: Categorizing articles...")
-        categorized = categorize_articles(summarized)
+        # Feeds finish in any order - put the articles back in feed order
+        self.articles = [results[key] for key in sorted(results)]
 
-        # Step 4: Extract keywords and entities
-        print("\nStep 4/5: Extracting keywords and entities...")
-        tagged = tag_articles(categorized)
+        # Re-fetching often returns the very same articles. Only then
+        # are the (slow, Claude-based) cached analyses still valid.
+        articles_key = self._articles_key()
+        if articles_key != self.articles_key:
+            self.trends_cache = None
+            self.relationships_cache = None
+            self.comparisons_cache = None
+            self.articles_key = articles_key
 
-        # Step 5: Analyze sentiment (NEW!)
-        print("\nStep 5/5: Analyzing sentiment...")
-        self.articles = analyze_sentiments(tagged)
+        self._build_search_index()
+        # Stats and dates are worked out when a command first needs them
+        self.article_stats = []
+        self.article_dates = []
 
-        # Step 6: Set up Q&A system
+        # Step 3: Set up Q&A system
         self.qa_chain = NewsQAChain()
         self.qa_chain.load_articles(self.articles)
 
@@ -245,15 +438,15 @@ Type 'fetch' to get started!
         print(f"  Total articles: {len(self.articles)}")
 
         # Count by category
-        grouped = group_by_category(self.articles)
+        grouped = self.grouped
         print(f"  Categories: {len(grouped)}")
         for cat, arts in grouped.items():
             print(f"    - {cat}: {len(arts)} articles")
 
         # Show top keywords
-        all_keywords = get_all_keywords(self.articles)
+        all_keywords = self.top_keywords
         if all_keywords:
-            top_keywords = list(all_keywords.keys())[:5]
+            top_keywords = list(islice(all_keywords, 5))
             print(f"  Top keywords: {', '.join(top_keywords)}")
 
         # Show sentiment breakdown (NEW!)
@@ -265,6 +458,7 @@ Type 'fetch' to get started!
         print("\nType 'show' to see articles, 'sentiment' for mood analysis,")
         print("or 'trending' to see what's hot!")
 
+    @buffered_output
     def show_articles(self, article_num=None):
         """
         Display articles.
@@ -280,7 +474,7 @@ Type 'fetch' to get started!
         if article_num is not None:
             if 1 <= article_num <= len(self.articles):
                 article = self.articles[article_num - 1]
-                stats = self._calculate_article_stats(article)
+                stats = self._get_article_stats(article_num - 1)
 
                 print("\n" + "="*60)
                 print(f"ARTICLE {article_num}")
@@ -331,14 +525,14 @@ Type 'fetch' to get started!
 
         for i, article in enumerate(self.articles, 1):
             category = article.get('category', '?')
-            title = article['title'][:50]
-            print(f"\n  [{i}] [{category}] {title}...")
+            print(f"\n  [{i}] [{category}] {article['title']:.50}...")
             print(f"      Source: {article['source']}")
 
         print("\n" + "-"*60)
         print("Tip: Type 'show <number>' to see full details")
         print("     Example: show 3")
 
+    @buffered_output
     def show_category(self, category_name=None):
         """
         Show articles filtered by category.
@@ -349,7 +543,7 @@ Type 'fetch' to get started!
             print("\nNo articles loaded. Use 'fetch' first.")
             return
 
-        grouped = group_by_category(self.articles)
+        grouped = self.grouped
 
         # List all categories
         if category_name is None:
@@ -359,7 +553,7 @@ Type 'fetch' to get started!
             for cat, arts in grouped.items():
                 print(f"\n  {cat} ({len(arts)} articles)")
                 for art in arts[:2]:  # Show first 2
-                    print(f"    - {art['title'][:45]}...")
+                    print(f"    - {art['title']:.45}...")
                 if len(arts) > 2:
                     print(f"    ... and {len(arts) - 2} more")
             print("\n" + "-"*60)
@@ -369,8 +563,9 @@ Type 'fetch' to get started!
 
         # Find matching category (case-insensitive)
         matched_category = None
+        wanted = category_name.lower()
         for cat in grouped.keys():
-            if cat.lower() == category_name.lower():
+            if cat.lower() == wanted:
                 matched_category = cat
                 break
 
@@ -386,7 +581,7 @@ Type 'fetch' to get started!
         print("="*60)
 
         for i, article in enumerate(articles_in_cat, 1):
-            print(f"\n  [{i}] {article['title'][:50]}...")
+            print(f"\n  [{i}] {article['title']:.50}...")
             print(f"      Source: {article['source']}")
             summary = article.get('summary', '')[:100]
             print(f"      {summary}...")
@@ -397,6 +592,8 @@ Type 'fetch' to get started!
 
         Uses the Q&A chain with memory for follow-up questions.
         """
+        from src.qa_chain import NewsQAChain
+
         if not self.articles:
             print("\nNo articles loaded. Use 'fetch' first.")
             return
@@ -447,6 +644,7 @@ Type 'fetch' to get started!
         print("Usage: fetch rss | fetch newsapi | fetch both")
         print("="*60)
 
+    @buffered_output
     def show_tags(self, article_num=None):
         """
         Display tags (keywords and entities).
@@ -486,23 +684,23 @@ Type 'fetch' to get started!
         print("="*60)
 
         # Keywords
-        all_keywords = get_all_keywords(self.articles)
+        all_keywords = self.top_keywords
         print("\n🏷️  TOP KEYWORDS")
         print("-"*40)
         if all_keywords:
-            for keyword, count in list(all_keywords.items())[:10]:
+            for keyword, count in islice(all_keywords.items(), 10):
                 bar = "█" * count
                 print(f"  {keyword}: {bar} ({count})")
         else:
             print("  No keywords extracted")
 
         # Entities
-        all_entities = get_all_entities(self.articles)
+        all_entities = self.top_entities
 
         print("\n👤 PEOPLE MENTIONED")
         print("-"*40)
         if all_entities["people"]:
-            for name, count in list(all_entities["people"].items())[:5]:
+            for name, count in islice(all_entities["people"].items(), 5):
                 print(f"  {name}: {count} mention(s)")
         else:
             print("  No people mentioned")
@@ -510,7 +708,7 @@ Type 'fetch' to get started!
         print("\n🏢 ORGANIZATIONS")
         print("-"*40)
         if all_entities["organizations"]:
-            for name, count in list(all_entities["organizations"].items())[:5]:
+            for name, count in islice(all_entities["organizations"].items(), 5):
                 print(f"  {name}: {count} mention(s)")
         else:
             print("  No organizations mentioned")
@@ -518,7 +716,7 @@ Type 'fetch' to get started!
         print("\n📍 LOCATIONS")
         print("-"*40)
         if all_entities["locations"]:
-            for name, count in list(all_entities["locations"].items())[:5]:
+            for name, count in islice(all_entities["locations"].items(), 5):
                 print(f"  {name}: {count} mention(s)")
         else:
             print("  No locations mentioned")
@@ -526,6 +724,42 @@ Type 'fetch' to get started!
         print("\n" + "-"*60)
         print("Tip: Use 'tags <number>' to see tags for a specific article")
 
+    def _build_search_index(self):
+        """
+        Prepare the lowercased text that 'search' looks through.
+
+        Joining and lowercasing every field of every article is the
+        slow part of a search, and it gives the same result each
+        time - so we do it once per fetch instead of once per search.
+        """
+        self.search_fields = []
+        self.search_index = []
+
+        for article in self.articles:
+            # The fields reported in "Match in:" (in display order)
+            fields = {
+                "title": article.get("title", "").lower(),
+                "summary": article.get("summary", "").lower(),
+                "keywords": " ".join(article.get("keywords", [])).lower(),
+                "people": " ".join(article.get("people", [])).lower(),
+                "organizations": " ".join(article.get("organizations", [])).lower(),
+                "locations": " ".join(article.get("locations", [])).lower(),
+            }
+            self.search_fields.append(fields)
+
+            # Everything searchable, combined into one string
+            self.search_index.append(" ".join([
+                fields["title"],
+                fields["summary"],
+                article.get("description", "").lower(),
+                article.get("category", "").lower(),
+                fields["keywords"],
+                fields["people"],
+                fields["organizations"],
+                fields["locations"],
+            ]))
+
+    @buffered_output
     def search_articles(self, query: str):
         """
         Search articles by keyword.
@@ -539,13 +773,19 @@ Type 'fetch' to get started!
         PARAMETERS:
         -----------
         query : str
-            The search term (case-insensitive)
+            The search term (case-insensitive). Separate several
+            terms with "|" to find articles matching ANY of them,
+            e.g. "climate | energy".
 
         HOW IT WORKS:
         -------------
         This is simple string matching - we check if the query
         appears anywhere in the article's text or tags.
 
+        For several terms we compile ONE regular expression
+        ("climate|energy") so each article's text is scanned a
+        single time, however many terms there are.
+
         For more advanced search, you could:
         - Use fuzzy matching (fuzzywuzzy library)
         - Use embeddings and semantic search (LangChain)
@@ -557,32 +797,38 @@ Type 'fetch' to get started!
             print("\nNo articles loaded. Use 'fetch' first.")
             return
 
-        if not query or len(query.strip()) < 2:
+        query = (query or "").lower().strip()
+
+        # Check every "|"-separated term, not just the whole query -
+        # "a|b" is long enough but would search single letters
+        terms = [term.strip() for term in query.split("|") if term.strip()]
+        if not terms or any(len(term) < 2 for term in terms):
             print("\nPlease enter a search term (at least 2 characters).")
             return
 
-        query = query.lower().strip()
-        matches = []
+        # The lowercased text was prepared once at fetch time,
+        # so each search is just a substring check per article
+        if len(self.search_index) != len(self.articles):
+            self._build_search_index()
 
-        for article in self.articles:
-            # Build searchable text from all article fields
-            searchable_parts = [
-                article.get("title", ""),
-                article.get("summary", ""),
-                article.get("description", ""),
-                article.get("category", ""),
-                " ".join(article.get("keywords", [])),
-                " ".join(article.get("people", [])),
-                " ".join(article.get("organizations", [])),
-                " ".join(article.get("locations", [])),
-            ]
+        # Pick how to test a piece of text for the query
+        if len(terms) > 1:
+            # Several terms: one compiled pattern finds any of them in one scan
+            contains = re.compile("|".join(re.escape(term) for term in terms)).search
+            hits = [i for i, text in enumerate(self.search_index) if contains(text)]
+        else:
+            # One term: Python's built-in substring search ("in") is
+            # already a fast C search - faster than a regex for a plain
+            # word - so the loop uses it directly, with no function call
+            term = terms[0]
+            hits = [i for i, text in enumerate(self.search_index) if term in text]
 
-            # Combine all parts into one searchable string
-            searchable_text = " ".join(searchable_parts).lower()
+            # Used below to show which fields matched
+            def contains(text):
+                return term in text
 
-            # Check if query appears in the text
-            if query in searchable_text:
-                matches.append(article)
+        # Keep each match's position so we can show its number
+        matches = [(i, self.articles[i]) for i in hits]
 
         # Display results
         print("\n" + "="*60)
@@ -596,29 +842,17 @@ Type 'fetch' to get started!
 
         print(f"\nFound {len(matches)} article(s):\n")
 
-        for i, article in enumerate(matches, 1):
-            # Find the original index for reference
-            original_idx = self.articles.index(article) + 1
+        for index, article in matches:
+            # Number shown to the user (matches 'show <number>')
+            original_idx = index + 1
 
             # Highlight where the match was found
-            match_locations = []
-            if query in article.get("title", "").lower():
-                match_locations.append("title")
-            if query in article.get("summary", "").lower():
-                match_locations.append("summary")
-            if query in " ".join(article.get("keywords", [])).lower():
-                match_locations.append("keywords")
-            if query in " ".join(article.get("people", [])).lower():
-                match_locations.append("people")
-            if query in " ".join(article.get("organizations", [])).lower():
-                match_locations.append("organizations")
-            if query in " ".join(article.get("locations", [])).lower():
-                match_locations.append("locations")
+            fields = self.search_fields[index]
+            match_locations = [name for name, text in fields.items() if contains(text)]
 
             category = article.get('category', '?')
-            title = article['title'][:50]
 
-            print(f"  [{original_idx}] [{category}] {title}...")
+            print(f"  [{original_idx}] [{category}] {article['title']:.50}...")
             print(f"      Source: {article['source']}")
             print(f"      Match in: {', '.join(match_locations)}")
             print()
@@ -626,7 +860,7 @@ Type 'fetch' to get started!
         print("-"*60)
         print("Tip: Use 'show <number>' to see full article details")
 
-    def save_articles(self, format_type: str = "json"):
+    def save_articles(self, format_type: str = "json", compact: bool = False):
         """
         Save articles to a file.
 
@@ -635,6 +869,9 @@ Type 'fetch' to get started!
         format_type : str
             Output format: "json" or "md" (markdown)
 
+        compact : bool
+            For JSON: skip the indentation (smaller file, faster to write)
+
         FILE NAMING:
         ------------
         Files are saved with a timestamp:
@@ -653,18 +890,20 @@ Type 'fetch' to get started!
             os.makedirs(output_dir)
             print(f"Created output directory: {output_dir}/")
 
-        # Generate filename with timestamp
-        timestamp = datetime.now().strftime("%Y-%m-%d_%H%M%S")
+        # Read the clock once: the filename and the "saved at" time
+        # written inside the file always agree
+        now = datetime.now()
+        timestamp = now.strftime("%Y-%m-%d_%H%M%S")
 
         if format_type.lower() == "json":
-            self._save_as_json(output_dir, timestamp)
+            self._save_as_json(output_dir, timestamp, now, compact)
         elif format_type.lower() in ["md", "markdown"]:
-            self._save_as_markdown(output_dir, timestamp)
+            self._save_as_markdown(output_dir, timestamp, now)
         else:
             print(f"Unknown format: {format_type}")
             print("Valid options: json, md")
 
-    def _save_as_json(self, output_dir: str, timestamp: str):
+    def _save_as_json(self, output_dir: str, timestamp: str, saved_at: datetime, compact: bool = False):
         """
         Save articles as JSON file.
 
@@ -673,6 +912,10 @@ Type 'fetch' to get started!
         - Loading back into Python later
         - Sharing with other programs
         - APIs and web applications
+
+        Uses orjson when it's installed: it builds the UTF-8 bytes
+        directly in fast native code, several times faster than
+        the built-in json module.
         """
         filename = f"{output_dir}/news_{timestamp}.json"
 
@@ -680,18 +923,27 @@ Type 'fetch' to get started!
         # We include metadata about when and how many articles
         data = {
             "metadata": {
-                "saved_at": datetime.now().isoformat(),
+                "saved_at": saved_at.isoformat(),
                 "total_articles": len(self.articles),
-                "categories": list(group_by_category(self.articles).keys())
+                "categories": list(self.grouped.keys())
             },
             "articles": self.articles
         }
 
         # Write to file
-        # indent=2 makes it human-readable (pretty-printed)
-        # ensure_ascii=False allows non-English characters
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        # indent=2 makes it human-readable (pretty-printed), unless compact
+        if orjson is not None:
+            # orjson always writes non-English characters as-is (UTF-8)
+            option = 0 if compact else orjson.OPT_INDENT_2
+            with open(filename, "wb") as f:
+                f.write(orjson.dumps(data, option=option | orjson.OPT_NON_STR_KEYS))
+        else:
+            # ensure_ascii=False allows non-English characters
+            with open(filename, "w", encoding="utf-8") as f:
+                if compact:
+                    json.dump(data, f, separators=(",", ":"), ensure_ascii=False)
+                else:
+                    json.dump(data, f, indent=2, ensure_ascii=False)
 
         print("\n" + "="*60)
         print("SAVED AS JSON")
@@ -704,7 +956,7 @@ Type 'fetch' to get started!
         print(f"  with open('{filename}') as f:")
         print(f"      data = json.load(f)")
 
-    def _save_as_markdown(self, output_dir: str, timestamp: str):
+    def _save_as_markdown(self, output_dir: str, timestamp: str, saved_at: datetime):
         """
         Save articles as Markdown file.
 
@@ -715,91 +967,93 @@ Type 'fetch' to get started!
         """
         filename = f"{output_dir}/news_{timestamp}.md"
 
-        # Build markdown content
-        lines = []
-
-        # Header
-        date_str = datetime.now().strftime("%B %d, %Y at %H:%M")
-        lines.append(f"# News Summary")
-        lines.append(f"")
-        lines.append(f"*Generated on {date_str}*")
-        lines.append(f"")
-        lines.append(f"**Total Articles:** {len(self.articles)}")
-        lines.append(f"")
-
-        # Group by category
-        grouped = group_by_category(self.articles)
-
-        # Table of contents
-        lines.append("## Table of Contents")
-        lines.append("")
-        for category in grouped.keys():
-            # Create anchor link (lowercase, spaces to hyphens)
-            anchor = category.lower().replace(" ", "-")
-            lines.append(f"- [{category}](#{anchor}) ({len(grouped[category])} articles)")
-        lines.append("")
-        lines.append("---")
-        lines.append("")
-
-        # Articles by category
-        for category, articles in grouped.items():
-            lines.append(f"## {category}")
-            lines.append("")
-
-            for i, article in enumerate(articles, 1):
-                # Article title as heading
-                lines.append(f"### {i}. {article['title']}")
-                lines.append("")
-
-                # Metadata
-                lines.append(f"**Source:** {article['source']}")
-                if article.get('published'):
-                    lines.append(f"  ")
-                    lines.append(f"**Published:** {article['published']}")
-                lines.append("")
-
-                # Summary
-                lines.append(f"**Summary:**")
-                lines.append(f"")
-                lines.append(f"> {article.get('summary', 'No summary available')}")
-                lines.append("")
-
-                # Tags
-                keywords = article.get("keywords", [])
-                if keywords:
-                    tags_str = " ".join([f"`{kw}`" for kw in keywords])
-                    lines.append(f"**Keywords:** {tags_str}")
-                    lines.append("")
-
-                # Entities
-                people = article.get("people", [])
-                orgs = article.get("organizations", [])
-                locations = article.get("locations", [])
-
-                if people or orgs or locations:
-                    lines.append("**Entities:**")
-                    if people:
-                        lines.append(f"- People: {', '.join(people)}")
-                    if orgs:
-                        lines.append(f"- Organizations: {', '.join(orgs)}")
-                    if locations:
-                        lines.append(f"- Locations: {', '.join(locations)}")
-                    lines.append("")
-
-                # Link
-                if article.get('url'):
-                    lines.append(f"[Read full article]({article['url']})")
-                    lines.append("")
-
-                lines.append("---")
-                lines.append("")
-
-        # Footer
-        lines.append("*Generated by News Summarizer Agent*")
-
-        # Write to file
+        # Write the file line by line as we go, instead of building
+        # the whole document in memory first
         with open(filename, "w", encoding="utf-8") as f:
-            f.write("\n".join(lines))
+            write = f.write
+
+            def line(text: str = ""):
+                write(text)
+                write("\n")
+
+            # Header
+            date_str = saved_at.strftime("%B %d, %Y at %H:%M")
+            line(f"# News Summary")
+            line(f"")
+            line(f"*Generated on {date_str}*")
+            line(f"")
+            line(f"**Total Articles:** {len(self.articles)}")
+            line(f"")
+
+            # Group by category
+            grouped = self.grouped
+
+            # Table of contents
+            line("## Table of Contents")
+            line("")
+            for category in grouped.keys():
+                # Create anchor link (lowercase, spaces to hyphens)
+                anchor = category.lower().replace(" ", "-")
+                line(f"- [{category}](#{anchor}) ({len(grouped[category])} articles)")
+            line("")
+            line("---")
+            line("")
+
+            # Articles by category
+            for category, articles in grouped.items():
+                line(f"## {category}")
+                line("")
+
+                for i, article in enumerate(articles, 1):
+                    # Article title as heading
+                    line(f"### {i}. {article['title']}")
+                    line("")
+
+                    # Metadata
+                    line(f"**Source:** {article['source']}")
+                    if article.get('published'):
+                        line(f"  ")
+                        line(f"**Published:** {article['published']}")
+                    line("")
+
+                    # Summary
+                    line(f"**Summary:**")
+                    line(f"")
+                    line(f"> {article.get('summary', 'No summary available')}")
+                    line("")
+
+                    # Tags
+                    keywords = article.get("keywords", [])
+                    if keywords:
+                        tags_str = " ".join([f"`{kw}`" for kw in keywords])
+                        line(f"**Keywords:** {tags_str}")
+                        line("")
+
+                    # Entities
+                    people = article.get("people", [])
+                    orgs = article.get("organizations", [])
+                    locations = article.get("locations", [])
+
+                    if people or orgs or locations:
+                        line("**Entities:**")
+                        if people:
+                            line(f"- People: {', '.join(people)}")
+                        if orgs:
+                            line(f"- Organizations: {', '.join(orgs)}")
+                        if locations:
+                            line(f"- Locations: {', '.join(locations)}")
+                        line("")
+
+                    # Link
+                    if article.get('url'):
+                        line(f"[Read full article]({article['url']})")
+                        line("")
+
+                    line("---")
+                    line("")
+
+            # Footer
+            line("*Generated by News Summarizer Agent*")
 
         print("\n" + "="*60)
         print("SAVED AS MARKDOWN")
@@ -813,6 +1067,23 @@ Type 'fetch' to get started!
         print("  - GitHub (renders automatically)")
         print("  - Notion, Obsidian, etc.")
 
+    def _get_article_stats(self, index: int) -> dict:
+        """
+        Statistics for self.articles[index] (0-based).
+
+        The numbers only change when new articles are fetched, so each
+        article's are calculated the first time 'show' or 'stats' asks
+        for them and remembered until the next fetch. Commands that
+        never look at the stats never pay for splitting the text.
+        """
+        if len(self.article_stats) != len(self.articles):
+            self.article_stats = [None] * len(self.articles)
+
+        stats = self.article_stats[index]
+        if stats is None:
+            stats = self.article_stats[index] = self._calculate_article_stats(self.articles[index])
+        return stats
+
     def _calculate_article_stats(self, article: dict) -> dict:
         """
         Calculate statistics for a single article.
@@ -836,16 +1107,19 @@ Type 'fetch' to get started!
             - char_count: Number of characters
             - reading_time_seconds: Estimated reading time in seconds
             - reading_time_display: Human-readable reading time
+            - keyword_count: Number of keywords
+            - entity_count: Number of people, organizations and locations
         """
         # Get the text content
         text = article.get("summary", article.get("description", ""))
 
         # Word count: split by whitespace
-        words = text.split()
-        word_count = len(words)
+        word_count = len(text.split())
 
-        # Character count (excluding spaces)
-        char_count = len(text.replace(" ", ""))
+        # Character count (excluding spaces, tabs, newlines and the
+        # non-breaking / zero-width spaces common in RSS text)
+        # Counting them avoids building a copy of the text without them
+        char_count = len(text) - sum(map(text.count, SPACE_CHARACTERS))
 
         # Reading time calculation
         # Average reading speed: 200 words per minute
@@ -853,22 +1127,25 @@ Type 'fetch' to get started!
         reading_time_minutes = word_count / words_per_minute
         reading_time_seconds = int(reading_time_minutes * 60)
 
-        # Format reading time for display
-        if reading_time_seconds < 60:
-            reading_time_display = f"{reading_time_seconds} sec"
+        # Format reading time for display ("45 sec", "2 min", "2 min 15 sec")
+        # divmod() gives minutes and seconds in one step
+        minutes, seconds = divmod(reading_time_seconds, 60)
+        if minutes == 0:
+            reading_time_display = f"{seconds} sec"
         else:
-            minutes = reading_time_seconds // 60
-            seconds = reading_time_seconds % 60
-            if seconds > 0:
-                reading_time_display = f"{minutes} min {seconds} sec"
-            else:
-                reading_time_display = f"{minutes} min"
+            reading_time_display = f"{minutes} min {seconds} sec" if seconds else f"{minutes} min"
 
         return {
             "word_count": word_count,
             "char_count": char_count,
             "reading_time_seconds": reading_time_seconds,
-            "reading_time_display": reading_time_display
+            "reading_time_display": reading_time_display,
+            "keyword_count": len(article.get("keywords", [])),
+            "entity_count": (
+                len(article.get("people", [])) +
+                len(article.get("organizations", [])) +
+                len(article.get("locations", []))
+            )
         }
 
     def show_stats(self, article_num=None):
@@ -886,12 +1163,12 @@ Type 'fetch' to get started!
         if article_num is not None:
             if 1 <= article_num <= len(self.articles):
                 article = self.articles[article_num - 1]
-                stats = self._calculate_article_stats(article)
+                stats = self._get_article_stats(article_num - 1)
 
                 print("\n" + "="*60)
                 print(f"STATISTICS FOR ARTICLE {article_num}")
                 print("="*60)
-                print(f"\n📰 {article['title'][:50]}...")
+                print(f"\n📰 {article['title']:.50}...")
                 print(f"\n📊 Summary Statistics:")
                 print(f"   Words:        {stats['word_count']}")
                 print(f"   Characters:   {stats['char_count']}")
@@ -900,14 +1177,8 @@ Type 'fetch' to get started!
                 print(f"📡 Source:   {article.get('source', 'Unknown')}")
 
                 # Show keyword count
-                keywords = article.get("keywords", [])
-                entities = (
-                    article.get("people", []) +
-                    article.get("organizations", []) +
-                    article.get("locations", [])
-                )
-                print(f"\n🏷️  Keywords: {len(keywords)}")
-                print(f"👤 Entities: {len(entities)}")
+                print(f"\n🏷️  Keywords: {stats['keyword_count']}")
+                print(f"👤 Entities: {stats['entity_count']}")
             else:
                 print(f"\nInvalid article number. Choose between 1 and {len(self.articles)}")
             return
@@ -924,15 +1195,20 @@ Type 'fetch' to get started!
         total_keywords = 0
         total_entities = 0
 
-        for article in self.articles:
-            stats = self._calculate_article_stats(article)
+        # Articles per category and per source, counted in the same loop
+        categories = Counter()
+        sources = Counter()
+
+        for index, article in enumerate(self.articles):
+            categories[article.get("category", "Other")] += 1
+            sources[article.get("source", "Unknown")] += 1
+
+            stats = self._get_article_stats(index)
             total_words += stats["word_count"]
             total_chars += stats["char_count"]
             total_reading_seconds += stats["reading_time_seconds"]
-            total_keywords += len(article.get("keywords", []))
-            total_entities += len(article.get("people", []))
-            total_entities += len(article.get("organizations", []))
-            total_entities += len(article.get("locations", []))
+            total_keywords += stats["keyword_count"]
+            total_entities += stats["entity_count"]
 
         # Format total reading time
         total_minutes = total_reading_seconds // 60
@@ -941,13 +1217,12 @@ Type 'fetch' to get started!
         print(f"\n📰 ARTICLES")
         print(f"   Total articles: {len(self.articles)}")
 
-        # Category breakdown
-        grouped = group_by_category(self.articles)
-        print(f"   Categories:     {len(grouped)}")
-        for cat, arts in grouped.items():
-            pct = (len(arts) / len(self.articles)) * 100
-            bar = "█" * int(pct / 5)  # Simple bar chart
-            print(f"     {cat}: {len(arts)} ({pct:.0f}%) {bar}")
+        # Category breakdown (in first-seen order, like group_by_category)
+        print(f"   Categories:     {len(categories)}")
+        for cat, count in categories.items():
+            pct = (count / len(self.articles)) * 100
+            bar = BAR_CHART[min(int(pct / 5), 20)]  # Simple bar chart
+            print(f"     {cat}: {count} ({pct:.0f}%) {bar}")
 
         print(f"\n📊 CONTENT")
         print(f"   Total words:      {total_words:,}")
@@ -964,13 +1239,8 @@ Type 'fetch' to get started!
         print(f"   Avg keywords/article: {total_keywords / len(self.articles):.1f}")
 
         # Source breakdown
-        sources = {}
-        for article in self.articles:
-            source = article.get("source", "Unknown")
-            sources[source] = sources.get(source, 0) + 1
-
         print(f"\n📡 SOURCES")
-        for source, count in sorted(sources.items(), key=lambda x: x[1], reverse=True):
+        for source, count in sources.most_common():
             print(f"   {source}: {count} article(s)")
 
         print("\n" + "-"*60)
@@ -985,7 +1255,10 @@ Type 'fetch' to get started!
         - "2026-01-18T14:30:00Z"
         - "Mon, 18 Jan 2026 14:30:00 GMT"
 
-        The dateutil.parser is smart enough to handle most formats.
+        The first is the format news_fetcher stores every date in,
+        so we try it (and ISO 8601) with the fast standard-library
+        parsers first. The dateutil.parser is much slower, but smart
+        enough to handle most other formats.
 
         RETURNS:
         --------
@@ -996,12 +1269,44 @@ Type 'fetch' to get started!
         if not date_str:
             return None
 
+        try:
+            # Fast path 1: the format news_fetcher saves dates in
+            return datetime.strptime(date_str, DATE_FORMAT)
+        except ValueError:
+            pass
+
+        try:
+            # Fast path 2: ISO 8601 dates are parsed in C
+            # (before Python 3.11, fromisoformat() doesn't accept "Z")
+            if date_str.endswith("Z"):
+                return datetime.fromisoformat(date_str[:-1] + "+00:00")
+            return datetime.fromisoformat(date_str)
+        except ValueError:
+            pass
+
         try:
             # dateutil.parser.parse() handles many date formats
             return date_parser.parse(date_str)
         except (ValueError, TypeError):
             return None
 
+    def _build_article_dates(self):
+        """
+        Parse the publication date of every article once.
+
+        Done the first time 'filter' runs after a fetch; later
+        'filter' commands compare the precomputed datetimes instead of running
+        the date parser over every article again. They are kept here,
+        not on the articles, so the articles still save as plain JSON.
+        """
+        self.article_dates = [self._parse_article_date(a) for a in self.articles]
+
+    def _get_article_dates(self) -> list:
+        """Parsed dates of self.articles (same order), from the precomputed list."""
+        if len(self.article_dates) != len(self.articles):
+            self._build_article_dates()
+        return self.article_dates
+
     def filter_by_date(self, date_range: str):
         """
         Filter articles by date range.
@@ -1054,9 +1359,10 @@ Type 'fetch' to get started!
         matches = []
         no_date_count = 0
 
-        for article in self.articles:
-            article_date = self._parse_article_date(article)
-
+        # Keep each article's number alongside it for the listing below
+        for idx, (article, article_date) in enumerate(
+            zip(self.articles, self._get_article_dates()), start=1
+        ):
             if article_date is None:
                 no_date_count += 1
                 continue
@@ -1064,11 +1370,11 @@ Type 'fetch' to get started!
             # Special handling for "yesterday" (between two dates)
             if date_range == "yesterday":
                 if cutoff <= article_date < end_cutoff:
-                    matches.append(article)
+                    matches.append((idx, article))
             else:
                 # For other ranges, just check if after cutoff
                 if article_date >= cutoff:
-                    matches.append(article)
+                    matches.append((idx, article))
 
         # Display results
         print("\n" + "="*60)
@@ -1083,14 +1389,12 @@ Type 'fetch' to get started!
 
         print(f"\nFound {len(matches)} article(s) from {range_description}:\n")
 
-        for article in matches:
-            # Find original index
-            original_idx = self.articles.index(article) + 1
+        for original_idx, article in matches:
             category = article.get('category', '?')
-            title = article['title'][:45]
             published = article.get('published', 'Unknown date')
 
-            print(f"  [{original_idx}] [{category}] {title}...")
+            # {:.45} truncates while formatting (no separate slice)
+            print(f"  [{original_idx}] [{category}] {article['title']:.45}...")
             print(f"      📅 {published}")
             print(f"      📡 {article['source']}")
             print()
@@ -1140,6 +1444,8 @@ Type 'fetch' to get started!
         2. Claude classifies as positive/negative/neutral
         3. Returns structured sentiment data
         """
+        from src.sentiment import display_sentiment_summary
+
         if not self.articles:
             print("\nNo articles loaded. Use 'fetch' first.")
             return
@@ -1152,7 +1458,13 @@ Type 'fetch' to get started!
                 print("Valid options: positive, negative, neutral")
                 return
 
-            filtered = filter_by_sentiment(self.articles, sentiment_filter)
+            # Same test as sentiment.filter_by_sentiment(), but keeping
+            # each article's number so we don't have to search for it
+            filtered = [
+                (idx, article)
+                for idx, article in enumerate(self.articles, start=1)
+                if article.get("sentiment", "neutral") == sentiment_filter
+            ]
 
             emoji = {"positive": "😊", "negative": "😟", "neutral": "😐"}[sentiment_filter]
             print("\n" + "="*60)
@@ -1165,14 +1477,9 @@ Type 'fetch' to get started!
 
             print(f"\nFound {len(filtered)} {sentiment_filter} article(s):\n")
 
-            for article in filtered:
-                # Find original index
-                original_idx = self.articles.index(article) + 1
-                title = article['title'][:45]
-                reason = article.get('sentiment_reason', '')[:50]
-
-                print(f"  [{original_idx}] {title}...")
-                print(f"      {reason}")
+            for original_idx, article in filtered:
+                print(f"  [{original_idx}] {article['title']:.45}...")
+                print(f"      {article.get('sentiment_reason', ''):.50}")
                 print()
 
             return
@@ -1204,10 +1511,17 @@ Type 'fetch' to get started!
         This demonstrates MULTI-DOCUMENT REASONING - one of
         the powerful patterns in LangChain.
         """
+        from src.trending import detect_trends, display_trends
+
         if not self.articles:
             print("\nNo articles loaded. Use 'fetch' first.")
             return
 
+        if use_llm and not self._has_text():
+            print("\nNone of the loaded articles have any text to analyze.")
+            print("Try 'trending fast' for keyword counts only.")
+            return
+
         # Use cached results if available
         if self.trends_cache and self.trends_cache.get("use_llm") == use_llm:
             print("\n(Using cached trend analysis)")
@@ -1248,6 +1562,8 @@ Type 'fetch' to get started!
 
         This uses JACCARD SIMILARITY to measure overlap.
         """
+        from src.similarity import find_similar_articles, display_similar_articles
+
         if not self.articles:
             print("\nNo articles loaded. Use 'fetch' first.")
             return
@@ -1261,11 +1577,14 @@ Type 'fetch' to get started!
         print(f"\n🔍 Finding articles similar to #{article_num}...")
 
         # Find similar articles
+        # The matrix lets it skip articles that share nothing with the target
         similar = find_similar_articles(
             target_article=target,
             all_articles=self.articles,
             threshold=0.15,  # Lower threshold to find more matches
-            max_results=5
+            max_results=5,
+            matrix=self.similarity_matrix,
+            target_index=article_num - 1
         )
 
         # Display results
@@ -1289,6 +1608,8 @@ Type 'fetch' to get started!
         it to identify which articles are related and WHY.
         This captures relationships that keyword matching misses.
         """
+        from src.similarity import analyze_article_relationships, display_all_relationships
+
         if not self.articles:
             print("\nNo articles loaded. Use 'fetch' first.")
             return
@@ -1297,6 +1618,10 @@ Type 'fetch' to get started!
             print("\nNeed at least 2 articles to find relationships.")
             return
 
+        if not self._has_text():
+            print("\nNone of the loaded articles have any text to analyze.")
+            return
+
         # Use cached results if available
         if self.relationships_cache:
             print("\n(Using cached relationship analysis)")
@@ -1333,10 +1658,16 @@ Type 'fetch' to get started!
         This demonstrates MULTI-SOURCE COMPARISON - analyzing
         how different perspectives describe the same event.
         """
+        from src.comparator import compare_all_stories, display_all_comparisons, find_same_story_articles
+
         if not self.articles:
             print("\nNo articles loaded. Use 'fetch' first.")
             return
 
+        if not self._has_text():
+            print("\nNone of the loaded articles have any text to analyze.")
+            return
+
         if len(self.articles) < 2:
             print("\nNeed at least 2 articles to compare sources.")
             return
@@ -1385,6 +1716,167 @@ Type 'fetch' to get started!
         print("Tip: This analysis shows how different outlets")
         print("     frame the same story - helpful for spotting bias!")
 
+    # =====================================================
+    # COMMAND HANDLERS
+    # =====================================================
+    #
+    # One method per command. Each gets the text after the
+    # command word (or None) and does its own argument
+    # parsing. self._commands maps every command word to its
+    # handler, so process_command() finds the right one with
+    # a single dictionary lookup instead of comparing the
+    # command against every name in turn.
+    #
+    # =====================================================
+
+    def _build_command_table(self) -> dict:
+        """Map each command word (and alias) to its handler."""
+        return {
+            "quit": self._cmd_quit,
+            "exit": self._cmd_quit,
+            "q": self._cmd_quit,
+            "help": self._cmd_help,
+            "fetch": self._cmd_fetch,
+            "show": self._cmd_show,
+            "category": self._cmd_category,
+            "tags": self._cmd_tags,
+            "search": self._cmd_search,
+            "save": self._cmd_save,
+            "stats": self._cmd_stats,
+            "filter": self._cmd_filter,
+            "ask": self._cmd_ask,
+            "sources": self._cmd_sources,
+            "clear": self._cmd_clear,
+            # Advanced feature commands
+            "sentiment": self._cmd_sentiment,
+            "trending": self._cmd_trending,
+            "similar": self._cmd_similar,
+            "related": self._cmd_related,
+            "compare": self._cmd_compare,
+        }
+
+    def _cmd_quit(self, args):
+        print("\nGoodbye! Stay informed!")
+        self.is_running = False
+
+    def _cmd_help(self, args):
+        self.display_help()
+
+    def _cmd_fetch(self, args):
+        # Parse optional source argument: fetch [rss|newsapi|both]
+        source = args.lower() if args else "rss"
+        if source not in ["rss", "newsapi", "both"]:
+            print(f"Unknown source: {source}")
+            print("Valid options: rss, newsapi, both")
+            return
+        self.fetch_news(source=source)
+
+    def _cmd_show(self, args):
+        if args:
+            try:
+                num = int(args)
+                self.show_articles(num)
+            except ValueError:
+                print("Usage: show <number>")
+                print("Example: show 3")
+        else:
+            self.show_articles()
+
+    def _cmd_category(self, args):
+        self.show_category(args)
+
+    def _cmd_tags(self, args):
+        if args:
+            try:
+                num = int(args)
+                self.show_tags(num)
+            except ValueError:
+                print("Usage: tags <number>")
+                print("Example: tags 3")
+        else:
+            self.show_tags()
+
+    def _cmd_search(self, args):
+        if args:
+            self.search_articles(args)
+        else:
+            print("Usage: search <keyword>")
+            print("Example: search technology")
+            print("Example: search climate change")
+
+    def _cmd_save(self, args):
+        # Default to JSON if no format specified
+        # e.g. "save", "save md", "save --compact", "save json --compact"
+        options = args.lower().split() if args else []
+        compact = "--compact" in options
+        formats = [opt for opt in options if opt != "--compact"]
+        format_type = formats[0] if formats else "json"
+        self.save_articles(format_type, compact)
+
+    def _cmd_stats(self, args):
+        if args:
+            try:
+                num = int(args)
+                self.show_stats(num)
+            except ValueError:
+                print("Usage: stats <number>")
+                print("Example: stats 3")
+        else:
+            self.show_stats()
+
+    def _cmd_filter(self, args):
+        if args:
+            self.filter_by_date(args)
+        else:
+            print("Usage: filter <date_range>")
+            print("Options: today, yesterday, week, month")
+            print("Example: filter today")
+            print("Example: filter week")
+
+    def _cmd_ask(self, args):
+        if args:
+            self.ask_question(args)
+        else:
+            print("Usage: ask <your question>")
+            print("Example: ask What's the latest technology news?")
+
+    def _cmd_sources(self, args):
+        self.show_sources()
+
+    def _cmd_clear(self, args):
+        self.clear_history()
+
+    def _cmd_sentiment(self, args):
+        # sentiment OR sentiment <type>
+        self.show_sentiment(args)
+
+    def _cmd_trending(self, args):
+        # trending OR trending fast
+        if args and args.lower() == "fast":
+            self.show_trending(use_llm=False)
+        else:
+            self.show_trending(use_llm=True)
+
+    def _cmd_similar(self, args):
+        # similar <number>
+        if args:
+            try:
+                num = int(args)
+                self.show_similar(num)
+            except ValueError:
+                print("Usage: similar <number>")
+                print("Example: similar 3")
+        else:
+            print("Usage: similar <number>")
+            print("Example: similar 3")
+            print("\nThis finds articles similar to the specified article.")
+
+    def _cmd_related(self, args):
+        self.show_related()
+
+    def _cmd_compare(self, args):
+        self.show_comparison()
+
     def process_command(self, user_input: str):
         """
         Process a user command.
@@ -1401,136 +1893,59 @@ Type 'fetch' to get started!
         args = parts[1] if len(parts) > 1 else None
 
         # Route to appropriate handler
-        if command in ['quit', 'exit', 'q']:
-            print("\nGoodbye! Stay informed!")
-            self.is_running = False
-
-        elif command == 'help':
-            self.display_help()
-
-        elif command == 'fetch':
-            # Parse optional source argument: fetch [rss|newsapi|both]
-            source = args.lower() if args else "rss"
-            if source not in ["rss", "newsapi", "both"]:
-                print(f"Unknown source: {source}")
-                print("Valid options: rss, newsapi, both")
-                return
-            self.fetch_news(source=source)
-
-        elif command == 'show':
-            if args:
-                try:
-                    num = int(args)
-                    self.show_articles(num)
-                except ValueError:
-                    print("Usage: show <number>")
-                    print("Example: show 3")
-            else:
-                self.show_articles()
-
-        elif command == 'category':
-            self.show_category(args)
-
-        elif command == 'tags':
-            if args:
-                try:
-                    num = int(args)
-                    self.show_tags(num)
-                except ValueError:
-                    print("Usage: tags <number>")
-                    print("Example: tags 3")
-            else:
-                self.show_tags()
-
-        elif command == 'search':
-            if args:
-                self.search_articles(args)
-            else:
-                print("Usage: search <keyword>")
-                print("Example: search technology")
-                print("Example: search climate change")
-
-        elif command == 'save':
-            # Default to JSON if no format specified
-            format_type = args.lower() if args else "json"
-            self.save_articles(format_type)
-
-        elif command == 'stats':
-            if args:
-                try:
-                    num = int(args)
-                    self.show_stats(num)
-                except ValueError:
-                    print("Usage: stats <number>")
-                    print("Example: stats 3")
-            else:
-                self.show_stats()
-
-        elif command == 'filter':
-            if args:
-                self.filter_by_date(args)
-            else:
-                print("Usage: filter <date_range>")
-                print("Options: today, yesterday, week, month")
-                print("Example: filter today")
-                print("Example: filter week")
-
-        elif command == 'ask':
-            if args:
-                self.ask_question(args)
-            else:
-                print("Usage: ask <your question>")
-                print("Example: ask What's the latest technology news?")
-
-        elif command == 'sources':
-            self.show_sources()
-
-        elif command == 'clear':
-            self.clear_history()
+        handler = self._commands.get(command)
+        if handler is not None:
+            handler(args)
+            return
 
-        # -------------------------------------------------
-        # ADVANCED FEATURE COMMANDS (NEW!)
-        # -------------------------------------------------
+        # If command not recognized, treat as a question
+        if self.articles:
+            print(f"\nUnknown command '{command}'. Treating as a question...")
+            self.ask_question(user_input)
+        else:
+            print(f"\nUnknown command: '{command}'")
+            print("Type 'help' to see available commands.")
 
-        elif command == 'sentiment':
-            # sentiment OR sentiment <type>
-            self.show_sentiment(args)
+    def _complete_command(self, text: str, state: int):
+        """
+        Tab completion for command words.
 
-        elif command == 'trending':
-            # trending OR trending fast
-            if args and args.lower() == "fast":
-                self.show_trending(use_llm=False)
-            else:
-                self.show_trending(use_llm=True)
+        readline calls this with state = 0, 1, 2, ... and shows
+        every match we return until we return None.
+        """
+        # Only the first word is a command - don't complete arguments
+        if readline.get_line_buffer()[:readline.get_begidx()].strip():
+            return None
 
-        elif command == 'similar':
-            # similar <number>
-            if args:
-                try:
-                    num = int(args)
-                    self.show_similar(num)
-                except ValueError:
-                    print("Usage: similar <number>")
-                    print("Example: similar 3")
-            else:
-                print("Usage: similar <number>")
-                print("Example: similar 3")
-                print("\nThis finds articles similar to the specified article.")
+        matches = [command for command in self._commands if command.startswith(text.lower())]
+        return matches[state] if state < len(matches) else None
 
-        elif command == 'related':
-            self.show_related()
+    def _setup_line_editing(self) -> bool:
+        """
+        Turn on readline: load the saved command history and
+        complete command names with Tab.
 
-        elif command == 'compare':
-            self.show_comparison()
+        RETURNS:
+        --------
+        bool
+            True if readline is available (history should be saved)
+        """
+        if readline is None:
+            return False
 
+        try:
+            readline.read_history_file(HISTORY_FILE)
+        except OSError:
+            pass  # First run - no history yet
+        readline.set_history_length(HISTORY_LENGTH)
+
+        readline.set_completer(self._complete_command)
+        # macOS ships libedit instead of GNU readline, with its own syntax
+        if "libedit" in (readline.__doc__ or ""):
+            readline.parse_and_bind("bind ^I rl_complete")
         else:
-            # If command not recognized, treat as a question
-            if self.articles:
-                print(f"\nUnknown command '{command}'. Treating as a question...")
-                self.ask_question(user_input)
-            else:
-                print(f"\nUnknown command: '{command}'")
-                print("Type 'help' to see available commands.")
+            readline.parse_and_bind("tab: complete")
+        return True
 
     def run(self):
         """
@@ -1542,18 +1957,41 @@ Type 'fetch' to get started!
         3. Processes commands
         4. Repeats until user quits
         """
+        save_history = self._setup_line_editing()
+        try:
+            self._run_loop()
+        finally:
+            if save_history:
+                try:
+                    readline.write_history_file(HISTORY_FILE)
+                except OSError:
+                    pass  # e.g. read-only home directory
+
+    def _run_loop(self):
+        """Show the welcome message, then read and run commands until 'quit'."""
         self.display_welcome()
 
         while self.is_running:
+            # Get user input
             try:
-                # Get user input
                 user_input = input("\n> ").strip()
+            except EOFError:
+                # End of input (Ctrl+D, or the end of a piped-in script)
+                self._cmd_quit(None)
+                break
+            except KeyboardInterrupt:
+                # Handle Ctrl+C gracefully
+                print("\n\nInterrupted. Type 'quit' to exit.")
+                continue
 
-                if user_input:
-                    self.process_command(user_input)
+            if not user_input:
+                continue
+
+            # Only the command itself can fail in unexpected ways
+            try:
+                self.process_command(user_input)
 
             except KeyboardInterrupt:
-                # Handle Ctrl+C gracefully
                 print("\n\nInterrupted. Type 'quit' to exit.")
 
             except Exception as e:
@@ -0,0 +1,331 @@
+# =====================================================
+# ANALYZER MODULE
+# =====================================================
+#
+# This module does ALL the per-article analysis in ONE
+# Claude call: summary, category, keywords, entities and
+# sentiment.
+#
+# WHY COMBINE THEM?
+# -----------------
+# The step-by-step pipeline asks Claude four times about
+# the same article:
+#
+#   summarizer -> categorizer -> tagger -> sentiment
+#      call 1       call 2       call 3     call 4
+#
+# Every call pays a network round trip and re-sends the
+# article text plus a long system prompt. One call that
+# returns everything at once is ~4x fewer requests and
+# far fewer tokens.
+#
+# LANGCHAIN CONCEPT: JSON Output
+# ------------------------------
+# We ask Claude for a single JSON object and let
+# JsonOutputParser turn it into a Python dict (it also
+# copes with the JSON being wrapped in ```json fences).
+#
+# =====================================================
+
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+from langchain_anthropic import ChatAnthropic
+from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.output_parsers import JsonOutputParser
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import (
+    ANTHROPIC_API_KEY,
+    MODEL_NAME,
+    SUMMARY_CONCURRENCY
+)
+from src.categorizer import clean_category, CATEGORIES_STR
+from src.sentiment import VALID_SENTIMENTS
+
+
+# =====================================================
+# THE ANALYSIS PROMPT
+# =====================================================
+#
+# One prompt with the instructions of all four modules.
+# Double braces {{ }} are literal braces in a LangChain
+# template (single braces are placeholders).
+#
+# =====================================================
+
+ANALYSIS_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", """You are an expert news analyst. For each article you:
+1. Summarize it in 3-4 clear, objective sentences (WHO, WHAT, WHEN, WHERE, WHY)
+2. Classify it into exactly ONE of these categories:
+{categories}
+3. Extract 3-5 lowercase keywords and the named people, organizations and locations
+4. Judge its sentiment: positive (good news), negative (bad news) or neutral
+   (factual, balanced). Focus on WHAT is reported, not HOW it's written;
+   when in doubt, lean toward neutral.
+
+You MUST respond with ONLY a JSON object in this EXACT format:
+{{
+  "summary": "...",
+  "category": "Technology",
+  "keywords": ["keyword1", "keyword2", "keyword3"],
+  "people": ["Tim Cook"],
+  "organizations": ["Apple"],
+  "locations": ["California"],
+  "sentiment": "positive",
+  "sentiment_confidence": "high",
+  "sentiment_reason": "One sentence explaining why."
+}}
+
+Rules:
+- Use empty lists when nothing is mentioned
+- Only include entities that are specifically named in the text
+- sentiment_confidence is one of: high, medium, low"""),
+
+    ("human", """Analyze this news article:
+
+TITLE: {title}
+
+CONTENT: {content}""")
+])
+
+
+@lru_cache(maxsize=1)
+def create_llm():
+    """Create Claude LLM for the combined analysis."""
+    if not ANTHROPIC_API_KEY:
+        raise ValueError("ANTHROPIC_API_KEY not found! Check your .env file.")
+
+    return ChatAnthropic(
+        model=MODEL_NAME,
+        temperature=0.1,   # Mostly classification/extraction - keep it consistent
+        max_tokens=800,    # Summary + tags + sentiment in one answer
+        api_key=ANTHROPIC_API_KEY,
+        max_retries=5      # Back off and retry on rate limits (429)
+    )
+
+
+def create_analysis_chain():
+    """
+    Create the analysis chain.
+
+    CHAIN STRUCTURE:
+    ----------------
+    prompt | llm | JsonOutputParser()
+
+    The parser turns Claude's JSON answer into a dict.
+    """
+    return ANALYSIS_PROMPT | create_llm() | JsonOutputParser()
+
+
+def _as_list(value) -> list[str]:
+    """Turn a JSON value into a clean list of strings."""
+    if isinstance(value, str):
+        value = value.split(",")
+    if not isinstance(value, list):
+        return []
+    return [str(item).strip() for item in value if str(item).strip()]
+
+
+def apply_analysis(article: dict, result: dict) -> dict:
+    """
+    Copy Claude's JSON answer into the article, validating each field.
+
+    Produces the same keys (and the same fallbacks) as running the
+    summarizer, categorizer, tagger and sentiment modules one by one.
+
+    PARAMETERS:
+    -----------
+    article : dict
+        The article to update
+
+    result : dict
+        The parsed JSON from Claude
+
+    RETURNS:
+    --------
+    dict
+        The same article with all analysis keys added
+    """
+    article["summary"] = str(result.get("summary") or "").strip() or "No summary available"
+    article["category"] = clean_category(str(result.get("category") or "Other"))
+
+    article["keywords"] = [kw.lower() for kw in _as_list(result.get("keywords"))]
+    article["people"] = _as_list(result.get("people"))
+    article["organizations"] = _as_list(result.get("organizations"))
+    article["locations"] = _as_list(result.get("locations"))
+
+    sentiment = str(result.get("sentiment") or "").strip().lower()
+    confidence = str(result.get("sentiment_confidence") or "").strip().lower()
+    article["sentiment"] = sentiment if sentiment in VALID_SENTIMENTS else "neutral"
+    article["sentiment_confidence"] = confidence if confidence in ("high", "medium", "low") else "medium"
+    article["sentiment_reason"] = (
+        str(result.get("sentiment_reason") or "").strip() or "Unable to determine sentiment"
+    )
+
+    return article
+
+
+def _set_defaults(article: dict, summary: str, reason: str) -> dict:
+    """Fill in every analysis key when Claude can't be asked (or failed)."""
+    article["summary"] = summary
+    article["category"] = "Other"
+    article["keywords"] = []
+    article["people"] = []
+    article["organizations"] = []
+    article["locations"] = []
+    article["sentiment"] = "neutral"
+    article["sentiment_confidence"] = "low"
+    article["sentiment_reason"] = reason
+    return article
+
+
+def analyze_article(article: dict, chain=None) -> dict:
+    """
+    Summarize, categorize, tag and score the sentiment of one article
+    with a single Claude call.
+
+    PARAMETERS:
+    -----------
+    article : dict
+        An article dictionary with keys: title, description, url, source
+
+    chain : optional
+        An analysis chain to reuse (creates one if not given)
+
+    RETURNS:
+    --------
+    dict
+        The article with summary, category, keywords, people,
+        organizations, locations, sentiment, sentiment_confidence
+        and sentiment_reason added
+
+    EXAMPLE:
+    --------
+    >>> result = analyze_article({"title": "Apple Stock Surges", "description": "..."})
+    >>> print(result["category"], result["sentiment"])
+    Business positive
+    """
+    content = article.get("description", "")
+    title = article.get("title", "Untitled")
+
+    if not content or len(content.strip()) < 50:
+        return _set_defaults(
+            article,
+            "Summary unavailable - article content too short.",
+            "Insufficient content for analysis"
+        )
+
+    if chain is None:
+        chain = create_analysis_chain()
+
+    print(f"  Analyzing: {title[:50]}...")
+
+    result = chain.invoke({
+        "categories": CATEGORIES_STR,
+        "title": title,
+        "content": content
+    })
+
+    if not isinstance(result, dict):
+        result = {}
+
+    return apply_analysis(article, result)
+
+
+def analyze_article_safely(article: dict, chain=None) -> dict:
+    """
+    Like analyze_article(), but never raises.
+
+    If Claude fails (network error, unparseable answer...), the
+    article gets the same fallback values the individual modules
+    use, with the error in its summary.
+    """
+    try:
+        return analyze_article(article, chain)
+    except Exception as e:
+        print(f"  Error analyzing {article.get('title', 'Untitled')[:30]}: {e}")
+        return _set_defaults(
+            article,
+            f"Error: Could not summarize - {str(e)}",
+            f"Error during analysis: {str(e)}"
+        )
+
+
+def analyze_articles(
+    articles: list[dict],
+    max_workers: int = SUMMARY_CONCURRENCY
+) -> list[dict]:
+    """
+    Analyze multiple articles, several Claude calls at a time.
+
+    This replaces the summarize -> categorize -> tag -> sentiment
+    steps: one call per article instead of four, and (like
+    summarize_articles) up to max_workers calls in flight at once.
+
+    PARAMETERS:
+    -----------
+    articles : list[dict]
+        List of freshly fetched articles
+
+    max_workers : int
+        Maximum Claude calls in flight at once (default: from config)
+
+    RETURNS:
+    --------
+    list[dict]
+        Same articles (same order), fully analyzed
+    """
+
+    print("\n" + "="*50)
+    print("ANALYZING ARTICLES WITH CLAUDE")
+    print("="*50)
+
+    chain = create_analysis_chain()
+
+    def analyze_one(article: dict) -> dict:
+        return analyze_article_safely(article, chain)
+
+    # map() hands back results in the original order
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        analyzed = list(executor.map(analyze_one, articles))
+
+    print("\n" + "="*50)
+    print(f"COMPLETED: {len(analyzed)} articles analyzed")
+    print("="*50)
+
+    return analyzed
+
+
+# =====================================================
+# TEST CODE
+# =====================================================
+
+if __name__ == "__main__":
+    print("\n" + "="*60)
+    print("TESTING ANALYZER")
+    print("="*60)
+
+    test_article = {
+        "title": "Apple CEO Tim Cook Announces New AI Features at WWDC in California",
+        "description": """Apple's CEO Tim Cook unveiled groundbreaking AI capabilities
+        at the Worldwide Developers Conference in Cupertino, California. The new
+        features, developed in partnership with OpenAI, will be available on iPhone,
+        iPad, and Mac devices.""",
+        "url": "https://example.com/apple-ai",
+        "source": "Test News"
+    }
+
+    result = analyze_articles([test_article])[0]
+
+    print("\n--- Result ---")
+    print(f"Summary:   {result['summary']}")
+    print(f"Category:  {result['category']}")
+    print(f"Keywords:  {', '.join(result['keywords'])}")
+    print(f"People:    {', '.join(result['people'])}")
+    print(f"Orgs:      {', '.join(result['organizations'])}")
+    print(f"Locations: {', '.join(result['locations'])}")
+    print(f"Sentiment: {result['sentiment']} ({result['sentiment_confidence']})")
+    print(f"Reason:    {result['sentiment_reason']}")
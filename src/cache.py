@@ -0,0 +1,119 @@
+# =====================================================
+# ANALYSIS CACHE MODULE
+# =====================================================
+#
+# This module remembers articles we've already analyzed.
+#
+# THE PROBLEM:
+# News feeds change slowly. Fetch twice in an hour and
+# most articles are the SAME ones - but without a cache
+# we'd pay Claude to summarize, categorize, tag and score
+# every one of them again.
+#
+# THE SOLUTION:
+# After analyzing an article we save the result to disk,
+# in a file named after a hash of the article's URL:
+#
+#   https://bbc.co.uk/news/123  ->  output/.cache/3f9a...c1.json
+#
+# Next time we see that URL, we just load the file.
+# Files older than ANALYSIS_CACHE_TTL (24h) are ignored,
+# so stories that get updated are eventually re-analyzed.
+#
+# Any string works as the key, not just a URL - the
+# categorizer uses it to remember Claude's raw answers,
+# keyed by the prompt it sent.
+#
+# =====================================================
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Optional
+
+# Import settings
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import ANALYSIS_CACHE_DIR, ANALYSIS_CACHE_TTL
+
+
+def _cache_path(url: str) -> Path:
+    """
+    Work out the cache file for an article URL.
+
+    URLs contain characters that aren't allowed in file names
+    (/, ?, :), so we use a hash of the URL instead. blake2b is
+    fast, and 16 bytes (32 hex characters) is plenty to keep
+    different URLs apart.
+    """
+    digest = hashlib.blake2b(url.encode("utf-8"), digest_size=16).hexdigest()
+    return Path(ANALYSIS_CACHE_DIR) / f"{digest}.json"
+
+
+def load(url: str) -> Optional[dict]:
+    """
+    Load a previously analyzed article.
+
+    PARAMETERS:
+    -----------
+    url : str
+        The article's URL (or any other unique key)
+
+    RETURNS:
+    --------
+    dict or None
+        The cached article, or None if it isn't cached,
+        the entry is older than ANALYSIS_CACHE_TTL, or the
+        file can't be read
+
+    EXAMPLE:
+    --------
+    >>> article = load("https://example.com/story")
+    >>> if article is None:
+    ...     print("Not cached - ask Claude")
+    """
+    if not url:
+        return None
+
+    path = _cache_path(url)
+    try:
+        # Too old? Treat it as missing
+        if time.time() - path.stat().st_mtime > ANALYSIS_CACHE_TTL:
+            return None
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        # Not cached (FileNotFoundError) or a damaged file
+        return None
+
+
+def store(url: str, article: dict) -> None:
+    """
+    Save an analyzed article so later fetches can skip it.
+
+    PARAMETERS:
+    -----------
+    url : str
+        The article's URL (or any other unique key)
+
+    article : dict
+        The fully analyzed article
+    """
+    if not url:
+        return
+
+    path = _cache_path(url)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Write to a temporary file, then rename it into place, so a
+        # crash halfway through never leaves a half-written entry
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(article, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except (OSError, TypeError, ValueError) as e:
+        # Caching is only an optimization - never fail the fetch over it
+        print(f"  Could not cache article: {e}")
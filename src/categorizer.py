@@ -12,6 +12,12 @@
 #
 # =====================================================
 
+import re
+from collections import defaultdict
+from functools import lru_cache
+from typing import Optional
+
+import numpy as np
 from langchain_anthropic import ChatAnthropic
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import StrOutputParser
@@ -20,7 +26,18 @@ from langchain_core.output_parsers import StrOutputParser
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from config import ANTHROPIC_API_KEY, MODEL_NAME, TEMPERATURE, CATEGORIES
+from config import (
+    ANTHROPIC_API_KEY,
+    MODEL_NAME,
+    TEMPERATURE,
+    CATEGORIES,
+    CATEGORIZER,
+    ZERO_SHOT_MODEL,
+    EMBEDDING_CATEGORY_MIN_SCORE,
+    SUMMARY_CONCURRENCY
+)
+from src.embeddings import embed_texts
+from src import cache
 
 
 # =====================================================
@@ -95,6 +112,7 @@ Categories:""")
 ])
 
 
+@lru_cache(maxsize=1)
 def create_llm():
     """Create Claude LLM instance."""
     if not ANTHROPIC_API_KEY:
@@ -108,10 +126,15 @@ def create_llm():
     )
 
 
+@lru_cache(maxsize=1)
 def create_categorize_chain():
     """
     Create a chain for categorizing articles.
 
+    Built once and reused (chains can be shared between calls and
+    threads), so every article goes through the same Claude client
+    and its pool of open connections.
+
     WHY TEMPERATURE = 0.1?
     ----------------------
     For classification, we want CONSISTENT results.
@@ -128,6 +151,12 @@ def create_categorize_chain():
     return chain
 
 
+# Lowercased category names, worked out once instead of on every call
+#   "technology" -> "Technology"
+_CATEGORY_MAP = {category.lower(): category for category in CATEGORIES}
+_CATEGORY_LOWERS = [(category.lower(), category) for category in CATEGORIES]
+
+
 def clean_category(raw_category: str) -> str:
     """
     Clean up Claude's response to get just the category.
@@ -155,20 +184,131 @@ def clean_category(raw_category: str) -> str:
     # Remove whitespace and common punctuation
     cleaned = raw_category.strip().strip(".,!?\"'")
 
-    # Check if it matches any of our categories (case-insensitive)
-    for category in CATEGORIES:
-        if category.lower() == cleaned.lower():
-            return category  # Return the properly-cased version
+    cleaned_lower = cleaned.lower()
+
+    # Exact match (case-insensitive) - one dictionary lookup
+    category = _CATEGORY_MAP.get(cleaned_lower)
+    if category:
+        return category  # Return the properly-cased version
 
-        # Also check if the category is contained in the response
-        # This handles "The category is Technology" → "Technology"
-        if category.lower() in cleaned.lower():
+    # Also check if the category is contained in the response
+    # This handles "The category is Technology" → "Technology"
+    for category_lower, category in _CATEGORY_LOWERS:
+        if category_lower in cleaned_lower:
             return category
 
     # If no match found, return "Other"
     return "Other"
 
 
+# The categories list never changes, so build the prompt text once
+CATEGORIES_STR = "\n".join(f"- {cat}" for cat in CATEGORIES)
+
+# The first couple of sentences are enough to pick a category, so
+# only this much of the summary is sent - fewer tokens, faster calls
+CLASSIFIER_INPUT_CHAR_LIMIT = 400
+
+
+def _batch_inputs(articles: list[dict]) -> tuple[list[dict], list[dict], list[dict]]:
+    """
+    Prompt inputs for chain.batch().
+
+    RETURNS:
+    --------
+    (articles that have text to categorize, one prompt input for each,
+     articles with no text - these aren't sent to Claude)
+    """
+    to_send = []
+    inputs = []
+    skipped = []
+    for article in articles:
+        summary = article.get("summary") or article.get("description", "")
+        if summary:
+            to_send.append(article)
+            inputs.append({
+                "categories": CATEGORIES_STR,
+                "title": article.get("title", "Untitled"),
+                "summary": summary[:CLASSIFIER_INPUT_CHAR_LIMIT]
+            })
+        else:
+            skipped.append(article)
+    return to_send, inputs, skipped
+
+
+# ----- RESPONSE CACHE -----
+# The same story shows up on every fetch until it drops out of the
+# feed, and Claude gives the same answer for the same title and
+# summary. So we keep each raw answer on disk (see src/cache.py),
+# keyed by a hash of the prompt inputs.
+#
+# The key also holds the model name and a version tag - bump the
+# tag whenever a prompt changes so old answers aren't reused.
+CATEGORIZE_CACHE_TAG = "categorize-v1"
+MULTI_CATEGORIZE_CACHE_TAG = "multi-categorize-v1"
+
+
+def _response_cache_key(cache_tag: str, inputs: dict) -> str:
+    """Cache key for one prompt: tag, model, title and summary."""
+    return "\0".join((cache_tag, MODEL_NAME, inputs["title"], inputs["summary"]))
+
+
+def _invoke_cached(chain, inputs: dict, cache_tag: str) -> str:
+    """chain.invoke(), but reuse Claude's answer if we've asked before."""
+    key = _response_cache_key(cache_tag, inputs)
+    cached = cache.load(key)
+    if cached is not None:
+        return cached["response"]
+
+    response = chain.invoke(inputs)
+    cache.store(key, {"response": response})
+    return response
+
+
+def _run_batch(create_chain, inputs: list[dict], max_workers: int, cache_tag: str) -> list:
+    """
+    Send every input through the chain with ONE chain.batch() call.
+
+    batch() runs up to max_workers Claude calls at once and returns
+    the answers in input order. With return_exceptions=True a failed
+    call gives back its error instead of stopping the whole batch.
+
+    Inputs answered on an earlier run come from the response cache
+    and aren't sent at all.
+    """
+    keys = [_response_cache_key(cache_tag, item) for item in inputs]
+    responses = [None] * len(inputs)
+    missing = []
+    for i, key in enumerate(keys):
+        cached = cache.load(key)
+        if cached is None:
+            missing.append(i)
+        else:
+            responses[i] = cached["response"]
+
+    if not missing:
+        return responses
+
+    try:
+        chain = create_chain()
+    except Exception as e:
+        # e.g. no API key - every uncached article fails the same way
+        for i in missing:
+            responses[i] = e
+        return responses
+
+    answers = chain.batch(
+        [inputs[i] for i in missing],
+        config={"max_concurrency": max_workers},
+        return_exceptions=True
+    )
+    for i, answer in zip(missing, answers):
+        responses[i] = answer
+        if not isinstance(answer, Exception):
+            cache.store(keys[i], {"response": answer})
+
+    return responses
+
+
 def categorize_article(article: dict) -> dict:
     """
     Categorize a single article.
@@ -188,7 +328,7 @@ def categorize_article(article: dict) -> dict:
     title = article.get("title", "Untitled")
 
     # Use summary if available, otherwise use description
-    summary = article.get("summary", article.get("description", ""))
+    summary = article.get("summary") or article.get("description", "")
 
     if not summary:
         article["category"] = "Other"
@@ -196,15 +336,12 @@ def categorize_article(article: dict) -> dict:
 
     print(f"  Categorizing: {title[:40]}...")
 
-    # Create the categories string for the prompt
-    categories_str = "\n".join(f"- {cat}" for cat in CATEGORIES)
-
-    # Call the chain
-    raw_response = chain.invoke({
-        "categories": categories_str,
+    # Call the chain (or reuse a cached answer)
+    raw_response = _invoke_cached(chain, {
+        "categories": CATEGORIES_STR,
         "title": title,
-        "summary": summary
-    })
+        "summary": summary[:CLASSIFIER_INPUT_CHAR_LIMIT]
+    }, CATEGORIZE_CACHE_TAG)
 
     # Clean up the response
     category = clean_category(raw_response)
@@ -215,43 +352,296 @@ def categorize_article(article: dict) -> dict:
     return article
 
 
-def categorize_articles(articles: list[dict]) -> list[dict]:
+def categorize_articles(
+    articles: list[dict],
+    max_workers: int = SUMMARY_CONCURRENCY
+) -> list[dict]:
     """
     Categorize multiple articles.
 
+    All the articles go to the chain in ONE chain.batch() call,
+    which sends up to max_workers Claude requests at once.
+
     PARAMETERS:
     -----------
     articles : list[dict]
         List of articles (should already have summaries)
 
+    max_workers : int
+        Maximum Claude calls in flight at once (default: from config)
+
     RETURNS:
     --------
     list[dict]
         Same articles with 'category' key added to each
+
+    NOTE:
+    -----
+    With CATEGORIZER = "zero-shot" or "embedding" in config.py (and the
+    matching package installed), this uses one of the local classifiers
+    below instead of Claude.
     """
+    if CATEGORIZER == "zero-shot" and get_zero_shot_classifier() is not None:
+        return categorize_articles_zero_shot(articles)
+
+    if CATEGORIZER == "embedding" and get_category_embeddings() is not None:
+        return categorize_articles_embedding(articles)
+
     print("\n" + "="*50)
     print("CATEGORIZING ARTICLES")
     print("="*50)
 
-    categorized = []
-    total = len(articles)
+    to_send, inputs, skipped = _batch_inputs(articles)
+    for article in skipped:
+        article["category"] = "Other"
 
-    for i, article in enumerate(articles, 1):
-        print(f"\n[{i}/{total}]", end="")
+    responses = _run_batch(
+        create_categorize_chain, inputs, max_workers, CATEGORIZE_CACHE_TAG
+    )
 
-        try:
-            categorized_article = categorize_article(article)
-            categorized.append(categorized_article)
-        except Exception as e:
-            print(f"  Error: {e}")
+    for article, response in zip(to_send, responses):
+        title = article.get("title", "Untitled")
+        if isinstance(response, Exception):
+            print(f"  Error categorizing {title[:30]}: {response}")
             article["category"] = "Other"
-            categorized.append(article)
+        else:
+            article["category"] = clean_category(response)
+            print(f"  {title[:40]}... -> {article['category']}")
+
+    print("\n" + "="*50)
+    print("CATEGORIZATION COMPLETE")
+    print("="*50)
+
+    return articles
+
+
+# =====================================================
+# ZERO-SHOT CATEGORIZATION (Local Model, No API Calls)
+# =====================================================
+#
+# Asking Claude means one API call per article. But our
+# category list is FIXED, so a small local model can do
+# the job instead.
+#
+# WHAT IS ZERO-SHOT CLASSIFICATION?
+# The model was never trained on our categories. Instead,
+# for each category it checks whether the article text
+# supports the sentence "This example is about <category>."
+# and picks the category it believes most.
+#
+# WHY IT'S FASTER:
+# - No network round trips (runs on your CPU/GPU)
+# - All articles go through the model in batches
+# - The model is loaded ONCE and reused
+#
+# Requires the optional `transformers` and `torch` packages.
+#
+# =====================================================
+
+@lru_cache(maxsize=1)
+def get_zero_shot_classifier():
+    """
+    Load the zero-shot classification model once and reuse it.
+
+    RETURNS:
+    --------
+    transformers.Pipeline or None
+        The classifier, or None if transformers isn't installed
+    """
+    try:
+        import torch
+        from transformers import pipeline
+    except ImportError:
+        print("  transformers/torch not installed - zero-shot categorizer unavailable")
+        return None
+
+    print(f"  Loading zero-shot model {ZERO_SHOT_MODEL}...")
+    return pipeline(
+        "zero-shot-classification",
+        model=ZERO_SHOT_MODEL,
+        device=0 if torch.cuda.is_available() else -1  # GPU if we have one
+    )
+
+
+def categorize_articles_zero_shot(articles: list[dict], batch_size: int = 16) -> list[dict]:
+    """
+    Categorize articles with the local zero-shot classifier.
+
+    PARAMETERS:
+    -----------
+    articles : list[dict]
+        List of articles (should already have summaries)
+
+    batch_size : int
+        How many articles the model processes at once (default: 16)
+
+    RETURNS:
+    --------
+    list[dict]
+        Same articles with 'category' key added to each
+    """
+    classifier = get_zero_shot_classifier()
+    if classifier is None:
+        raise RuntimeError("Zero-shot categorizer needs: pip install transformers torch")
+
+    print("\n" + "="*50)
+    print("CATEGORIZING ARTICLES (Zero-Shot)")
+    print("="*50)
+
+    # Articles without any text can't be classified
+    to_classify = []
+    for article in articles:
+        if article.get("summary") or article.get("description", ""):
+            to_classify.append(article)
+        else:
+            article["category"] = "Other"
+
+    if to_classify:
+        texts = [
+            f"{a.get('title', '')}. {a.get('summary') or a.get('description', '')}"
+            for a in to_classify
+        ]
+
+        # One call for all articles; the pipeline batches them internally
+        results = classifier(
+            texts,
+            candidate_labels=CATEGORIES,
+            multi_label=False,
+            batch_size=batch_size
+        )
+
+        for article, result in zip(to_classify, results):
+            # Labels come back sorted by score, best first
+            article["category"] = result["labels"][0]
+            print(f"  {article.get('title', 'Untitled')[:40]}... -> {article['category']}")
+
+    print("="*50)
+    print("CATEGORIZATION COMPLETE")
+    print("="*50)
+
+    return articles
+
+
+# =====================================================
+# EMBEDDING CATEGORIZATION (Nearest Category, No API Calls)
+# =====================================================
+#
+# An even cheaper local option than zero-shot.
+#
+# HOW IT WORKS:
+# 1. Embed each category ONCE (9 vectors, cached)
+# 2. Embed each article (title + summary)
+# 3. The category whose vector is most similar wins
+#
+# All vectors are unit length, so "most similar" is just
+# the biggest dot product. For N articles that's a single
+# matrix multiplication:
+#
+#   (N, dim) @ (dim, 9) -> (N, 9) scores -> argmax per row
+#
+# If even the best score is low (below EMBEDDING_CATEGORY_MIN_SCORE),
+# the article doesn't clearly match any category, so we ask
+# Claude about just those few articles.
+#
+# Requires the optional `sentence-transformers` package
+# (see src/embeddings.py).
+#
+# =====================================================
+
+@lru_cache(maxsize=1)
+def get_category_embeddings() -> Optional[np.ndarray]:
+    """
+    Embed every category once and reuse the result.
+
+    Each category is embedded as a short sentence ("News about
+    Technology.") - that matches article text better than a
+    single word does.
+
+    RETURNS:
+    --------
+    np.ndarray or None
+        A (len(CATEGORIES), dim) array, one row per category,
+        or None if sentence-transformers isn't installed
+    """
+    return embed_texts([f"News about {cat}." for cat in CATEGORIES])
+
+
+def categorize_articles_embedding(articles: list[dict]) -> list[dict]:
+    """
+    Categorize articles by their nearest category embedding.
+
+    PARAMETERS:
+    -----------
+    articles : list[dict]
+        List of articles (should already have summaries)
+
+    RETURNS:
+    --------
+    list[dict]
+        Same articles with 'category' key added to each
+    """
+    category_vectors = get_category_embeddings()
+    if category_vectors is None:
+        raise RuntimeError("Embedding categorizer needs: pip install sentence-transformers")
 
     print("\n" + "="*50)
+    print("CATEGORIZING ARTICLES (Embeddings)")
+    print("="*50)
+
+    # Articles without any text can't be classified
+    to_classify = []
+    for article in articles:
+        if article.get("summary") or article.get("description", ""):
+            to_classify.append(article)
+        else:
+            article["category"] = "Other"
+
+    if to_classify:
+        texts = [
+            f"{a.get('title', '')}. {a.get('summary') or a.get('description', '')}"
+            for a in to_classify
+        ]
+
+        # One batch for the articles, one matrix multiply for all scores
+        article_vectors = embed_texts(texts)
+        scores = article_vectors @ category_vectors.T    # (N, 9)
+        best = scores.argmax(axis=1)
+        best_scores = scores.max(axis=1)
+
+        unclear = []
+        for article, index, score in zip(to_classify, best, best_scores):
+            article["category"] = CATEGORIES[int(index)]
+            print(f"  {article.get('title', 'Untitled')[:40]}... -> {article['category']}")
+            if score < EMBEDDING_CATEGORY_MIN_SCORE:
+                unclear.append(article)
+
+        if unclear and ANTHROPIC_API_KEY:
+            _ask_claude_about(unclear)
+
+    print("="*50)
     print("CATEGORIZATION COMPLETE")
     print("="*50)
 
-    return categorized
+    return articles
+
+
+def _ask_claude_about(articles: list[dict]) -> None:
+    """
+    Re-categorize articles the embeddings weren't sure about with
+    Claude (one batch). If a call fails, the article keeps its
+    embedding category.
+    """
+    print(f"\n  Asking Claude about {len(articles)} unclear article(s)...")
+
+    _, inputs, _ = _batch_inputs(articles)
+    responses = _run_batch(
+        create_categorize_chain, inputs, SUMMARY_CONCURRENCY, CATEGORIZE_CACHE_TAG
+    )
+
+    for article, response in zip(articles, responses):
+        if not isinstance(response, Exception):
+            article["category"] = clean_category(response)
+            print(f"  {article.get('title', 'Untitled')[:40]}... -> {article['category']} (Claude)")
 
 
 # =====================================================
@@ -263,23 +653,44 @@ def categorize_articles(articles: list[dict]) -> list[dict]:
 #
 # =====================================================
 
-def create_multi_categorize_chain():
-    """
-    Create a chain for multi-category classification.
+@lru_cache(maxsize=1)
+def create_multi_llm():
+    """Create Claude LLM instance for multi-category classification."""
+    if not ANTHROPIC_API_KEY:
+        raise ValueError("ANTHROPIC_API_KEY not found! Check your .env file.")
 
-    This chain returns PRIMARY and SECONDARY categories.
-    """
-    llm = ChatAnthropic(
+    return ChatAnthropic(
         model=MODEL_NAME,
         temperature=0.1,
         max_tokens=100,  # Slightly more for multiple categories
         api_key=ANTHROPIC_API_KEY
     )
+
+
+@lru_cache(maxsize=1)
+def create_multi_categorize_chain():
+    """
+    Create a chain for multi-category classification.
+
+    This chain returns PRIMARY and SECONDARY categories.
+    Built once and reused, like create_categorize_chain().
+    """
+    llm = create_multi_llm()
     parser = StrOutputParser()
     chain = MULTI_CATEGORIZE_PROMPT | llm | parser
     return chain
 
 
+# Matches one line of Claude's answer, like "SECONDARY: Business, Science".
+# Compiled once when the module loads, then reused for every article.
+#   group(1) = PRIMARY or SECONDARY (any capitalization)
+#   group(2) = everything after the colon
+_MULTI_LINE_RE = re.compile(
+    r"^[^\S\n]*(PRIMARY|SECONDARY)[^:\n]*:(.*)$",
+    re.IGNORECASE | re.MULTILINE
+)
+
+
 def parse_multi_category_response(response: str) -> dict:
     """
     Parse Claude's multi-category response.
@@ -301,37 +712,24 @@ def parse_multi_category_response(response: str) -> dict:
         "secondary": []
     }
 
-    lines = response.strip().split("\n")
-
-    for line in lines:
-        line = line.strip()
+    # Find every "PRIMARY: ..." / "SECONDARY: ..." line in one pass
+    for match in _MULTI_LINE_RE.finditer(response):
+        field = match.group(1).upper()
+        value = match.group(2).strip()
 
-        # Parse PRIMARY category
-        if line.upper().startswith("PRIMARY"):
+        if field == "PRIMARY":
             # "PRIMARY: Technology" → "Technology"
-            parts = line.split(":", 1)
-            if len(parts) > 1:
-                primary = parts[1].strip()
-                # Clean and validate
-                result["primary"] = clean_category(primary)
-
-        # Parse SECONDARY categories
-        elif line.upper().startswith("SECONDARY"):
-            parts = line.split(":", 1)
-            if len(parts) > 1:
-                secondary_str = parts[1].strip()
-
-                # Handle "None" case
-                if secondary_str.lower() == "none":
-                    result["secondary"] = []
-                else:
-                    # "Business, Science" → ["Business", "Science"]
-                    secondary_list = [s.strip() for s in secondary_str.split(",")]
-                    # Clean each category
-                    result["secondary"] = [
-                        clean_category(s) for s in secondary_list
-                        if clean_category(s) != "Other"  # Don't include "Other" in secondary
-                    ]
+            result["primary"] = clean_category(value)
+
+        # Handle "None" case
+        elif value.lower() == "none":
+            result["secondary"] = []
+
+        else:
+            # "Business, Science" → ["Business", "Science"], cleaned,
+            # without "Other" (it doesn't belong in secondary)
+            cleaned = (clean_category(s) for s in value.split(","))
+            result["secondary"] = [c for c in cleaned if c != "Other"]
 
     return result
 
@@ -364,7 +762,7 @@ def categorize_article_multi(article: dict) -> dict:
     chain = create_multi_categorize_chain()
 
     title = article.get("title", "Untitled")
-    summary = article.get("summary", article.get("description", ""))
+    summary = article.get("summary") or article.get("description", "")
 
     if not summary:
         article["category"] = "Other"
@@ -373,14 +771,12 @@ def categorize_article_multi(article: dict) -> dict:
 
     print(f"  Categorizing: {title[:40]}...")
 
-    categories_str = "\n".join(f"- {cat}" for cat in CATEGORIES)
-
-    # Call the chain
-    raw_response = chain.invoke({
-        "categories": categories_str,
+    # Call the chain (or reuse a cached answer)
+    raw_response = _invoke_cached(chain, {
+        "categories": CATEGORIES_STR,
         "title": title,
-        "summary": summary
-    })
+        "summary": summary[:CLASSIFIER_INPUT_CHAR_LIMIT]
+    }, MULTI_CATEGORIZE_CACHE_TAG)
 
     # Parse the response
     parsed = parse_multi_category_response(raw_response)
@@ -396,53 +792,63 @@ def categorize_article_multi(article: dict) -> dict:
     return article
 
 
-def categorize_articles_multi(articles: list[dict]) -> list[dict]:
+def categorize_articles_multi(
+    articles: list[dict],
+    max_workers: int = SUMMARY_CONCURRENCY
+) -> list[dict]:
     """
     Categorize multiple articles with multi-category support.
+
+    Sent as one chain.batch() call, like categorize_articles.
     """
     print("\n" + "="*50)
     print("CATEGORIZING ARTICLES (Multi-Category)")
     print("="*50)
 
-    categorized = []
-    total = len(articles)
+    to_send, inputs, skipped = _batch_inputs(articles)
+    for article in skipped:
+        article["category"] = "Other"
+        article["secondary_categories"] = []
 
-    for i, article in enumerate(articles, 1):
-        print(f"\n[{i}/{total}]", end="")
+    responses = _run_batch(
+        create_multi_categorize_chain, inputs, max_workers, MULTI_CATEGORIZE_CACHE_TAG
+    )
 
-        try:
-            categorized_article = categorize_article_multi(article)
-            categorized.append(categorized_article)
-        except Exception as e:
-            print(f"  Error: {e}")
+    for article, response in zip(to_send, responses):
+        title = article.get("title", "Untitled")
+        if isinstance(response, Exception):
+            print(f"  Error categorizing {title[:30]}: {response}")
             article["category"] = "Other"
             article["secondary_categories"] = []
-            categorized.append(article)
+        else:
+            parsed = parse_multi_category_response(response)
+            article["category"] = parsed["primary"]
+            article["secondary_categories"] = parsed["secondary"]
+            secondary_str = ", ".join(parsed["secondary"]) if parsed["secondary"] else "None"
+            print(f"  {title[:40]}... -> {parsed['primary']} (secondary: {secondary_str})")
 
     print("\n" + "="*50)
     print("CATEGORIZATION COMPLETE")
     print("="*50)
 
-    return categorized
+    return articles
 
 
 def display_multi_categories(articles: list[dict]) -> None:
     """
     Display articles with their primary and secondary categories.
     """
-    print("\n" + "="*60)
-    print("ARTICLES WITH MULTIPLE CATEGORIES")
-    print("="*60)
+    # Collect the lines and print them in one go - one write to
+    # the terminal instead of three per article
+    lines = ["\n" + "="*60, "ARTICLES WITH MULTIPLE CATEGORIES", "="*60]
 
     for article in articles:
-        print(f"\n📰 {article['title'][:50]}...")
-        print(f"   Primary:   {article.get('category', 'Other')}")
-
         secondary = article.get('secondary_categories', [])
-        if secondary:
-            print(f"   Secondary: {', '.join(secondary)}")
-        else:
-            print(f"   Secondary: None")
+        lines.append(f"\n📰 {article['title']:.50}...")
+        lines.append(f"   Primary:   {article.get('category', 'Other')}")
+        lines.append(f"   Secondary: {', '.join(secondary) if secondary else 'None'}")
+
+    print("\n".join(lines))
 
 
 def group_by_category(articles: list[dict]) -> dict[str, list[dict]]:
@@ -469,18 +875,15 @@ def group_by_category(articles: list[dict]) -> dict[str, list[dict]]:
     >>> print(len(grouped['Technology']))
     5
     """
-    grouped = {}
+    # defaultdict creates the empty list the first time we see a category
+    grouped = defaultdict(list)
 
     for article in articles:
-        category = article.get("category", "Other")
+        grouped[article.get("category", "Other")].append(article)
 
-        # Create the list if this is the first article in this category
-        if category not in grouped:
-            grouped[category] = []
-
-        grouped[category].append(article)
-
-    return grouped
+    # Hand back a plain dict, so looking up a missing category
+    # doesn't quietly add it
+    return dict(grouped)
 
 
 def display_by_category(articles: list[dict]) -> None:
@@ -489,17 +892,18 @@ def display_by_category(articles: list[dict]) -> None:
     """
     grouped = group_by_category(articles)
 
-    print("\n" + "="*60)
-    print("ARTICLES BY CATEGORY")
-    print("="*60)
+    # Collect the lines and print them in one go (see above)
+    lines = ["\n" + "="*60, "ARTICLES BY CATEGORY", "="*60]
 
     for category, category_articles in grouped.items():
-        print(f"\n📁 {category.upper()} ({len(category_articles)} articles)")
-        print("-"*40)
+        lines.append(f"\n📁 {category.upper()} ({len(category_articles)} articles)")
+        lines.append("-"*40)
 
         for article in category_articles:
-            print(f"  • {article['title'][:50]}...")
-            print(f"    Source: {article['source']}")
+            lines.append(f"  • {article['title']:.50}...")
+            lines.append(f"    Source: {article['source']}")
+
+    print("\n".join(lines))
 
 
 # =====================================================
@@ -38,6 +38,9 @@
 #
 # =====================================================
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+
 from langchain_anthropic import ChatAnthropic
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import StrOutputParser
@@ -45,7 +48,7 @@ from langchain_core.output_parsers import StrOutputParser
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from config import ANTHROPIC_API_KEY, MODEL_NAME
+from config import ANTHROPIC_API_KEY, MODEL_NAME, SUMMARY_CONCURRENCY
 
 # Import our similarity module for grouping related articles
 from src.similarity import calculate_combined_similarity
@@ -270,6 +273,7 @@ Provide your analysis:""")
 ])
 
 
+@lru_cache(maxsize=1)
 def create_comparison_llm():
     """
     Create Claude LLM for source comparison.
@@ -507,13 +511,16 @@ def compare_sources(articles: list[dict]) -> dict:
     return result
 
 
-def compare_all_stories(articles: list[dict]) -> list[dict]:
+def compare_all_stories(
+    articles: list[dict],
+    max_workers: int = SUMMARY_CONCURRENCY
+) -> list[dict]:
     """
     Find all multi-source stories and compare them.
 
     This is the main function that:
     1. Groups articles by story
-    2. Compares each story across sources
+    2. Compares each story across sources (several at once)
     3. Returns all comparisons
 
     PARAMETERS:
@@ -521,6 +528,9 @@ def compare_all_stories(articles: list[dict]) -> list[dict]:
     articles : list[dict]
         All articles (will find same-story groups)
 
+    max_workers : int
+        Maximum Claude calls in flight at once (default: from config)
+
     RETURNS:
     --------
     list[dict]
@@ -543,18 +553,32 @@ def compare_all_stories(articles: list[dict]) -> list[dict]:
     print(f"   Found {len(stories)} stories with multiple sources")
 
     # Step 2: Compare each story
-    comparisons = []
+    # Each comparison is its own Claude call and the stories don't
+    # depend on each other, so several calls run at once
+    results = [None] * len(stories)     # kept in story order
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(compare_sources, story["articles"]): i
+            for i, story in enumerate(stories)
+        }
+
+        # Report each story as its comparison finishes
+        for done, future in enumerate(as_completed(futures), 1):
+            story = stories[futures[future]]
+            print(f"\n[{done}/{len(stories)}] Analyzed: {story['story_title'][:40]}...")
+            print(f"   Sources: {', '.join(story['sources'])}")
 
-    for i, story in enumerate(stories, 1):
-        print(f"\n[{i}/{len(stories)}] Analyzing: {story['story_title'][:40]}...")
-        print(f"   Sources: {', '.join(story['sources'])}")
+            try:
+                comparison = future.result()
+            except Exception as e:
+                print(f"   Error comparing: {e}")
+                continue
 
-        try:
-            comparison = compare_sources(story["articles"])
             comparison["story_title"] = story["story_title"]
-            comparisons.append(comparison)
-        except Exception as e:
-            print(f"   Error comparing: {e}")
+            results[futures[future]] = comparison
+
+    comparisons = [c for c in results if c is not None]
 
     print("\n" + "=" * 50)
     print("COMPARISON COMPLETE")
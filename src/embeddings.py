@@ -0,0 +1,111 @@
+# =====================================================
+# SENTENCE EMBEDDINGS MODULE
+# =====================================================
+#
+# This module turns text into vectors ("embeddings").
+#
+# WHAT IS AN EMBEDDING?
+# An embedding is a list of numbers that captures the
+# MEANING of a piece of text. Texts that mean the same
+# thing end up with similar vectors, even if they use
+# different words:
+#
+#   "What is the capital of France?"  -> [0.12, -0.40, ...]
+#   "France's capital?"               -> [0.11, -0.38, ...]
+#
+# HOW WE COMPARE THEM:
+# We normalize every vector to length 1. Then the dot
+# product of two vectors is their "cosine similarity":
+#   1.0 = same meaning, 0.0 = unrelated
+#
+# The model runs locally (no API calls, no cost).
+# It needs the optional `sentence-transformers` package;
+# without it, embed_texts() returns None and callers
+# fall back to working without embeddings.
+#
+# =====================================================
+
+from functools import lru_cache
+from typing import Optional
+
+import numpy as np
+
+# Import settings
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import EMBEDDING_BACKEND, EMBEDDING_MODEL
+
+# Pre-quantized int8 weights published alongside the model (for AVX-512 VNNI CPUs)
+ONNX_INT8_FILE = "onnx/model_qint8_avx512_vnni.onnx"
+
+
+@lru_cache(maxsize=1)
+def get_embedder():
+    """
+    Load the embedding model once and reuse it.
+
+    Loading the model takes a few seconds, so we cache it:
+    the first call loads it, every later call returns the
+    same object.
+
+    RETURNS:
+    --------
+    SentenceTransformer or None
+        The model, or None if sentence-transformers isn't installed
+    """
+    try:
+        from sentence_transformers import SentenceTransformer
+    except ImportError:
+        print("  sentence-transformers not installed - embeddings disabled")
+        return None
+
+    if EMBEDDING_BACKEND == "onnx-int8":
+        # QUANTIZATION: the weights are stored as 8-bit integers instead
+        # of 32-bit floats. 4x less data to move through the CPU, and
+        # int8 math is faster, at a tiny cost in accuracy.
+        print(f"  Loading embedding model {EMBEDDING_MODEL} (ONNX int8)...")
+        try:
+            return SentenceTransformer(
+                EMBEDDING_MODEL,
+                backend="onnx",
+                model_kwargs={"file_name": ONNX_INT8_FILE}
+            )
+        except Exception as e:
+            print(f"  ONNX model unavailable ({e}) - using the regular model")
+
+    print(f"  Loading embedding model {EMBEDDING_MODEL}...")
+    return SentenceTransformer(EMBEDDING_MODEL)
+
+
+def embed_texts(texts: list[str]) -> Optional[np.ndarray]:
+    """
+    Convert texts into normalized embedding vectors.
+
+    PARAMETERS:
+    -----------
+    texts : list[str]
+        The texts to embed
+
+    RETURNS:
+    --------
+    np.ndarray or None
+        A (len(texts), dim) float32 array with one unit-length row
+        per text, or None if no embedding model is available
+
+    EXAMPLE:
+    --------
+    >>> vectors = embed_texts(["capital of France", "France's capital"])
+    >>> float(vectors[0] @ vectors[1])   # cosine similarity
+    0.93
+    """
+    model = get_embedder()
+    if model is None:
+        return None
+
+    vectors = model.encode(
+        texts,
+        normalize_embeddings=True,   # unit length -> dot product = cosine
+        convert_to_numpy=True
+    )
+    return vectors.astype(np.float32, copy=False)
@@ -16,8 +16,15 @@
 # 3. feedparser library converts XML into Python objects
 # 4. We extract the information we need (title, link, etc.)
 #
+# Feeds are downloaded in PARALLEL (see fetch_all_news):
+# waiting on the network is most of the work, so total time
+# is roughly the slowest feed instead of the sum of all feeds.
+#
 # =====================================================
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Iterator
+
 import feedparser
 from datetime import datetime
 from dateutil import parser as date_parser
@@ -33,6 +40,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config import (
     RSS_FEEDS,
     MAX_ARTICLES_PER_SOURCE,
+    FEED_FETCH_CONCURRENCY,
     NEWS_API_KEY,
     NEWSAPI_SOURCES,
     NEWSAPI_CATEGORIES
@@ -80,6 +88,34 @@ def fetch_from_rss(feed_url: str, source_name: str, max_articles: int = 5) -> li
     print(f"  Fetching from {source_name}...")
     feed = feedparser.parse(feed_url)
 
+    return articles_from_feed(feed, source_name, max_articles)
+
+
+def articles_from_feed(feed, source_name: str, max_articles: int = 5) -> list[dict]:
+    """
+    Convert an already parsed feed into our article dictionaries.
+
+    Split out of fetch_from_rss() so callers that download the feed
+    themselves (e.g., the backend, which downloads all feeds at once)
+    can reuse the same conversion.
+
+    PARAMETERS:
+    -----------
+    feed : feedparser.FeedParserDict
+        The result of feedparser.parse()
+
+    source_name : str
+        A friendly name for the source (e.g., "BBC News")
+
+    max_articles : int
+        Maximum number of articles to keep (default: 5)
+
+    RETURNS:
+    --------
+    list[dict]
+        A list of article dictionaries (same format as fetch_from_rss)
+    """
+
     # Step 2: Check if the feed was fetched successfully
     # feed.bozo is True if there was an error parsing
     if feed.bozo and not feed.entries:
@@ -120,6 +156,11 @@ def fetch_from_rss(feed_url: str, source_name: str, max_articles: int = 5) -> li
     return articles
 
 
+# The format every article's "published" date is stored in
+# (main.py parses it back with this same format)
+DATE_FORMAT = "%B %d, %Y at %H:%M"
+
+
 def parse_date(date_string: str) -> Optional[str]:
     """
     Convert various date formats to a readable string.
@@ -144,7 +185,7 @@ def parse_date(date_string: str) -> Optional[str]:
         # date_parser.parse() is smart - it can understand many date formats
         parsed_date = date_parser.parse(date_string)
         # Format it nicely for display
-        return parsed_date.strftime("%B %d, %Y at %H:%M")
+        return parsed_date.strftime(DATE_FORMAT)
     except (ValueError, TypeError):
         # If we can't parse the date, just return the original string
         return date_string
@@ -154,8 +195,15 @@ def fetch_all_news(max_per_source: int = None) -> list[dict]:
     """
     Fetch articles from ALL configured RSS feeds.
 
-    This function loops through all the feeds defined in config.py
-    and collects articles from each one.
+    This function downloads all the feeds defined in config.py
+    at the same time and collects articles from each one.
+
+    WHY THREADS?
+    ------------
+    Fetching a feed is mostly waiting for the server to answer.
+    While one thread waits, others can send their requests, so
+    10 feeds take about as long as the slowest one - not the sum
+    of all 10. At most FEED_FETCH_CONCURRENCY run at once.
 
     PARAMETERS:
     -----------
@@ -183,11 +231,17 @@ def fetch_all_news(max_per_source: int = None) -> list[dict]:
     print("FETCHING NEWS FROM RSS FEEDS")
     print("="*50)
 
-    # Loop through each feed defined in config.py
+    # Fetch every feed defined in config.py in parallel
     # RSS_FEEDS is a dictionary: {"Source Name": "feed_url"}
-    for source_name, feed_url in RSS_FEEDS.items():
-        articles = fetch_from_rss(feed_url, source_name, max_per_source)
-        all_articles.extend(articles)  # Add to our master list
+    with ThreadPoolExecutor(max_workers=FEED_FETCH_CONCURRENCY) as executor:
+        results = executor.map(
+            lambda feed: fetch_from_rss(feed[1], feed[0], max_per_source),
+            RSS_FEEDS.items()
+        )
+
+        # map() returns results in feed order, whichever finishes first
+        for articles in results:
+            all_articles.extend(articles)  # Add to our master list
 
     print("="*50)
     print(f"TOTAL: {len(all_articles)} articles fetched")
@@ -234,6 +288,79 @@ def display_articles(articles: list[dict]) -> None:
 #
 # =====================================================
 
+# Base URL for NewsAPI top headlines
+NEWSAPI_URL = "https://newsapi.org/v2/top-headlines"
+
+
+def newsapi_params(
+    api_key: str,
+    category: str = None,
+    sources: list = None,
+    query: str = None,
+    max_articles: int = 10
+) -> dict:
+    """
+    Build the query parameters for a NewsAPI top-headlines request.
+
+    See fetch_from_newsapi() for what each parameter means.
+    """
+    params = {
+        "apiKey": api_key,
+        "language": "en",
+        "pageSize": max_articles,
+    }
+
+    # Add optional filters
+    # Note: NewsAPI doesn't allow category + sources together
+    if sources:
+        params["sources"] = ",".join(sources)
+    elif category:
+        params["category"] = category
+        params["country"] = "us"  # Required when using category
+
+    if query:
+        params["q"] = query
+
+    return params
+
+
+def articles_from_newsapi(data: dict) -> list[dict]:
+    """
+    Convert a NewsAPI JSON response into our article dictionaries.
+
+    PARAMETERS:
+    -----------
+    data : dict
+        The parsed JSON body returned by NewsAPI
+
+    RETURNS:
+    --------
+    list[dict]
+        List of article dictionaries (empty if NewsAPI reported an error)
+    """
+    # Check API response status
+    if data.get("status") != "ok":
+        print(f"  NewsAPI error: {data.get('message', 'Unknown error')}")
+        return []
+
+    # Convert NewsAPI format to our format
+    articles = []
+    for item in data.get("articles", []):
+        article = {
+            "title": item.get("title", "No title"),
+            "description": item.get("description") or item.get("content", ""),
+            "url": item.get("url", ""),
+            "source": item.get("source", {}).get("name", "Unknown"),
+            "published": parse_date(item.get("publishedAt", "")),
+            "author": item.get("author"),  # NewsAPI includes author
+            "image_url": item.get("urlToImage"),  # NewsAPI includes images
+        }
+        articles.append(article)
+
+    print(f"  Found {len(articles)} articles from NewsAPI")
+    return articles
+
+
 def fetch_from_newsapi(
     api_key: str,
     category: str = None,
@@ -281,26 +408,7 @@ def fetch_from_newsapi(
     ... )
     """
 
-    # Base URL for NewsAPI top headlines
-    url = "https://newsapi.org/v2/top-headlines"
-
-    # Build request parameters
-    params = {
-        "apiKey": api_key,
-        "language": "en",
-        "pageSize": max_articles,
-    }
-
-    # Add optional filters
-    # Note: NewsAPI doesn't allow category + sources together
-    if sources:
-        params["sources"] = ",".join(sources)
-    elif category:
-        params["category"] = category
-        params["country"] = "us"  # Required when using category
-
-    if query:
-        params["q"] = query
+    params = newsapi_params(api_key, category, sources, query, max_articles)
 
     print(f"  Fetching from NewsAPI...")
     if category:
@@ -310,7 +418,7 @@ def fetch_from_newsapi(
 
     try:
         # Make the HTTP request
-        response = requests.get(url, params=params, timeout=10)
+        response = requests.get(NEWSAPI_URL, params=params, timeout=10)
 
         # Check for errors
         response.raise_for_status()
@@ -318,27 +426,7 @@ def fetch_from_newsapi(
         # Parse JSON response
         data = response.json()
 
-        # Check API response status
-        if data.get("status") != "ok":
-            print(f"  NewsAPI error: {data.get('message', 'Unknown error')}")
-            return []
-
-        # Convert NewsAPI format to our format
-        articles = []
-        for item in data.get("articles", []):
-            article = {
-                "title": item.get("title", "No title"),
-                "description": item.get("description") or item.get("content", ""),
-                "url": item.get("url", ""),
-                "source": item.get("source", {}).get("name", "Unknown"),
-                "published": parse_date(item.get("publishedAt", "")),
-                "author": item.get("author"),  # NewsAPI includes author
-                "image_url": item.get("urlToImage"),  # NewsAPI includes images
-            }
-            articles.append(article)
-
-        print(f"  Found {len(articles)} articles from NewsAPI")
-        return articles
+        return articles_from_newsapi(data)
 
     except requests.exceptions.RequestException as e:
         print(f"  Error fetching from NewsAPI: {e}")
@@ -391,13 +479,19 @@ def fetch_all_newsapi(
     print("FETCHING NEWS FROM NEWSAPI")
     print("="*50)
 
-    for category in categories:
-        articles = fetch_from_newsapi(
-            api_key=api_key,
-            category=category,
-            max_articles=max_per_category
+    # One request per category, all sent in parallel (like the RSS feeds)
+    with ThreadPoolExecutor(max_workers=FEED_FETCH_CONCURRENCY) as executor:
+        results = executor.map(
+            lambda category: fetch_from_newsapi(
+                api_key=api_key,
+                category=category,
+                max_articles=max_per_category
+            ),
+            categories
         )
-        all_articles.extend(articles)
+
+        for articles in results:
+            all_articles.extend(articles)
 
     print("="*50)
     print(f"TOTAL: {len(all_articles)} articles fetched from NewsAPI")
@@ -447,9 +541,11 @@ def fetch_news(source: str = "rss", max_per_source: int = None) -> list[dict]:
         return fetch_all_newsapi(max_per_category=max_per_source)
 
     elif source == "both":
-        rss_articles = fetch_all_news(max_per_source=max_per_source)
-        newsapi_articles = fetch_all_newsapi(max_per_category=max_per_source)
-        return rss_articles + newsapi_articles
+        # Fetch both sources at the same time
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            rss_future = executor.submit(fetch_all_news, max_per_source=max_per_source)
+            newsapi_future = executor.submit(fetch_all_newsapi, max_per_category=max_per_source)
+            return rss_future.result() + newsapi_future.result()
 
     else:
         print(f"Unknown source: {source}")
@@ -457,6 +553,71 @@ def fetch_news(source: str = "rss", max_per_source: int = None) -> list[dict]:
         return []
 
 
+def iter_news(source: str = "rss", max_per_source: int = None) -> Iterator[tuple[int, list[dict]]]:
+    """
+    Fetch news like fetch_news(), but hand over each feed's articles
+    as soon as that feed has downloaded.
+
+    fetch_news() returns only after the SLOWEST feed is done. With
+    this generator the caller can start working on (e.g. summarizing)
+    the first feeds while the others are still downloading.
+
+    PARAMETERS:
+    -----------
+    source : str
+        "rss" (default), "newsapi", or "both"
+
+    max_per_source : int, optional
+        Maximum articles per source/category
+
+    YIELDS:
+    -------
+    (int, list[dict])
+        The feed's position in the usual fetch_news() order (so the
+        caller can restore that order), and its articles.
+        Feeds arrive in the order they FINISH, not in that order.
+
+    EXAMPLE:
+    --------
+    >>> for position, articles in iter_news("rss"):
+    ...     print(position, len(articles))
+    3 5
+    0 5
+    ...
+    """
+    if max_per_source is None:
+        max_per_source = MAX_ARTICLES_PER_SOURCE
+
+    source = source.lower()
+    if source not in ("rss", "newsapi", "both"):
+        print(f"Unknown source: {source}")
+        print("Valid options: rss, newsapi, both")
+        return
+
+    # One job per RSS feed / NewsAPI category, in fetch_news() order
+    jobs = []
+    if source in ("rss", "both"):
+        for source_name, feed_url in RSS_FEEDS.items():
+            jobs.append((fetch_from_rss, (feed_url, source_name, max_per_source)))
+
+    if source in ("newsapi", "both"):
+        if NEWS_API_KEY:
+            for category in NEWSAPI_CATEGORIES:
+                jobs.append((fetch_from_newsapi, (NEWS_API_KEY, category, None, None, max_per_source)))
+        else:
+            print("\n⚠️  NewsAPI key not found! Add NEWS_API_KEY to your .env file")
+
+    with ThreadPoolExecutor(max_workers=FEED_FETCH_CONCURRENCY) as executor:
+        futures = {
+            executor.submit(function, *args): position
+            for position, (function, args) in enumerate(jobs)
+        }
+
+        # as_completed() gives us each download the moment it finishes
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+
 # =====================================================
 # TEST CODE
 # =====================================================
@@ -16,6 +16,9 @@
 #
 # =====================================================
 
+import asyncio
+from functools import lru_cache
+
 from langchain_anthropic import ChatAnthropic
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 from langchain_core.messages import HumanMessage, AIMessage
@@ -25,7 +28,7 @@ from langchain_core.output_parsers import StrOutputParser
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from config import ANTHROPIC_API_KEY, MODEL_NAME
+from config import ANTHROPIC_API_KEY, MODEL_NAME, MEMORY_SIZE
 
 
 # =====================================================
@@ -65,6 +68,72 @@ Instructions:
 ])
 
 
+@lru_cache(maxsize=1)
+def create_qa_llm():
+    """
+    Create the Claude LLM instance for Q&A (once).
+
+    Every NewsQAChain (a new one is made when articles are cleared)
+    shares this instance and its API connections.
+    """
+    if not ANTHROPIC_API_KEY:
+        raise ValueError("ANTHROPIC_API_KEY not found!")
+
+    return ChatAnthropic(
+        model=MODEL_NAME,
+        temperature=0.3,    # Slightly creative for natural responses
+        max_tokens=1000,    # Longer responses for detailed answers
+        api_key=ANTHROPIC_API_KEY
+    )
+
+
+# =====================================================
+# CONVERSATION MEMORY (Capped)
+# =====================================================
+#
+# Every question and answer is sent back to Claude with
+# the next question. If we kept EVERYTHING, each question
+# would get slower and more expensive than the last.
+#
+# So we only keep the last MEMORY_SIZE exchanges (from
+# config.py). Older messages are dropped.
+#
+# =====================================================
+
+class ChatHistory:
+    """
+    Conversation memory that keeps only the most recent exchanges.
+
+    This version lives in memory. Anything with the same methods
+    (messages, add, clear, len) can be used instead - for example,
+    the web backend stores history in Redis so that all of its
+    worker processes share one conversation.
+    """
+
+    def __init__(self, max_exchanges: int = MEMORY_SIZE):
+        # One exchange = one question + one answer = 2 messages
+        self.max_messages = max_exchanges * 2
+        self._messages = []
+
+    def messages(self) -> list:
+        """All remembered messages, oldest first."""
+        return list(self._messages)
+
+    def add(self, question: str, answer: str) -> None:
+        """Remember one exchange, dropping the oldest beyond the limit."""
+        # HumanMessage and AIMessage are LangChain's way to store chat
+        self._messages.append(HumanMessage(content=question))
+        self._messages.append(AIMessage(content=answer))
+        del self._messages[:-self.max_messages]
+
+    def clear(self) -> None:
+        """Forget the whole conversation."""
+        self._messages = []
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
+
 class NewsQAChain:
     """
     A Q&A system with memory for asking questions about news articles.
@@ -86,38 +155,38 @@ class NewsQAChain:
     >>> answer2 = qa.ask("Tell me more about that")  # Remembers context!
     """
 
-    def __init__(self):
+    def __init__(self, history=None):
         """
         Initialize the Q&A chain.
 
         Sets up:
         - Empty article list
-        - Empty chat history
+        - Empty chat history (or the given ChatHistory-like memory)
         - The LLM connection
         """
         self.articles = []           # List of article dictionaries
-        self.chat_history = []       # List of previous messages
+
+        # Previous messages (only the last few exchanges are kept)
+        self.history = ChatHistory() if history is None else history
+        self.articles_context = self._format_articles_for_context()
         self.llm = self._create_llm()
         self.chain = self._create_chain()
 
-    def _create_llm(self):
-        """Create the Claude LLM instance."""
-        if not ANTHROPIC_API_KEY:
-            raise ValueError("ANTHROPIC_API_KEY not found!")
+    @property
+    def chat_history(self) -> list:
+        """List of previous messages (HumanMessage / AIMessage)."""
+        return self.history.messages()
 
-        return ChatAnthropic(
-            model=MODEL_NAME,
-            temperature=0.3,    # Slightly creative for natural responses
-            max_tokens=1000,    # Longer responses for detailed answers
-            api_key=ANTHROPIC_API_KEY
-        )
+    def _create_llm(self):
+        """Get the shared Claude LLM instance."""
+        return create_qa_llm()
 
     def _create_chain(self):
         """Create the Q&A chain."""
         parser = StrOutputParser()
         return QA_PROMPT | self.llm | parser
 
-    def load_articles(self, articles: list[dict]) -> None:
+    def load_articles(self, articles: list[dict], history=None) -> None:
         """
         Load articles into the Q&A system.
 
@@ -128,9 +197,22 @@ class NewsQAChain:
         articles : list[dict]
             List of article dictionaries with keys:
             title, summary, source, category, etc.
+
+        history : optional
+            Conversation memory to use for these articles (see
+            ChatHistory). If not given, the current one is cleared.
         """
         self.articles = articles
-        self.chat_history = []  # Reset conversation when new articles loaded
+
+        # Reset conversation when new articles loaded
+        if history is None:
+            self.history.clear()
+        else:
+            self.history = history
+
+        # The articles don't change between questions, so format the
+        # context block once here instead of on every ask()
+        self.articles_context = self._format_articles_for_context()
 
         print(f"\n[OK] Loaded {len(articles)} articles into Q&A system")
         print("  You can now ask questions about these articles!")
@@ -193,33 +275,70 @@ Summary: {article.get('summary', article.get('description', 'No summary availabl
         if not self.articles:
             return "No articles loaded. Please load articles first."
 
-        # Format articles for context
-        articles_context = self._format_articles_for_context()
-
         # Call the chain with:
         # - articles_context: The news articles
         # - chat_history: Previous conversation
         # - question: Current question
         response = self.chain.invoke({
-            "articles_context": articles_context,
+            "articles_context": self.articles_context,
             "chat_history": self.chat_history,
             "question": question
         })
 
         # Save this exchange to memory
-        # HumanMessage and AIMessage are LangChain's way to store chat
-        self.chat_history.append(HumanMessage(content=question))
-        self.chat_history.append(AIMessage(content=response))
+        self.remember(question, response)
 
         return response
 
+    async def ask_stream(self, question: str):
+        """
+        Ask a question and get the answer piece by piece.
+
+        Same as ask(), but instead of waiting for the whole answer,
+        this yields each chunk of text as soon as Claude writes it.
+        The complete answer is saved to history at the end.
+
+        USAGE:
+        ------
+        >>> async for text in qa.ask_stream("What's new in tech?"):
+        ...     print(text, end="", flush=True)
+        """
+        if not self.articles:
+            yield "No articles loaded. Please load articles first."
+            return
+
+        # The history may live in Redis - read and write it in a worker
+        # thread so a slow round trip doesn't block the event loop
+        chat_history = await asyncio.to_thread(self.history.messages)
+
+        parts = []
+        async for chunk in self.chain.astream({
+            "articles_context": self.articles_context,
+            "chat_history": chat_history,
+            "question": question
+        }):
+            parts.append(chunk)
+            yield chunk
+
+        await asyncio.to_thread(self.remember, question, "".join(parts))
+
+    def remember(self, question: str, answer: str) -> None:
+        """
+        Add a question/answer exchange to the conversation history.
+
+        ask() calls this for every answer Claude gives. It is also used
+        when an answer comes from somewhere else (like a cache), so
+        follow-up questions still see the full conversation.
+        """
+        self.history.add(question, answer)
+
     def clear_history(self) -> None:
         """
         Clear conversation history but keep articles.
 
         Use this to start a fresh conversation about the same articles.
         """
-        self.chat_history = []
+        self.history.clear()
         print("[OK] Conversation history cleared")
 
     def get_history(self) -> list:
@@ -230,11 +349,16 @@ Summary: {article.get('summary', article.get('description', 'No summary availabl
         """
         return self.chat_history
 
+    def history_len(self) -> int:
+        """Number of messages in the conversation history."""
+        return len(self.history)
+
     def display_history(self) -> None:
         """
         Display the conversation history in a readable format.
         """
-        if not self.chat_history:
+        messages = self.chat_history
+        if not messages:
             print("No conversation history yet.")
             return
 
@@ -242,7 +366,7 @@ Summary: {article.get('summary', article.get('description', 'No summary availabl
         print("CONVERSATION HISTORY")
         print("="*60)
 
-        for msg in self.chat_history:
+        for msg in messages:
             if isinstance(msg, HumanMessage):
                 print(f"\n🧑 You: {msg.content}")
             elif isinstance(msg, AIMessage):
@@ -26,14 +26,17 @@
 #
 # =====================================================
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
 from langchain_anthropic import ChatAnthropic
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.output_parsers import StrOutputParser
+from langchain_core.output_parsers import StrOutputParser, JsonOutputParser
 
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from config import ANTHROPIC_API_KEY, MODEL_NAME
+from config import ANTHROPIC_API_KEY, MODEL_NAME, SUMMARY_CONCURRENCY
 
 
 # =====================================================
@@ -137,6 +140,7 @@ Sentiment analysis:""")
 #
 # =====================================================
 
+@lru_cache(maxsize=1)
 def create_llm():
     """Create Claude LLM configured for sentiment analysis."""
     if not ANTHROPIC_API_KEY:
@@ -332,19 +336,205 @@ def analyze_sentiment(article: dict) -> dict:
     return article
 
 
+# =====================================================
+# ANALYZE MANY ARTICLES IN ONE CALL
+# =====================================================
+#
+# Asking Claude about each article separately costs one
+# network round trip per article. Instead we send a whole
+# batch of numbered articles in ONE prompt and ask for a
+# JSON list with one answer per number - the same
+# multi-document pattern the trending module uses.
+#
+# Batches are kept small so the answer fits comfortably in
+# max_tokens and one bad answer only affects a few articles.
+#
+# =====================================================
+
+BATCH_SENTIMENT_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", """You are a sentiment analysis expert for news articles.
+
+Your job is to analyze the emotional tone of news articles and classify them as:
+- POSITIVE: Good news, success stories, optimistic outlook, achievements
+- NEGATIVE: Bad news, failures, disasters, criticism, concerning developments
+- NEUTRAL: Factual reporting, balanced coverage, no strong emotional tone
+
+IMPORTANT: News articles are often written to sound neutral even when covering
+negative events. Focus on WHAT is being reported, not HOW it's written.
+
+Examples:
+---------
+"Company reports record profits and plans expansion" → positive
+"Earthquake devastates coastal city, thousands displaced" → negative
+"Government announces new policy on immigration" → neutral
+"Scientists discover breakthrough treatment for cancer" → positive
+"Stock market plunges amid economic concerns" → negative
+"Annual report shows mixed results for tech sector" → neutral
+
+You will get several numbered articles.
+You MUST respond with ONLY a JSON list, one object per article, in this EXACT format:
+[
+  {{"id": 1, "sentiment": "positive", "confidence": "high", "reason": "One sentence explaining why."}},
+  {{"id": 2, "sentiment": "neutral", "confidence": "medium", "reason": "..."}}
+]
+
+Rules:
+1. Choose ONE sentiment per article
+2. Be consistent - similar articles should get similar ratings
+3. When in doubt between positive/negative and neutral, lean toward neutral
+4. Consider the IMPACT of the news, not just the language used"""),
+
+    ("human", """Analyze the sentiment of these news articles:
+
+{articles}""")
+])
+
+
+@lru_cache(maxsize=1)
+def create_batch_llm():
+    """Create Claude LLM for batched sentiment analysis (room for one answer per article)."""
+    if not ANTHROPIC_API_KEY:
+        raise ValueError("ANTHROPIC_API_KEY not found!")
+
+    return ChatAnthropic(
+        model=MODEL_NAME,
+        temperature=0.1,  # Low for consistent classification
+        max_tokens=1500,  # ~100 tokens per article in a batch
+        api_key=ANTHROPIC_API_KEY
+    )
+
+
+def create_batch_sentiment_chain():
+    """
+    Create the batched sentiment chain.
+
+    CHAIN STRUCTURE:
+    ----------------
+    BATCH_SENTIMENT_PROMPT | llm | JsonOutputParser()
+
+    The parser turns Claude's JSON list into Python dicts.
+    """
+    return BATCH_SENTIMENT_PROMPT | create_batch_llm() | JsonOutputParser()
+
+
+def _analyze_sentiment_safely(article: dict) -> None:
+    """
+    analyze_sentiment(), but an error leaves a neutral result
+    on the article instead of being raised.
+    """
+    try:
+        analyze_sentiment(article)
+    except Exception as e:
+        print(f"  Error: {e}")
+        article["sentiment"] = "neutral"
+        article["sentiment_confidence"] = "low"
+        article["sentiment_reason"] = f"Error during analysis: {str(e)}"
+
+
+def analyze_sentiment_batch(articles: list[dict], chain=None) -> list[dict]:
+    """
+    Analyze the sentiment of several articles with ONE Claude call.
+
+    Articles with too little content get the same defaults as in
+    analyze_sentiment() and aren't sent. Any article Claude leaves
+    out of its answer is analyzed on its own instead.
+
+    PARAMETERS:
+    -----------
+    articles : list[dict]
+        A batch of articles with 'title' and 'summary' (or 'description')
+
+    chain : optional
+        A batched sentiment chain to reuse (creates one if not given)
+
+    RETURNS:
+    --------
+    list[dict]
+        Same articles with sentiment fields added
+    """
+
+    to_send = {}    # article number in the prompt -> article
+    for article in articles:
+        content = article.get("summary", article.get("description", ""))
+        if not content or len(content.strip()) < 30:
+            article["sentiment"] = "neutral"
+            article["sentiment_confidence"] = "low"
+            article["sentiment_reason"] = "Insufficient content for analysis"
+            continue
+
+        to_send[len(to_send) + 1] = article
+
+    if not to_send:
+        return articles
+
+    if chain is None:
+        chain = create_batch_sentiment_chain()
+
+    print(f"  Analyzing sentiment of {len(to_send)} articles in one call...")
+
+    articles_text = "\n\n".join(
+        f"ARTICLE {number}\n"
+        f"TITLE: {article.get('title', 'Untitled')}\n"
+        f"CONTENT: {article.get('summary', article.get('description', ''))}"
+        for number, article in to_send.items()
+    )
+    response = chain.invoke({"articles": articles_text})
+
+    if not isinstance(response, list):
+        response = []
+
+    for item in response:
+        if not isinstance(item, dict):
+            continue
+        try:
+            article = to_send.pop(int(item.get("id")))
+        except (TypeError, ValueError, KeyError):
+            continue
+
+        sentiment = str(item.get("sentiment") or "").strip().lower()
+        confidence = str(item.get("confidence") or "").strip().lower()
+        article["sentiment"] = sentiment if sentiment in VALID_SENTIMENTS else "neutral"
+        article["sentiment_confidence"] = confidence if confidence in ["high", "medium", "low"] else "medium"
+        article["sentiment_reason"] = (
+            str(item.get("reason") or "").strip() or "Unable to determine sentiment"
+        )
+
+    # Claude skipped some articles - ask about those one at a time.
+    # A failure here only affects that article, not the whole batch.
+    for article in to_send.values():
+        _analyze_sentiment_safely(article)
+
+    return articles
+
+
 # =====================================================
 # ANALYZE MULTIPLE ARTICLES
 # =====================================================
 
-def analyze_sentiments(articles: list[dict]) -> list[dict]:
+def analyze_sentiments(
+    articles: list[dict],
+    batch_size: int = 10,
+    max_workers: int = SUMMARY_CONCURRENCY
+) -> list[dict]:
     """
     Analyze sentiment for multiple articles.
 
+    Articles are sent batch_size at a time (one Claude call per
+    batch, see analyze_sentiment_batch), with up to max_workers
+    batches in flight at once. If a batch fails, its articles are
+    analyzed one by one.
+
     PARAMETERS:
     -----------
     articles : list[dict]
         List of articles (should already have summaries)
 
+    batch_size : int
+        How many articles to put in one Claude call
+
+    max_workers : int
+        Maximum Claude calls in flight at once (default: from config)
+
     RETURNS:
     --------
     list[dict]
@@ -355,27 +545,31 @@ def analyze_sentiments(articles: list[dict]) -> list[dict]:
     print("ANALYZING ARTICLE SENTIMENTS")
     print("=" * 50)
 
-    analyzed = []
     total = len(articles)
 
-    for i, article in enumerate(articles, 1):
-        print(f"\n[{i}/{total}]", end="")
+    def analyze_batch(start: int) -> None:
+        batch = articles[start:start + batch_size]
+        print(f"\n[{start + 1}-{start + len(batch)}/{total}]")
 
         try:
-            analyzed_article = analyze_sentiment(article)
-            analyzed.append(analyzed_article)
+            analyze_sentiment_batch(batch, create_batch_sentiment_chain())
+            return
         except Exception as e:
-            print(f"  Error: {e}")
-            article["sentiment"] = "neutral"
-            article["sentiment_confidence"] = "low"
-            article["sentiment_reason"] = f"Error during analysis: {str(e)}"
-            analyzed.append(article)
+            print(f"  Batch error: {e} - analyzing one at a time")
+
+        for article in batch:
+            _analyze_sentiment_safely(article)
+
+    # Each batch is a separate network call (waiting, not computing),
+    # so threads can have several in flight at once
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(analyze_batch, range(0, total, batch_size)))
 
     print("\n" + "=" * 50)
     print("SENTIMENT ANALYSIS COMPLETE")
     print("=" * 50)
 
-    return analyzed
+    return articles
 
 
 # =====================================================
@@ -47,6 +47,10 @@
 #
 # =====================================================
 
+import numpy as np
+from scipy import sparse
+from functools import lru_cache
+
 from langchain_anthropic import ChatAnthropic
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import StrOutputParser
@@ -78,6 +82,40 @@ from config import ANTHROPIC_API_KEY, MODEL_NAME
 #
 # =====================================================
 
+ENTITY_TYPES = ("people", "organizations", "locations")
+
+
+def _keyword_set(article: dict) -> set:
+    """An article's keywords as a lowercase set (sets handle duplicates)."""
+    return set(kw.lower() for kw in article.get("keywords", []))
+
+
+def _entity_set(article: dict, lowercase: bool = True) -> set:
+    """All of an article's people, organizations and locations as one set."""
+    entities = set()
+    for entity_type in ENTITY_TYPES:
+        names = article.get(entity_type, [])
+        if lowercase:
+            entities.update(e.lower() for e in names)
+        else:
+            entities.update(names)
+    return entities
+
+
+def _jaccard(set_a: set, set_b: set) -> float:
+    """Jaccard similarity of two sets, rounded to 3 decimals (0.0 if either is empty)."""
+    # Handle empty sets
+    if not set_a or not set_b:
+        return 0.0
+
+    # & is intersection (items in BOTH sets)
+    # | is union (items in EITHER set)
+    intersection = set_a & set_b
+    union = set_a | set_b
+
+    return round(len(intersection) / len(union), 3)
+
+
 def calculate_keyword_similarity(article_a: dict, article_b: dict) -> float:
     """
     Calculate similarity between two articles based on keyword overlap.
@@ -113,27 +151,7 @@ def calculate_keyword_similarity(article_a: dict, article_b: dict) -> float:
     """
 
     # Get keywords as sets (for set operations)
-    # Sets automatically handle duplicates
-    keywords_a = set(kw.lower() for kw in article_a.get("keywords", []))
-    keywords_b = set(kw.lower() for kw in article_b.get("keywords", []))
-
-    # Handle empty keywords
-    if not keywords_a or not keywords_b:
-        return 0.0
-
-    # Calculate Jaccard similarity
-    # & is intersection (items in BOTH sets)
-    # | is union (items in EITHER set)
-    intersection = keywords_a & keywords_b
-    union = keywords_a | keywords_b
-
-    # Avoid division by zero
-    if len(union) == 0:
-        return 0.0
-
-    similarity = len(intersection) / len(union)
-
-    return round(similarity, 3)
+    return _jaccard(_keyword_set(article_a), _keyword_set(article_b))
 
 
 def calculate_entity_similarity(article_a: dict, article_b: dict) -> float:
@@ -151,26 +169,7 @@ def calculate_entity_similarity(article_a: dict, article_b: dict) -> float:
     """
 
     # Combine all entities from each article
-    entities_a = set()
-    entities_b = set()
-
-    # Add all entity types
-    for entity_type in ["people", "organizations", "locations"]:
-        entities_a.update(e.lower() for e in article_a.get(entity_type, []))
-        entities_b.update(e.lower() for e in article_b.get(entity_type, []))
-
-    # Handle empty entities
-    if not entities_a or not entities_b:
-        return 0.0
-
-    # Jaccard similarity
-    intersection = entities_a & entities_b
-    union = entities_a | entities_b
-
-    if len(union) == 0:
-        return 0.0
-
-    return round(len(intersection) / len(union), 3)
+    return _jaccard(_entity_set(article_a), _entity_set(article_b))
 
 
 def calculate_combined_similarity(article_a: dict, article_b: dict) -> dict:
@@ -195,9 +194,14 @@ def calculate_combined_similarity(article_a: dict, article_b: dict) -> dict:
         - shared_entities: List of shared entities
     """
 
+    # Build each article's sets once; they're used for both the
+    # scores and the shared items below
+    keywords_a = _keyword_set(article_a)
+    keywords_b = _keyword_set(article_b)
+
     # Calculate individual similarities
-    keyword_sim = calculate_keyword_similarity(article_a, article_b)
-    entity_sim = calculate_entity_similarity(article_a, article_b)
+    keyword_sim = _jaccard(keywords_a, keywords_b)
+    entity_sim = _jaccard(_entity_set(article_a), _entity_set(article_b))
 
     # Check if same category
     cat_a = article_a.get("category", "").lower()
@@ -212,17 +216,11 @@ def calculate_combined_similarity(article_a: dict, article_b: dict) -> dict:
     # Cap at 1.0
     overall = min(overall, 1.0)
 
-    # Find shared items for display
-    keywords_a = set(kw.lower() for kw in article_a.get("keywords", []))
-    keywords_b = set(kw.lower() for kw in article_b.get("keywords", []))
+    # Find shared items for display (entities as written, not lowercased)
     shared_keywords = list(keywords_a & keywords_b)
-
-    entities_a = set()
-    entities_b = set()
-    for entity_type in ["people", "organizations", "locations"]:
-        entities_a.update(article_a.get(entity_type, []))
-        entities_b.update(article_b.get(entity_type, []))
-    shared_entities = list(entities_a & entities_b)
+    shared_entities = list(
+        _entity_set(article_a, lowercase=False) & _entity_set(article_b, lowercase=False)
+    )
 
     return {
         "overall": round(overall, 3),
@@ -242,7 +240,9 @@ def find_similar_articles(
     target_article: dict,
     all_articles: list[dict],
     threshold: float = 0.2,
-    max_results: int = 5
+    max_results: int = 5,
+    matrix: sparse.csr_matrix = None,
+    target_index: int = None
 ) -> list[dict]:
     """
     Find articles similar to a target article.
@@ -258,6 +258,12 @@ def find_similar_articles(
         Default 0.2 = at least 20% similar
     max_results : int
         Maximum number of similar articles to return
+    matrix : scipy.sparse.csr_matrix
+        Optional result of build_similarity_matrix(all_articles). With
+        target_index, only articles whose precomputed score can reach
+        the threshold are compared in detail.
+    target_index : int
+        Position of target_article in all_articles (used with matrix)
 
     RETURNS:
     --------
@@ -276,7 +282,20 @@ def find_similar_articles(
 
     results = []
 
-    for article in all_articles:
+    # A little slack for rounding; exact scores are checked below
+    cutoff = threshold - 0.001
+
+    if matrix is not None and target_index is not None and cutoff > 0:
+        # The target's row of the matrix holds its score with every
+        # article; most are 0 and aren't even stored.
+        row = matrix.getrow(target_index)
+        candidates = np.sort(row.indices[row.data >= cutoff]).tolist()
+    else:
+        candidates = range(len(all_articles))
+
+    for index in candidates:
+        article = all_articles[index]
+
         # Skip comparing article to itself
         if article.get("title") == target_article.get("title"):
             continue
@@ -298,9 +317,149 @@ def find_similar_articles(
     return results[:max_results]
 
 
+# =====================================================
+# ALL PAIRS AT ONCE (Vectorized)
+# =====================================================
+#
+# Comparing every pair in a Python loop means n*(n-1)/2 calls to
+# calculate_combined_similarity. We can get the same scores for
+# ALL pairs with a few matrix operations instead.
+#
+# HOW IT WORKS:
+# -------------
+# Build a 0/1 matrix K where K[i][k] = 1 if article i has keyword k.
+#   K @ K.T  → [i][j] = number of keywords i and j share (|A ∩ B|)
+#   |A ∪ B| = |A| + |B| - |A ∩ B|
+# So Jaccard for every pair is one matrix product and a division.
+# Same trick for entities, and for categories (one-hot).
+#
+# Most article pairs share nothing, so these matrices are SPARSE:
+# we only store the non-zero entries (as float32), and the math
+# never touches the zeros.
+#
+# =====================================================
+
+def _incidence_matrix(item_sets: list[set]) -> sparse.csr_matrix:
+    """Sparse 0/1 matrix with one row per article and one column per distinct item."""
+    vocabulary = {}
+    rows, cols = [], []
+    for row, items in enumerate(item_sets):
+        for item in items:
+            rows.append(row)
+            cols.append(vocabulary.setdefault(item, len(vocabulary)))
+
+    return sparse.csr_matrix(
+        (np.ones(len(rows), dtype=np.float32), (rows, cols)),
+        shape=(len(item_sets), len(vocabulary)),
+        dtype=np.float32
+    )
+
+
+def _jaccard_matrix(item_sets: list[set]) -> sparse.csr_matrix:
+    """Pairwise Jaccard similarity (rounded like the per-pair functions)."""
+    matrix = _incidence_matrix(item_sets)
+    intersection = (matrix @ matrix.T).tocoo()
+    sizes = np.asarray(matrix.sum(axis=1)).ravel()
+
+    # Only pairs that share something are stored, so union is never 0 here
+    union = sizes[intersection.row] + sizes[intersection.col] - intersection.data
+    scores = np.round(intersection.data / union, 3)
+
+    return sparse.csr_matrix(
+        (scores, (intersection.row, intersection.col)),
+        shape=intersection.shape
+    )
+
+
+def build_similarity_matrix(articles: list[dict]) -> sparse.csr_matrix:
+    """
+    Compute the "overall" similarity score for every pair of articles.
+
+    Uses the same weights as calculate_combined_similarity
+    (60% keywords, 30% entities, 10% category bonus).
+
+    RETURNS:
+    --------
+    scipy.sparse.csr_matrix
+        n x n float32 matrix; [i][j] is the overall score of articles
+        i and j (pairs with nothing in common are simply not stored)
+    """
+    keyword_sets = [_keyword_set(article) for article in articles]
+    entity_sets = [_entity_set(article) for article in articles]
+    category_sets = [
+        {article.get("category", "").lower()} - {""}
+        for article in articles
+    ]
+
+    categories = _incidence_matrix(category_sets)
+    same_category = categories @ categories.T
+
+    overall = (
+        _jaccard_matrix(keyword_sets) * 0.6
+        + _jaccard_matrix(entity_sets) * 0.3
+        + same_category * 0.1
+    ).tocsr()
+    overall.data = np.round(np.minimum(overall.data, 1.0), 3)
+    return overall
+
+
+def iter_related_pairs(
+    articles: list[dict],
+    threshold: float = 0.3,
+    matrix: sparse.csr_matrix = None
+):
+    """
+    Yield every related pair (i < j) in index order, unsorted.
+
+    Same pair dicts as find_all_related_pairs. Useful when the caller
+    only needs the top few pairs and doesn't want a full sort.
+
+    PARAMETERS:
+    -----------
+    articles : list[dict]
+        All articles to compare
+    threshold : float
+        Minimum similarity to be considered related
+    matrix : scipy.sparse.csr_matrix
+        Optional result of build_similarity_matrix(articles), if the
+        caller already has one
+    """
+
+    # A little slack for rounding; exact scores are checked below
+    cutoff = threshold - 0.001
+
+    if cutoff <= 0:
+        # Even pairs with nothing in common qualify
+        n = len(articles)
+        candidates = ((i, j) for i in range(n) for j in range(i + 1, n))
+    else:
+        if matrix is None:
+            matrix = build_similarity_matrix(articles)
+
+        # Upper triangle only (i < j), in row-major order
+        upper = sparse.triu(matrix, k=1).tocoo()
+        keep = upper.data >= cutoff
+        rows, cols = upper.row[keep], upper.col[keep]
+        order = np.lexsort((cols, rows))
+        candidates = zip(rows[order].tolist(), cols[order].tolist())
+
+    for i, j in candidates:
+        similarity = calculate_combined_similarity(articles[i], articles[j])
+
+        if similarity["overall"] >= threshold:
+            yield {
+                "article_a_index": i,
+                "article_a_title": articles[i].get("title", "Untitled"),
+                "article_b_index": j,
+                "article_b_title": articles[j].get("title", "Untitled"),
+                "similarity": similarity
+            }
+
+
 def find_all_related_pairs(
     articles: list[dict],
-    threshold: float = 0.3
+    threshold: float = 0.3,
+    matrix: sparse.csr_matrix = None
 ) -> list[dict]:
     """
     Find ALL pairs of related articles.
@@ -314,6 +473,9 @@ def find_all_related_pairs(
         All articles to compare
     threshold : float
         Minimum similarity to be considered related
+    matrix : scipy.sparse.csr_matrix
+        Optional result of build_similarity_matrix(articles), if the
+        caller already has one
 
     RETURNS:
     --------
@@ -325,30 +487,13 @@ def find_all_related_pairs(
 
     NOTE ON COMPLEXITY:
     -------------------
-    This is O(n²) - for n articles, we make n*(n-1)/2 comparisons.
-    - 10 articles = 45 comparisons
-    - 50 articles = 1,225 comparisons
-    - 100 articles = 4,950 comparisons
-
-    For large datasets, consider using embeddings instead!
+    There are n*(n-1)/2 pairs, but the scores for all of them come
+    from build_similarity_matrix in a few matrix operations. Only
+    pairs at (or within rounding distance of) the threshold get the
+    full calculate_combined_similarity treatment.
     """
 
-    pairs = []
-    n = len(articles)
-
-    # Compare each pair (avoid duplicates by only comparing i < j)
-    for i in range(n):
-        for j in range(i + 1, n):
-            similarity = calculate_combined_similarity(articles[i], articles[j])
-
-            if similarity["overall"] >= threshold:
-                pairs.append({
-                    "article_a_index": i,
-                    "article_a_title": articles[i].get("title", "Untitled"),
-                    "article_b_index": j,
-                    "article_b_title": articles[j].get("title", "Untitled"),
-                    "similarity": similarity
-                })
+    pairs = list(iter_related_pairs(articles, threshold, matrix))
 
     # Sort by similarity
     pairs.sort(key=lambda x: x["similarity"]["overall"], reverse=True)
@@ -464,6 +609,7 @@ Find all related pairs:""")
 ])
 
 
+@lru_cache(maxsize=1)
 def create_similarity_llm():
     """
     Create Claude LLM for similarity analysis.
@@ -12,15 +12,25 @@
 #
 # =====================================================
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
 from langchain_anthropic import ChatAnthropic
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import StrOutputParser
 
 # Import our settings
+import asyncio
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from config import ANTHROPIC_API_KEY, MODEL_NAME, TEMPERATURE, MAX_TOKENS
+from config import (
+    ANTHROPIC_API_KEY,
+    MODEL_NAME,
+    TEMPERATURE,
+    MAX_TOKENS,
+    SUMMARY_CONCURRENCY
+)
 
 
 # =====================================================
@@ -33,8 +43,14 @@ from config import ANTHROPIC_API_KEY, MODEL_NAME, TEMPERATURE, MAX_TOKENS
 #   - temperature: Creativity level (0=focused, 1=creative)
 #   - max_tokens: Maximum length of response
 #
+# @lru_cache(maxsize=1) makes this a "singleton": the LLM
+# is created on the first call and reused after that, so
+# every summary shares one connection pool to the API
+# instead of opening new connections each time.
+#
 # =====================================================
 
+@lru_cache(maxsize=1)
 def create_llm():
     """
     Create and return a configured Claude LLM instance.
@@ -55,7 +71,10 @@ def create_llm():
         model=MODEL_NAME,           # e.g., "claude-sonnet-4-5-20250929"
         temperature=TEMPERATURE,     # 0.3 - slightly creative but focused
         max_tokens=MAX_TOKENS,       # 500 tokens max per response
-        api_key=ANTHROPIC_API_KEY
+        api_key=ANTHROPIC_API_KEY,
+        # With several summaries in flight we may hit the rate limit (429).
+        # The client then waits (longer each time) and retries.
+        max_retries=5
     )
 
     return llm
@@ -202,38 +221,47 @@ def summarize_article(article: dict) -> dict:
     return article
 
 
-def summarize_articles(articles: list[dict]) -> list[dict]:
+def summarize_articles(
+    articles: list[dict],
+    max_workers: int = SUMMARY_CONCURRENCY
+) -> list[dict]:
     """
     Summarize multiple articles.
 
+    Claude calls run in parallel on a pool of threads: while one
+    thread waits for Claude's answer, the others send their own
+    requests. 30 articles with 8 workers take about 4 round trips
+    instead of 30.
+
     PARAMETERS:
     -----------
     articles : list[dict]
         List of article dictionaries
 
+    max_workers : int
+        Maximum Claude calls in flight at once (default: from config)
+
     RETURNS:
     --------
     list[dict]
-        Same articles with "summary" key added to each
+        Same articles (same order) with "summary" key added to each
     """
 
     print("\n" + "="*50)
     print("SUMMARIZING ARTICLES WITH CLAUDE")
     print("="*50)
 
-    summarized = []
-    total = len(articles)
-
-    for i, article in enumerate(articles, 1):
-        print(f"\n[{i}/{total}]", end="")
-
+    def summarize_one(article: dict) -> dict:
         try:
-            summarized_article = summarize_article(article)
-            summarized.append(summarized_article)
+            return summarize_article(article)
         except Exception as e:
-            print(f"  Error summarizing: {e}")
+            print(f"  Error summarizing {article.get('title', 'Untitled')[:30]}: {e}")
             article["summary"] = f"Error: Could not summarize - {str(e)}"
-            summarized.append(article)
+            return article
+
+    # map() hands back results in the original order
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        summarized = list(executor.map(summarize_one, articles))
 
     print("\n" + "="*50)
     print(f"COMPLETED: {len(summarized)} articles summarized")
@@ -242,6 +270,109 @@ def summarize_articles(articles: list[dict]) -> list[dict]:
     return summarized
 
 
+# =====================================================
+# STEP 5: SUMMARIZE MANY AT ONCE (Async)
+# =====================================================
+#
+# For async callers (like the backend), which shouldn't tie
+# up threads. Most of the time is spent WAITING for Claude's
+# servers, so we send several requests and wait for all of
+# them together:
+#
+#   Serial:      [call 1][call 2][call 3]...
+#   Concurrent:  [call 1]
+#                [call 2]
+#                [call 3]
+#
+# A Semaphore limits how many calls run at the same time,
+# so we don't hit Anthropic's rate limits.
+#
+# =====================================================
+
+async def summarize_article_async(article: dict, chain=None) -> dict:
+    """
+    Async version of summarize_article().
+
+    Uses chain.ainvoke() so the program can do other work
+    (like starting more summaries) while Claude is thinking.
+
+    PARAMETERS:
+    -----------
+    article : dict
+        An article dictionary with keys: title, description, url, source
+
+    chain : optional
+        A summary chain to reuse (creates one if not given)
+
+    RETURNS:
+    --------
+    dict
+        The original article with a new "summary" key added
+    """
+    content = article.get("description", "")
+    title = article.get("title", "Untitled")
+
+    if not content or len(content.strip()) < 50:
+        article["summary"] = "Summary unavailable - article content too short."
+        return article
+
+    if chain is None:
+        chain = create_summary_chain()
+
+    print(f"  Summarizing: {title[:50]}...")
+
+    article["summary"] = await chain.ainvoke({
+        "title": title,
+        "content": content
+    })
+
+    return article
+
+
+async def summarize_many(
+    articles: list[dict],
+    max_concurrency: int = SUMMARY_CONCURRENCY
+) -> list[dict]:
+    """
+    Summarize many articles concurrently.
+
+    PARAMETERS:
+    -----------
+    articles : list[dict]
+        List of article dictionaries
+
+    max_concurrency : int
+        Maximum Claude calls in flight at once (default: from config)
+
+    RETURNS:
+    --------
+    list[dict]
+        Same articles (same order) with "summary" key added to each
+
+    EXAMPLE:
+    --------
+    >>> articles = asyncio.run(summarize_many(articles))
+    """
+    if not articles:
+        return articles
+
+    # One chain for all articles - they all use the same prompt and model
+    chain = create_summary_chain()
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def summarize_one(article: dict) -> dict:
+        async with semaphore:
+            try:
+                return await summarize_article_async(article, chain)
+            except Exception as e:
+                print(f"  Error summarizing: {e}")
+                article["summary"] = f"Error: Could not summarize - {str(e)}"
+                return article
+
+    # gather() runs them all and returns results in the original order
+    return await asyncio.gather(*(summarize_one(a) for a in articles))
+
+
 def display_summary(article: dict) -> None:
     """
     Display a summarized article nicely.
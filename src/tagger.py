@@ -25,6 +25,10 @@
 #
 # =====================================================
 
+import re
+from collections import Counter
+from functools import lru_cache
+
 from langchain_anthropic import ChatAnthropic
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import StrOutputParser
@@ -83,6 +87,7 @@ Extract the information:""")
 ])
 
 
+@lru_cache(maxsize=1)
 def create_llm():
     """Create Claude LLM for tagging."""
     if not ANTHROPIC_API_KEY:
@@ -118,6 +123,16 @@ def create_tagging_chain():
     return chain
 
 
+# Matches one line of Claude's answer, like "PEOPLE: Tim Cook, Elon Musk".
+# Compiled once when the module loads, then reused for every article.
+#   group(1) = the label (any capitalization)
+#   group(2) = everything after the colon
+_TAG_LINE_RE = re.compile(
+    r"^[^\S\n]*(KEYWORDS|PEOPLE|ORGANIZATIONS|LOCATIONS):(.*)$",
+    re.IGNORECASE | re.MULTILINE
+)
+
+
 def parse_tagging_response(response: str) -> dict:
     """
     Parse Claude's response into a structured dictionary.
@@ -154,52 +169,22 @@ def parse_tagging_response(response: str) -> dict:
         "locations": []
     }
 
-    # Split response into lines
-    lines = response.strip().split("\n")
-
-    for line in lines:
-        line = line.strip()
-
-        # Parse KEYWORDS line
-        if line.upper().startswith("KEYWORDS:"):
-            value = line.split(":", 1)[1].strip()
-            if value.lower() != "none":
-                # Split by comma, clean each keyword
-                result["keywords"] = [
-                    kw.strip().lower()
-                    for kw in value.split(",")
-                    if kw.strip()
-                ]
-
-        # Parse PEOPLE line
-        elif line.upper().startswith("PEOPLE:"):
-            value = line.split(":", 1)[1].strip()
-            if value.lower() != "none":
-                result["people"] = [
-                    p.strip()
-                    for p in value.split(",")
-                    if p.strip()
-                ]
-
-        # Parse ORGANIZATIONS line
-        elif line.upper().startswith("ORGANIZATIONS:"):
-            value = line.split(":", 1)[1].strip()
-            if value.lower() != "none":
-                result["organizations"] = [
-                    o.strip()
-                    for o in value.split(",")
-                    if o.strip()
-                ]
-
-        # Parse LOCATIONS line
-        elif line.upper().startswith("LOCATIONS:"):
-            value = line.split(":", 1)[1].strip()
-            if value.lower() != "none":
-                result["locations"] = [
-                    loc.strip()
-                    for loc in value.split(",")
-                    if loc.strip()
-                ]
+    # Find every "LABEL: value" line in one pass
+    for match in _TAG_LINE_RE.finditer(response):
+        field = match.group(1).lower()     # "KEYWORDS" -> "keywords"
+        value = match.group(2).strip()
+
+        if value.lower() == "none":
+            continue
+
+        # Split by comma, clean each item
+        items = [item.strip() for item in value.split(",") if item.strip()]
+
+        # Keywords are stored lowercase; names keep their capitalization
+        if field == "keywords":
+            items = [kw.lower() for kw in items]
+
+        result[field] = items
 
     return result
 
@@ -339,12 +324,21 @@ def display_tags(article: dict) -> None:
         print("   (No tags extracted)")
 
 
-def get_all_keywords(articles: list[dict]) -> dict[str, int]:
+def get_all_keywords(articles: list[dict], top_k: int = None) -> dict[str, int]:
     """
     Get all keywords across articles with frequency counts.
 
     This is useful for seeing what topics are trending.
 
+    PARAMETERS:
+    -----------
+    articles : list[dict]
+        Tagged articles
+
+    top_k : int, optional
+        Only return the top_k most frequent keywords. Picking the
+        top few with a heap is cheaper than sorting every keyword.
+
     RETURNS:
     --------
     dict[str, int]
@@ -357,25 +351,29 @@ def get_all_keywords(articles: list[dict]) -> dict[str, int]:
     {"technology": 5, "ai": 3, "business": 2}
     """
 
-    keyword_counts = {}
+    # Counter.update() does the counting loop in C
+    keyword_counts = Counter()
 
     for article in articles:
-        for keyword in article.get("keywords", []):
-            keyword = keyword.lower()
-            keyword_counts[keyword] = keyword_counts.get(keyword, 0) + 1
-
-    # Sort by frequency (highest first)
-    sorted_keywords = dict(
-        sorted(keyword_counts.items(), key=lambda x: x[1], reverse=True)
-    )
+        keyword_counts.update(keyword.lower() for keyword in article.get("keywords", []))
 
-    return sorted_keywords
+    # Sort by frequency (highest first; ties keep first-seen order)
+    # most_common(n) uses a heap when n is given
+    return dict(keyword_counts.most_common(top_k))
 
 
-def get_all_entities(articles: list[dict]) -> dict:
+def get_all_entities(articles: list[dict], top_k: int = None) -> dict:
     """
     Get all entities across articles with frequency counts.
 
+    PARAMETERS:
+    -----------
+    articles : list[dict]
+        Tagged articles
+
+    top_k : int, optional
+        Only keep the top_k most frequent entities of each type
+
     RETURNS:
     --------
     dict with keys: people, organizations, locations
@@ -383,28 +381,18 @@ def get_all_entities(articles: list[dict]) -> dict:
     """
 
     entities = {
-        "people": {},
-        "organizations": {},
-        "locations": {}
+        "people": Counter(),
+        "organizations": Counter(),
+        "locations": Counter()
     }
 
     for article in articles:
-        for person in article.get("people", []):
-            entities["people"][person] = entities["people"].get(person, 0) + 1
-
-        for org in article.get("organizations", []):
-            entities["organizations"][org] = entities["organizations"].get(org, 0) + 1
-
-        for loc in article.get("locations", []):
-            entities["locations"][loc] = entities["locations"].get(loc, 0) + 1
-
-    # Sort each by frequency
-    for key in entities:
-        entities[key] = dict(
-            sorted(entities[key].items(), key=lambda x: x[1], reverse=True)
-        )
+        entities["people"].update(article.get("people", []))
+        entities["organizations"].update(article.get("organizations", []))
+        entities["locations"].update(article.get("locations", []))
 
-    return entities
+    # Sort each by frequency (highest first; ties keep first-seen order)
+    return {key: dict(counter.most_common(top_k)) for key, counter in entities.items()}
 
 
 # =====================================================
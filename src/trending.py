@@ -36,6 +36,8 @@
 #
 # =====================================================
 
+from functools import lru_cache
+
 from langchain_anthropic import ChatAnthropic
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import StrOutputParser
@@ -239,6 +241,7 @@ Identify the trends:""")
 ])
 
 
+@lru_cache(maxsize=1)
 def create_trend_llm():
     """
     Create Claude LLM for trend analysis.